@@ -7,13 +7,44 @@ without the client code needing to know about specific implementations.
 """
 
 from pathlib import Path
-from typing import Dict, Type, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Optional
 
 from .interface import IExtractor
 from .text import TextExtractor
 from .pdf import PDFExtractor
 from .ocr import OCRExtractor
 
+# Built-in extractors by lowercase file extension, shared read-only by all
+# factories; each factory copies it so registrations stay per instance
+_DEFAULT_EXTRACTORS: Mapping[str, Type[IExtractor]] = MappingProxyType({
+    # Text files
+    '.txt': TextExtractor,
+    '.text': TextExtractor,
+    '.md': TextExtractor,
+    '.markdown': TextExtractor,
+    '.rst': TextExtractor,
+    '.log': TextExtractor,
+    '.csv': TextExtractor,
+    '.json': TextExtractor,
+    '.xml': TextExtractor,
+    '.html': TextExtractor,
+    '.htm': TextExtractor,
+
+    # PDF files
+    '.pdf': PDFExtractor,
+
+    # Image files (OCR)
+    '.jpg': OCRExtractor,
+    '.jpeg': OCRExtractor,
+    '.png': OCRExtractor,
+    '.bmp': OCRExtractor,
+    '.tiff': OCRExtractor,
+    '.tif': OCRExtractor,
+    '.gif': OCRExtractor,
+    '.webp': OCRExtractor,
+})
+
 
 class ExtractorFactory:
     """Factory for creating file extractors based on file type.
@@ -37,33 +68,7 @@ class ExtractorFactory:
     
     def __init__(self):
         """Initialize the factory with default extractor mappings."""
-        self._extractors: Dict[str, Type[IExtractor]] = {
-            # Text files
-            '.txt': TextExtractor,
-            '.text': TextExtractor,
-            '.md': TextExtractor,
-            '.markdown': TextExtractor,
-            '.rst': TextExtractor,
-            '.log': TextExtractor,
-            '.csv': TextExtractor,
-            '.json': TextExtractor,
-            '.xml': TextExtractor,
-            '.html': TextExtractor,
-            '.htm': TextExtractor,
-            
-            # PDF files
-            '.pdf': PDFExtractor,
-            
-            # Image files (OCR)
-            '.jpg': OCRExtractor,
-            '.jpeg': OCRExtractor,
-            '.png': OCRExtractor,
-            '.bmp': OCRExtractor,
-            '.tiff': OCRExtractor,
-            '.tif': OCRExtractor,
-            '.gif': OCRExtractor,
-            '.webp': OCRExtractor,
-        }
+        self._extractors: Dict[str, Type[IExtractor]] = dict(_DEFAULT_EXTRACTORS)
         
         # Default fallback extractor
         self._default_extractor = TextExtractor
@@ -4,7 +4,7 @@ Event dispatcher module.
 This module contains the event dispatcher.
 """
 
-from typing import Dict, List, Type, Any, Callable, Awaitable
+from typing import Dict, Iterable, List, Tuple, Type, Any, Callable, Awaitable
 from .base import DomainEvent
 
 EventHandler = Callable[[DomainEvent], Awaitable[None]]
@@ -32,6 +32,18 @@ class EventDispatcher:
         if handler not in self._handlers[event_type]:
             self._handlers[event_type].append(handler)
 
+    def register_many(self, registrations: Iterable[Tuple[Type[DomainEvent], EventHandler]]) -> None:
+        """Register several event handlers at once.
+
+        Args:
+            registrations: Pairs of event type and event handler function
+        """
+        handlers_by_type = self._handlers
+        for event_type, handler in registrations:
+            handlers = handlers_by_type.setdefault(event_type, [])
+            if handler not in handlers:
+                handlers.append(handler)
+
     def unregister(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
         """Unregister an event handler.
 
@@ -152,7 +152,7 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            self.client.users.me()
+            await asyncio.to_thread(self.client.users.me)
             self._metrics.record_request(True)
             return True
         except Exception as e:
@@ -178,7 +178,7 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            self.client.databases.retrieve(database_id)
+            await asyncio.to_thread(self.client.databases.retrieve, database_id)
             self._metrics.record_request(True)
             return True
         except Exception as e:
@@ -199,7 +199,9 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            response = self.client.databases.retrieve(database_id = database_id)
+            response = await asyncio.to_thread(
+                self.client.databases.retrieve, database_id = database_id
+)
             self._metrics.record_request(True)
             return response
         except Exception as e:
@@ -228,7 +230,7 @@ class NotionClient:
             query_params = {"database_id": database_id}
             if filter_dict:
                 query_params["filter"] = filter_dict
-            response = self.client.databases.query(**query_params)
+            response = await asyncio.to_thread(self.client.databases.query, **query_params)
             self._metrics.record_request(True)
             return response
         except Exception as e:
@@ -254,7 +256,8 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            response = self.client.pages.create(
+            response = await asyncio.to_thread(
+                self.client.pages.create, 
                 parent={"database_id": database_id}, 
                 properties = properties
 )
@@ -283,7 +286,8 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            response = self.client.pages.update(
+            response = await asyncio.to_thread(
+                self.client.pages.update, 
                 page_id = page_id, 
                 properties = properties
 )
@@ -307,7 +311,7 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            response = self.client.pages.retrieve(page_id = page_id)
+            response = await asyncio.to_thread(self.client.pages.retrieve, page_id = page_id)
             self._metrics.record_request(True)
             return response
         except Exception as e:
@@ -333,7 +337,8 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            response = self.client.blocks.children.append(
+            response = await asyncio.to_thread(
+                self.client.blocks.children.append, 
                 block_id = page_id, 
                 children = blocks
 )
@@ -354,7 +359,8 @@ class NotionClient:
         """
         try:
             await self._rate_limiter.acquire()
-            self.client.pages.update(
+            await asyncio.to_thread(
+                self.client.pages.update, 
                 page_id = page_id, 
                 archived = True
 )
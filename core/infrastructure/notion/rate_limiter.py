@@ -4,7 +4,7 @@ Rate limiting implementation for Notion API requests.
 
 from core.utils.logger import get_logger
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 import asyncio
 import time
@@ -22,14 +22,23 @@ class RateLimiter:
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
         self.last_request_time: Optional[float] = None
-        self._lock = asyncio.Lock()
+        # A lock is bound to the event loop that first waits on it, so one is
+        # created for each loop the limiter is used from
+        self._lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock[0] is not loop:
+            self._lock = (loop, asyncio.Lock())
+        return self._lock[1]
 
     async def acquire(self) -> None:
         """Acquire permission to make a request.
 
         This method will wait if necessary to respect the rate limit.
         """
-        async with self._lock:
+        async with self._get_lock():
             now = time.time()
 
             if self.last_request_time is not None:
@@ -3,6 +3,8 @@ Notion synchronization module.
 
 Handles synchronization of recipes with Notion.
 """
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 from core.domain.recipe.generators.notion_blocks import recipe_to_notion_blocks
 from core.domain.recipe.models.recipe import Recipe
 from core.infrastructure.notion.client import NotionClient
@@ -10,7 +12,7 @@ from core.infrastructure.notion.errors import NotionAPIError
 from core.infrastructure.notion.models import NotionPantryItem, NotionIngredient, NotionRecipe
 from core.utils.logger import get_logger
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, cast
 logger = get_logger('notion.sync')
 
 class NotionSync:
@@ -150,22 +152,42 @@ class NotionSync:
         """
         Synchronize multiple recipes.
 
+        Runs sync_all_recipes_async, so it must not be called from a running
+        event loop; await sync_all_recipes_async there instead.
+
         Args:
             recipes: List of recipes to synchronize
 
         Returns:
             List[Dict[str, Any]]: List of synchronization results
         """
-        results = []
-        for recipe in recipes:
-            try:
-                page_id = self.sync_recipe(recipe)
-                results.append({'success': True, 'page_id': page_id, 
-                    'error': None})
-            except Exception as e:
-                results.append({'success': False, 'page_id': None, 'error':
-                    str(e)})
-        return results
+        return asyncio.run(self.sync_all_recipes_async(recipes))
+
+    async def sync_all_recipes_async(self, recipes: List[Recipe],
+        max_concurrency: int = 3) ->List[Dict[str, Any]]:
+        """
+        Synchronize multiple recipes concurrently.
+
+        Args:
+            recipes: List of recipes to synchronize
+            max_concurrency: Maximum number of recipes synced at once, kept
+                low to stay within Notion's rate limit
+
+        Returns:
+            List[Dict[str, Any]]: List of synchronization results, in the
+                order of the recipes
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def sync(recipe: Recipe) ->Dict[str, Any]:
+            async with semaphore:
+                try:
+                    page_id = await self.sync_recipe(recipe)
+                    return {'success': True, 'page_id': page_id, 'error': None}
+                except Exception as e:
+                    return {'success': False, 'page_id': None, 'error': str(e)}
+        return list(await asyncio.gather(*(sync(recipe) for recipe in
+            recipes)))
 
     def delete_recipe(self: Any, page_id: str) ->None:
         """
@@ -183,6 +205,40 @@ class NotionSync:
             logger.error(f'Failed to delete recipe {page_id}: {e}')
             raise NotionAPIError(f'Failed to delete recipe {page_id}: {e}')
 
+    def delete_recipes(self: Any, page_ids: Iterable[str], max_workers: int = 8
+        ) ->None:
+        """
+        Delete several recipes from Notion.
+
+        The pages are archived concurrently, and a failed deletion does not
+        stop the others.
+
+        Args:
+            page_ids: IDs of the pages to delete
+            max_workers: Maximum number of concurrent requests
+
+        Raises:
+            NotionAPIError: If any deletion fails, after all were attempted
+        """
+        page_ids = list(page_ids)
+        if not page_ids:
+            return
+
+        def delete(page_id: str) -> Optional[str]:
+            try:
+                self.delete_recipe(page_id)
+                return None
+            except NotionAPIError:
+                return page_id
+
+        with ThreadPoolExecutor(max_workers = min(max_workers, len(page_ids))
+            ) as executor:
+            failed = [page_id for page_id in executor.map(delete, page_ids) if
+                page_id is not None]
+        if failed:
+            raise NotionAPIError(
+                f"Failed to delete recipes: {', '.join(failed)}")
+
     def update_ingredient_with_recipe(self: Any, ingredient_id: str, 
         recipe_id: str) ->None:
         """
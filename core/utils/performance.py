@@ -9,13 +9,25 @@ from core.config import config
 from core.utils.logger import get_logger, log_performance
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import json
 import os
 
-from dataclasses import dataclass, field
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+
+from dataclasses import dataclass
+import math
 import statistics
 import time
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 @dataclass
@@ -34,10 +46,52 @@ class ProcessingMetrics:
         """Get the duration in seconds."""
         return self.end_time - self.start_time
 
+# Running totals persisted as deltas in the metrics file
+COUNTER_KEYS = (
+    'processed', 
+    'processing_time', 
+    'successes', 
+    'cache_hits', 
+    'llm_extractions', 
+    'rule_based_extractions', 
+    'batches', 
+    'batch_time'
+)
+
+def _summarize_counters(counters: Dict[str, float]) -> Dict[str, Any]:
+    """Derive the metrics summary from running totals.
+
+    Args:
+        counters: Totals keyed by ``COUNTER_KEYS``
+
+    Returns:
+        Dictionary containing metrics summary
+    """
+    processed = counters['processed']
+    batches = counters['batches']
+    return {
+        'total_processed': processed, 
+        'total_batches': batches, 
+        'average_processing_time': counters['processing_time'] / processed if processed else 0.0, 
+        'average_batch_time': counters['batch_time'] / batches if batches else 0.0, 
+        'total_cache_hits': counters['cache_hits'], 
+        'total_llm_extractions': counters['llm_extractions'], 
+        'total_rule_based_extractions': counters['rule_based_extractions'], 
+        'success_rate': counters['successes'] / processed if processed else 0.0
+    }
+
+# Compact codes for the processing method, stored per recipe in BatchMetrics
+METHOD_CODES: Dict[str, int] = {'llm': 0, 'rule - based': 1}
+
 @dataclass
 
 class BatchMetrics:
-    """Metrics for a batch processing operation."""
+    """Metrics for a batch processing operation.
+
+    Per - recipe measurements are kept as a structure of arrays (durations,
+    cache hit flags and method codes) sized to ``total_recipes`` so
+    aggregations run over contiguous buffers instead of Python objects.
+    """
     start_time: float
     end_time: float
     total_recipes: int
@@ -46,7 +100,43 @@ class BatchMetrics:
     cache_hits: int
     llm_extractions: int
     rule_based_extractions: int
-    individual_metrics: List[ProcessingMetrics] = field(default_factory = list)
+    # Allocated on the first recorded recipe so empty batches cost nothing
+    durations: Optional[array] = None
+    cache_hit_flags: Optional[bytearray] = None
+    method_codes: Optional[bytearray] = None
+    recorded: int = 0
+
+    def _allocate(self) -> Tuple[array, bytearray, bytearray]:
+        """Preallocate the per - recipe buffers for the expected batch size."""
+        size = max(self.total_recipes, 1)
+        self.durations = array('d', bytes(8 * size))
+        self.cache_hit_flags = bytearray(size)
+        self.method_codes = bytearray(size)
+        return self.durations, self.cache_hit_flags, self.method_codes
+
+    def record(self, metrics: ProcessingMetrics) -> None:
+        """Store the measurements of a finished processing operation.
+
+        Args:
+            metrics: Metrics of the finished operation
+        """
+        durations, cache_hit_flags, method_codes = (
+            self.durations, self.cache_hit_flags, self.method_codes
+)
+        if durations is None or cache_hit_flags is None or method_codes is None:
+            durations, cache_hit_flags, method_codes = self._allocate()
+        i = self.recorded
+        code = METHOD_CODES.get(metrics.method, METHOD_CODES['rule - based'])
+        if i < len(durations):
+            durations[i] = metrics.duration
+            cache_hit_flags[i] = metrics.cache_hit
+            method_codes[i] = code
+        else:
+            # More recipes than announced in start_batch: grow the buffers
+            durations.append(metrics.duration)
+            cache_hit_flags.append(metrics.cache_hit)
+            method_codes.append(code)
+        self.recorded = i + 1
 
     @property
     def duration(self) -> float:
@@ -56,9 +146,9 @@ class BatchMetrics:
     @property
     def average_duration(self) -> float:
         """Get the average processing time per recipe."""
-        if not self.individual_metrics:
+        if not self.recorded or self.durations is None:
             return 0.0
-        return statistics.mean(m.duration for m in self.individual_metrics)
+        return statistics.fmean(self.durations[:self.recorded])
 
     @property
     def cache_hit_rate(self) -> float:
@@ -82,8 +172,19 @@ class PerformanceMonitor:
         self._metrics: Dict[str, List[ProcessingMetrics]] = {}
         self._batch_metrics: Dict[str, List[BatchMetrics]] = {}
         self._current_batch: Optional[BatchMetrics] = None
-        self._metrics_file = config.PATHS.VAR_DIR / "cache" / "performance_metrics.json"
+        # Bumped on every mutation; keys the cached summary
+        self._version = 0
+        self._summary_cache: Tuple[int, Dict[str, float], Dict[str, Any]] = (-1, {}, {})
+        # Append - only log of counter deltas, replayed by load_all()
+        self._metrics_file = config.PATHS.VAR_DIR / "cache" / "performance_metrics.jsonl"
+        self._saved_counters: Dict[str, float] = dict.fromkeys(COUNTER_KEYS, 0)
         self._metrics_file.parent.mkdir(parents = True, exist_ok = True)
+        # Saves are debounced and written off the caller's thread
+        self._save_interval = 5.0
+        self._last_save = float('-inf')
+        self._dirty = False
+        self._save_executor = ThreadPoolExecutor(max_workers = 1)
+        atexit.register(self.flush)
 
     def start_processing(self, recipe_id: str, method: str) -> ProcessingMetrics:
         """Start tracking a processing operation.
@@ -103,6 +204,7 @@ class PerformanceMonitor:
             success = False
 )
         self._metrics.setdefault(recipe_id, []).append(metrics)
+        self._version += 1
         return metrics
 
     def end_processing(
@@ -123,20 +225,22 @@ class PerformanceMonitor:
             metrics.end_time = time.time()
             metrics.success = success
             metrics.error = error
+            self._version += 1
 
             # Update batch metrics if active
             if self._current_batch:
-                self._current_batch.individual_metrics.append(metrics)
+                batch = self._current_batch
+                batch.record(metrics)
                 if success:
-                    self._current_batch.successful_recipes += 1
+                    batch.successful_recipes += 1
                 else:
-                    self._current_batch.failed_recipes += 1
+                    batch.failed_recipes += 1
                 if metrics.cache_hit:
-                    self._current_batch.cache_hits += 1
+                    batch.cache_hits += 1
                 if metrics.method == 'llm':
-                    self._current_batch.llm_extractions += 1
+                    batch.llm_extractions += 1
                 else:
-                    self._current_batch.rule_based_extractions += 1
+                    batch.rule_based_extractions += 1
 
     def start_batch(self, total_recipes: int) -> BatchMetrics:
         """Start tracking a batch processing operation.
@@ -168,9 +272,12 @@ class PerformanceMonitor:
         if self._current_batch:
             self._current_batch.end_time = time.time()
             self._batch_metrics.setdefault(batch_id, []).append(self._current_batch)
+            self._version += 1
             self._log_batch_metrics(self._current_batch)
-            self._save_metrics()
             self._current_batch = None
+            self._dirty = True
+            if time.monotonic() - self._last_save >= self._save_interval:
+                self._schedule_save()
 
     def _log_batch_metrics(self, metrics: BatchMetrics) -> None:
         """Log batch processing metrics.
@@ -192,36 +299,114 @@ class PerformanceMonitor:
             }
 )
 
-    def _save_metrics(self) -> None:
-        """Save metrics to disk."""
+    def _snapshot(self) -> Dict[str, Any]:
+        """Build the record appended to the metrics file.
+
+        Only the change of each counter since the previous snapshot is
+        recorded, so the write cost does not grow with the history.
+        """
+        self._dirty = False
+        self._last_save = time.monotonic()
+        counters = self._get_counters()
+        delta = {
+            key: counters[key] - self._saved_counters[key]
+            for key in COUNTER_KEYS
+            if counters[key] != self._saved_counters[key]
+        }
+        self._saved_counters = dict(counters)
+        return {
+            "timestamp": datetime.now().isoformat(), 
+            "delta": delta
+        }
+
+    def _schedule_save(self) -> None:
+        """Write a snapshot of the metrics to disk in the background."""
+        metrics_data = self._snapshot()
         try:
-            metrics_data = {
-                "timestamp": datetime.now().isoformat(), 
-                "metrics": self.get_metrics_summary()
-            }
-            with open(self._metrics_file, "w") as f:
-                json.dump(metrics_data, f, indent = 2)
+            self._save_executor.submit(self._save_metrics, metrics_data)
+        except RuntimeError:
+            # Executor already shut down (interpreter exiting)
+            self._save_metrics(metrics_data)
+
+    def flush(self) -> None:
+        """Write any pending metrics to disk synchronously."""
+        if self._dirty:
+            self._save_metrics(self._snapshot())
+
+    def _save_metrics(self, metrics_data: Dict[str, Any]) -> None:
+        """Append a snapshot to the metrics file.
+
+        Args:
+            metrics_data: Snapshot built by ``_snapshot``
+        """
+        if not metrics_data["delta"]:
+            return
+        try:
+            if HAS_ORJSON:
+                with open(self._metrics_file, "ab") as f:
+                    f.write(orjson.dumps(metrics_data) + b"\n")
+            else:
+                with open(self._metrics_file, "a") as f:
+                    f.write(json.dumps(metrics_data) + "\n")
         except Exception as e:
             logger.error(f"Failed to save metrics: {e}")
 
+    def load_all(self) -> Dict[str, Any]:
+        """Rebuild the persisted metrics summary by replaying the metrics file.
+
+        Returns:
+            Dictionary containing metrics summary
+        """
+        totals: Dict[str, float] = dict.fromkeys(COUNTER_KEYS, 0)
+        if self._metrics_file.exists():
+            with open(self._metrics_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = orjson.loads(line) if HAS_ORJSON else json.loads(line)
+                    for key, value in record["delta"].items():
+                        totals[key] = totals.get(key, 0) + value
+        return _summarize_counters(totals)
+
+    def clear(self) -> None:
+        """Discard all recorded metrics."""
+        self._metrics.clear()
+        self._batch_metrics.clear()
+        self._version += 1
+
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get a summary of all metrics.
 
+        The summary is cached until new metrics are recorded.
+
         Returns:
             Dictionary containing metrics summary
         """
+        self._get_counters()
+        return self._summary_cache[2]
+
+    def _get_counters(self) -> Dict[str, float]:
+        """Get the running totals, recomputing them only after mutations."""
+        version, counters, _ = self._summary_cache
+        if version != self._version:
+            counters = self._build_counters()
+            self._summary_cache = (self._version, counters, _summarize_counters(counters))
+        return counters
+
+    def _build_counters(self) -> Dict[str, float]:
+        """Compute the running totals from the recorded metrics."""
         all_metrics = [m for metrics in self._metrics.values() for m in metrics]
         all_batch_metrics = [m for metrics in self._batch_metrics.values() for m in metrics]
 
         return {
-            'total_processed': len(all_metrics), 
-            'total_batches': len(all_batch_metrics), 
-            'average_processing_time': statistics.mean(m.duration for m in all_metrics) if all_metrics else 0.0, 
-            'average_batch_time': statistics.mean(m.duration for m in all_batch_metrics) if all_batch_metrics else 0.0, 
-            'total_cache_hits': sum(1 for m in all_metrics if m.cache_hit), 
-            'total_llm_extractions': sum(1 for m in all_metrics if m.method == 'llm'), 
-            'total_rule_based_extractions': sum(1 for m in all_metrics if m.method == 'rule - based'), 
-            'success_rate': sum(1 for m in all_metrics if m.success) / len(all_metrics) if all_metrics else 0.0
+            'processed': len(all_metrics), 
+            'processing_time': math.fsum(m.duration for m in all_metrics), 
+            'successes': sum(1 for m in all_metrics if m.success), 
+            'cache_hits': sum(1 for m in all_metrics if m.cache_hit), 
+            'llm_extractions': sum(1 for m in all_metrics if m.method == 'llm'), 
+            'rule_based_extractions': sum(1 for m in all_metrics if m.method == 'rule - based'), 
+            'batches': len(all_batch_metrics), 
+            'batch_time': math.fsum(m.duration for m in all_batch_metrics)
         }
 
 # Global performance monitor instance
@@ -6,35 +6,93 @@ including Notion API integration details and property mappings.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import json
 
+from ast_index import ASTIndex
 import ast
 import logging
 logger = logging.getLogger(__name__)
 
+# Keys that identify a Notion property mapping dictionary
+_NOTION_KEYS = frozenset({"Nombre", "Porciones", "Calorías"})
+
+class _PropertyMappingCollector(ast.NodeVisitor):
+    """Collects dictionaries that look like Notion property mappings."""
+
+    def __init__(self, outer: "APIDocGenerator"):
+        self.outer = outer
+        self.mapping: Optional[Dict] = None
+
+    def visit_Dict(self, node: ast.Dict):
+        if any(isinstance(k, ast.Constant) and k.value in _NOTION_KEYS for k in node.keys):
+            self.mapping = self.outer._extract_dict(node)
+            return
+        self.generic_visit(node)
+
+class _EndpointCollector(ast.NodeVisitor):
+    """Collects functions decorated with ``@app.route(...)``."""
+
+    def __init__(self):
+        self.endpoints: List[Dict[str, Any]] = []
+
+    def _visit_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]):
+        # Endpoints are not nested inside other functions, so the body is skipped
+        if any(self._is_route(decorator) for decorator in node.decorator_list):
+            self.endpoints.append({
+                'name': node.name, 
+                'docstring': ast.get_docstring(node)
+            })
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    @staticmethod
+    def _is_route(decorator: ast.expr) -> bool:
+        """Check whether a decorator is an ``app.route(...)`` call."""
+        return (isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Attribute)
+            and decorator.func.attr == 'route'
+            and isinstance(decorator.func.value, ast.Name)
+            and decorator.func.value.id == 'app')
+
 class APIDocGenerator:
     """Generates API documentation from code."""
 
-    def __init__(self, code_dir: Path):
+    def __init__(self, code_dir: Path, index: Optional[ASTIndex] = None):
         self.code_dir = code_dir
+        self.index = index or ASTIndex(code_dir)
         self.notion_properties = {}
         self.api_endpoints = []
 
+    def visit(self, py_file: Path, tree: ast.Module):
+        """Collect property mappings and API endpoints from a parsed file."""
+        result = self._analyze(py_file, tree)
+        self._add_notion_properties(py_file, result)
+        self._add_api_endpoints(py_file, result)
+
+    def _analyze(self, py_file: Path, tree: ast.Module) -> Dict[str, Any]:
+        """Find property mappings and API endpoints in a parsed file."""
+        properties = _PropertyMappingCollector(self)
+        properties.visit(tree)
+        endpoints = _EndpointCollector()
+        endpoints.visit(tree)
+        return {'properties': properties.mapping, 'endpoints': endpoints.endpoints}
+
+    def _add_notion_properties(self, py_file: Path, result: Dict[str, Any]):
+        """Record the property mapping found in a file, if any."""
+        if result['properties'] is not None:
+            self.notion_properties[py_file.name] = result['properties']
+
+    def _add_api_endpoints(self, py_file: Path, result: Dict[str, Any]):
+        """Record the API endpoints found in a file."""
+        for endpoint in result['endpoints']:
+            self.api_endpoints.append({'file': py_file.name, **endpoint})
+
     def extract_notion_properties(self):
         """Extract Notion property mappings from code."""
-        for py_file in self.code_dir.rglob("*.py"):
-            with open(py_file, 'r', encoding='utf - 8') as f:
-                tree = ast.parse(f.read())
-
-            # Find property mappings
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Dict):
-                    # Look for property mapping dictionaries
-                    if any(isinstance(k, ast.Constant) and isinstance(k.value, str)
-                        and k.value in ["Nombre", "Porciones", "Calorías"]
-                        for k in node.keys):
-                        self.notion_properties[py_file.name] = self._extract_dict(node)
+        for py_file, result in self.index.analyze("api_docs", self._analyze):
+            self._add_notion_properties(py_file, result)
 
     def _extract_dict(self, node: ast.Dict) -> Dict:
         """Extract dictionary from AST node."""
@@ -56,60 +114,49 @@ class APIDocGenerator:
 
     def extract_api_endpoints(self):
         """Extract API endpoints from code."""
-        for py_file in self.code_dir.rglob("*.py"):
-            with open(py_file, 'r', encoding='utf - 8') as f:
-                tree = ast.parse(f.read())
-
-            # Find API endpoint definitions
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Look for functions that might be API endpoints
-                    if any(decorator.id == 'app.route' for decorator in node.decorator_list
-                        if isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)):
-                        self.api_endpoints.append({
-                            'file': py_file.name, 
-                            'name': node.name, 
-                            'docstring': ast.get_docstring(node)
-                        })
+        for py_file, result in self.index.analyze("api_docs", self._analyze):
+            self._add_api_endpoints(py_file, result)
 
     def generate_api_docs(self) -> str:
         """Generate API documentation."""
-        self.extract_notion_properties()
-        self.extract_api_endpoints()
+        for py_file, result in self.index.analyze("api_docs", self._analyze):
+            self._add_notion_properties(py_file, result)
+            self._add_api_endpoints(py_file, result)
 
-        docs = []
-        docs.append("# API Documentation\n")
+        docs: List[str] = []
+        append = docs.append
+        append("# API Documentation\n")
 
         # Add Notion API section
-        docs.append("## Notion API Integration\n")
+        append("## Notion API Integration\n")
 
-        docs.append("### Property Mappings\n")
+        append("### Property Mappings\n")
         for file_name, props in self.notion_properties.items():
-            docs.append(f"#### {file_name}\n")
-            docs.append("```json")
-            docs.append(json.dumps(props, indent = 2))
-            docs.append("```\n")
+            append(f"#### {file_name}\n")
+            append("```json")
+            append(json.dumps(props, indent = 2))
+            append("```\n")
 
         # Add API endpoints section
-        docs.append("### API Endpoints\n")
+        append("### API Endpoints\n")
         for endpoint in self.api_endpoints:
-            docs.append(f"#### {endpoint['name']}\n")
+            append(f"#### {endpoint['name']}\n")
             if endpoint['docstring']:
-                docs.append(f"{endpoint['docstring']}\n")
-            docs.append(f"File: {endpoint['file']}\n")
+                append(f"{endpoint['docstring']}\n")
+            append(f"File: {endpoint['file']}\n")
 
         # Add example usage
-        docs.append("### Example Usage\n")
-        docs.append("```python")
-        docs.append("from notion_client import Client")
-        docs.append("")
-        docs.append("notion = Client(auth = os.environ['NOTION_TOKEN'])")
-        docs.append("")
-        docs.append("# Create a page")
-        docs.append("notion.pages.create(...)")
-        docs.append("")
-        docs.append("# Update a page")
-        docs.append("notion.pages.update(...)")
-        docs.append("```\n")
+        append("### Example Usage\n")
+        append("```python")
+        append("from notion_client import Client")
+        append("")
+        append("notion = Client(auth = os.environ['NOTION_TOKEN'])")
+        append("")
+        append("# Create a page")
+        append("notion.pages.create(...)")
+        append("")
+        append("# Update a page")
+        append("notion.pages.update(...)")
+        append("```\n")
 
         return '\n'.join(docs)
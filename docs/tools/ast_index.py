@@ -0,0 +1,157 @@
+"""
+AST Index
+
+This module parses every Python file of the code directory once so the
+documentation generators can share the resulting syntax trees instead of
+reading and parsing the same files independently. Per-file analysis results
+can also be cached on disk so unchanged files are not parsed again.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import ast
+import atexit
+import logging
+import os
+import pickle
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of cached analysis results changes
+_CACHE_VERSION = 1
+
+class ASTIndex:
+    """Parsed syntax trees for all Python files under a directory."""
+
+    def __init__(
+        self, 
+        code_dir: Path, 
+        max_workers: Optional[int] = None, 
+        cache_path: Optional[Path] = None
+):
+        self.code_dir = code_dir
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.cache_path = cache_path
+        self._files: Optional[List[Path]] = None
+        self._trees: Optional[List[Tuple[Path, ast.Module]]] = None
+        # Trees parsed so far in this run, None for files that failed to parse
+        self._parsed: Dict[Path, Optional[ast.Module]] = {}
+        # (analysis name, file path) -> (mtime_ns, size, result)
+        self._cache: Dict[Tuple[str, str], Tuple[int, int, Any]] = self._load_cache()
+        self._cache_dirty = False
+        if cache_path:
+            atexit.register(self.save_cache)
+
+    @property
+    def files(self) -> List[Path]:
+        """All Python files under the code directory, found with a single walk."""
+        if self._files is None:
+            self._files = [
+                Path(root) / name
+                for root, _, names in os.walk(self.code_dir)
+                for name in names
+                if name.endswith('.py')
+            ]
+        return self._files
+
+    def build(self) -> "ASTIndex":
+        """Read and parse every Python file under the code directory.
+
+        Files are read concurrently on a thread pool; parsing stays on the
+        calling thread because syntax trees are expensive to pickle across
+        processes.
+        """
+        py_files = self.files
+        trees = []
+        with ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+            for py_file, source in zip(py_files, executor.map(Path.read_bytes, py_files)):
+                try:
+                    tree = ast.parse(source, filename = str(py_file))
+                except (SyntaxError, ValueError) as e:
+                    logger.warning(f"Skipping {py_file}: {e}")
+                    tree = None
+                self._parsed[py_file] = tree
+                if tree is not None:
+                    trees.append((py_file, tree))
+        self._trees = trees
+        return self
+
+    def __iter__(self) -> Iterator[Tuple[Path, ast.Module]]:
+        if self._trees is None:
+            self.build()
+        assert self._trees is not None
+        return iter(self._trees)
+
+    def analyze(
+        self, 
+        name: str, 
+        analyzer: Callable[[Path, ast.Module], Any]
+) -> Iterator[Tuple[Path, Any]]:
+        """Run an analyzer over every file and yield its results.
+
+        With a cache path configured, results of files whose modification
+        time and size are unchanged are taken from the cache and those files
+        are not parsed at all. Files that are parsed are kept for the rest of
+        the run, so each file is parsed at most once whatever the number of
+        analyzers. Results must be picklable.
+
+        Args:
+            name: Name under which the analyzer's results are cached
+            analyzer: Function computing the result for a parsed file
+        """
+        if not self.cache_path:
+            for py_file, tree in self:
+                yield py_file, analyzer(py_file, tree)
+            return
+
+        for py_file in self.files:
+            stat = py_file.stat()
+            key = (name, str(py_file))
+            cached = self._cache.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                yield py_file, cached[2]
+                continue
+
+            if py_file in self._parsed:
+                parsed = self._parsed[py_file]
+            else:
+                parsed = self._parsed[py_file] = self._parse(py_file)
+            if parsed is None:
+                continue
+            result = analyzer(py_file, parsed)
+            self._cache[key] = (stat.st_mtime_ns, stat.st_size, result)
+            self._cache_dirty = True
+            yield py_file, result
+
+    def _parse(self, py_file: Path) -> Optional[ast.Module]:
+        """Parse a single file, returning None when it is not valid Python."""
+        try:
+            return ast.parse(py_file.read_bytes(), filename = str(py_file))
+        except (SyntaxError, ValueError) as e:
+            logger.warning(f"Skipping {py_file}: {e}")
+            return None
+
+    def _load_cache(self) -> Dict[Tuple[str, str], Tuple[int, int, Any]]:
+        """Load cached analysis results from disk."""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'rb') as f:
+                version, entries = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable AST cache {self.cache_path}: {e}")
+            return {}
+        return entries if version == _CACHE_VERSION else {}
+
+    def save_cache(self):
+        """Write cached analysis results to disk, dropping deleted files."""
+        if not self.cache_path or not self._cache_dirty:
+            return
+        entries = {key: value for key, value in self._cache.items() if os.path.exists(key[1])}
+        try:
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump((_CACHE_VERSION, entries), f, protocol = pickle.HIGHEST_PROTOCOL)
+            self._cache_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write AST cache {self.cache_path}: {e}")
@@ -6,48 +6,84 @@ including class hierarchies, data flows, and system architecture.
 """
 
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple, Union
 
+from ast_index import ASTIndex
 import ast
 import graphviz
 import logging
 logger = logging.getLogger(__name__)
 
-class DiagramGenerator:
-    """Generates diagrams from code."""
+# Class name, member labels and (source, target, type) relationships
+ClassInfo = Tuple[str, List[str], List[tuple]]
 
-    def __init__(self, code_dir: Path):
-        self.code_dir = code_dir
-        self.classes: Dict[str, Set[str]] = {}
-        self.relationships: List[tuple] = []
+class _ClassCollector(ast.NodeVisitor):
+    """Collects the class definitions of a module."""
 
-    def analyze_code(self):
-        """Analyze code to extract class relationships."""
-        for py_file in self.code_dir.rglob("*.py"):
-            with open(py_file, 'r', encoding='utf - 8') as f:
-                tree = ast.parse(f.read())
+    def __init__(self):
+        self.classes: List[ClassInfo] = []
 
-            # Find class definitions
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    self._process_class(node)
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.classes.append(self._describe_class(node))
+        self.generic_visit(node)
 
-    def _process_class(self, node: ast.ClassDef):
+    @staticmethod
+    def _describe_class(node: ast.ClassDef) -> ClassInfo:
         """Process a class definition to extract relationships."""
         class_name = node.name
-        self.classes[class_name] = set()
+        members = []
+        relationships = []
 
         # Find base classes
         for base in node.bases:
             if isinstance(base, ast.Name):
-                self.relationships.append((class_name, base.id, "inherits"))
+                relationships.append((class_name, base.id, "inherits"))
 
         # Find class attributes and methods
         for item in node.body:
             if isinstance(item, ast.FunctionDef):
-                self.classes[class_name].add(f"method: {item.name}")
+                members.append(f"method: {item.name}")
             elif isinstance(item, ast.ClassDef):
-                self.relationships.append((class_name, item.name, "contains"))
+                relationships.append((class_name, item.name, "contains"))
+
+        return class_name, members, relationships
+
+    def _visit_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]):
+        # Classes local to a function are not part of the diagram
+        return
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+class DiagramGenerator:
+    """Generates diagrams from code."""
+
+    def __init__(self, code_dir: Path, index: Optional[ASTIndex] = None):
+        self.code_dir = code_dir
+        self.index = index or ASTIndex(code_dir)
+        self.classes: Dict[str, Set[str]] = {}
+        self.relationships: List[tuple] = []
+
+    def analyze_code(self):
+        """Analyze code to extract class relationships."""
+        for py_file, classes in self.index.analyze("diagram_classes", self._analyze):
+            self._add_classes(classes)
+
+    def visit(self, py_file: Path, tree: ast.Module):
+        """Collect class definitions from a parsed file."""
+        self._add_classes(self._analyze(py_file, tree))
+
+    def _analyze(self, py_file: Path, tree: ast.Module) -> List[ClassInfo]:
+        """Describe the classes defined in a parsed file."""
+        collector = _ClassCollector()
+        collector.visit(tree)
+        return collector.classes
+
+    def _add_classes(self, classes: List[ClassInfo]):
+        """Record class members and relationships."""
+        for class_name, members, relationships in classes:
+            self.classes[class_name] = set(members)
+            self.relationships.extend(relationships)
 
     def generate_class_diagram(self) -> str:
         """Generate a class diagram using Graphviz."""
@@ -56,21 +92,21 @@ class DiagramGenerator:
         dot = graphviz.Digraph(comment='Class Diagram')
         dot.attr(rankdir='BT')
 
+        node = dot.node
+        edge = dot.edge
+
         # Add classes
         for class_name, members in self.classes.items():
             label = f"{class_name}\\n" + "\\n".join(members)
-            dot.node(class_name, label)
+            node(class_name, label)
 
         # Add relationships
         for source, target, rel_type in self.relationships:
-            if rel_type == "inherits":
-                dot.edge(source, target, "inherits")
-            elif rel_type == "contains":
-                dot.edge(source, target, "contains")
+            if rel_type in ("inherits", "contains"):
+                edge(source, target, rel_type)
 
         # Save diagram
-        diagram_path = Path("Documentation / generated / class_diagram")
-        dot.render(diagram_path, format='png', cleanup = True)
+        self._write_png(dot, Path("Documentation / generated / class_diagram"))
 
         # Return markdown with image
         return f"# Class Diagram\n\n![Class Diagram](class_diagram.png)\n"
@@ -109,12 +145,17 @@ class DiagramGenerator:
             dot.edge(source, target)
 
         # Save diagram
-        diagram_path = Path("Documentation / generated / flow_diagram")
-        dot.render(diagram_path, format='png', cleanup = True)
+        self._write_png(dot, Path("Documentation / generated / flow_diagram"))
 
         # Return markdown with image
         return f"# Flow Diagram\n\n![Flow Diagram](flow_diagram.png)\n"
 
+    def _write_png(self, dot: graphviz.Digraph, diagram_path: Path):
+        """Render a graph to PNG in memory and write it in one go."""
+        png_path = diagram_path.with_suffix('.png')
+        png_path.parent.mkdir(parents = True, exist_ok = True)
+        png_path.write_bytes(dot.pipe(format='png'))
+
     def generate_all_diagrams(self) -> List[str]:
         """Generate all diagrams."""
         return [
@@ -27,6 +27,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Markdown patterns, applied one line at a time
+_HEADER_LINE_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_FENCE_OPEN_RE = re.compile(r'^```(\w+)?$')
+
 @dataclass
 
 class DocConfig:
@@ -54,33 +58,39 @@ class DocumentationAutomation:
         """Generate table of contents for a markdown file."""
         toc = []
         with open(markdown_file, 'r', encoding='utf - 8') as f:
-            content = f.read()
-
-        # Find all headers
-        headers = re.finditer(r'^(#{1, 6})\s + (.+)$', content, re.MULTILINE)
-
-        for match in headers:
-            level = len(match.group(1))
-            title = match.group(2)
-            indent = '  ' * (level - 1)
-            link = title.lower().replace(' ', '-')
-            toc.append(f"{indent}- [{title}](#{link})")
+            # Find all headers
+            for line in f:
+                match = _HEADER_LINE_RE.match(line.rstrip('\n'))
+                if not match:
+                    continue
+                level = len(match.group(1))
+                title = match.group(2)
+                indent = '  ' * (level - 1)
+                link = title.lower().replace(' ', '-')
+                toc.append(f"{indent}- [{title}](#{link})")
 
         return '\n'.join(toc)
 
     def extract_code_examples(self, markdown_file: Path) -> Dict[str, str]:
         """Extract code examples from markdown files."""
         code_blocks = {}
+        lang = None
+        code_lines: List[str] = []
         with open(markdown_file, 'r', encoding='utf - 8') as f:
-            content = f.read()
-
-        # Find all code blocks
-        blocks = re.finditer(r'```(\w+)?\n(.*?)```', content, re.DOTALL)
-
-        for block in blocks:
-            lang = block.group(1) or 'text'
-            code = block.group(2)
-            code_blocks[f"{lang}_{len(code_blocks)}"] = code
+            for line in f:
+                if lang is None:
+                    # Outside a block: look for an opening fence
+                    match = _FENCE_OPEN_RE.match(line.strip())
+                    if match:
+                        lang = match.group(1) or 'text'
+                        code_lines = []
+                elif '```' in line:
+                    # Closing fence; keep anything written before it
+                    code_lines.append(line[:line.index('```')])
+                    code_blocks[f"{lang}_{len(code_blocks)}"] = ''.join(code_lines)
+                    lang = None
+                else:
+                    code_lines.append(line)
 
         return code_blocks
 
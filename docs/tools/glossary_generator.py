@@ -8,65 +8,101 @@ from code comments, docstrings, and existing documentation.
 import ast
 import re
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Union
 import logging
 
+from ast_index import ASTIndex
+
 logger = logging.getLogger(__name__)
 
+# Term definition patterns
+_TERM_DOC_RE = re.compile(r'([A-Z][A-Za-z]+):\s*([^\n]+)')
+_TERM_MD_RE = re.compile(r'\*\*([A-Z][A-Za-z]+):\*\*\s*([^\n]+)')
+_TERM_COMMENT_RE = re.compile(r'#\s*([A-Z][A-Za-z]+):\s*([^\n]+)')
+
+class _DocstringCollector(ast.NodeVisitor):
+    """Collects module, class and function docstrings."""
+
+    def __init__(self):
+        self.docstrings: List[str] = []
+
+    def _visit_documented(self, node: Union[ast.Module, ast.ClassDef, ast.FunctionDef]):
+        docstring = ast.get_docstring(node)
+        if docstring:
+            self.docstrings.append(docstring)
+        for child in node.body:
+            self.visit(child)
+
+    visit_Module = _visit_documented
+    visit_ClassDef = _visit_documented
+    visit_FunctionDef = _visit_documented
+
+    def visit_Expr(self, node: ast.Expr):
+        # Expression statements never contain definitions
+        return
+
 class GlossaryGenerator:
     """Generates and updates the glossary."""
 
-    def __init__(self, code_dir: Path, docs_dir: Path):
+    def __init__(self, code_dir: Path, docs_dir: Path, index: Optional[ASTIndex] = None):
         self.code_dir = code_dir
         self.docs_dir = docs_dir
+        self.index = index or ASTIndex(code_dir)
         self.terms: Dict[str, str] = {}
 
     def extract_terms_from_code(self):
         """Extract terms from code comments and docstrings."""
-        for py_file in self.code_dir.rglob("*.py"):
-            with open(py_file, 'r', encoding='utf - 8') as f:
-                tree = ast.parse(f.read())
+        for py_file, docstrings in self.index.analyze("glossary_docstrings", self._analyze):
+            for docstring in docstrings:
+                self._process_docstring(docstring)
 
-            # Process docstrings
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef)):
-                    if ast.get_docstring(node):
-                        self._process_docstring(ast.get_docstring(node))
+    def visit(self, py_file: Path, tree: ast.Module):
+        """Collect term definitions from the docstrings of a parsed file."""
+        for docstring in self._analyze(py_file, tree):
+            self._process_docstring(docstring)
+
+    def _analyze(self, py_file: Path, tree: ast.Module) -> List[str]:
+        """Collect the docstrings of a parsed file."""
+        collector = _DocstringCollector()
+        collector.visit(tree)
+        return collector.docstrings
 
     def _process_docstring(self, docstring: str):
         """Process a docstring to extract terms and definitions."""
         # Look for term definitions in docstrings
         # Format: Term: Definition
-        matches = re.finditer(r'([A - Z][A - Za - z]+):\s * ([^\n]+)', docstring)
+        matches = _TERM_DOC_RE.finditer(docstring)
         for match in matches:
             term = match.group(1)
             definition = match.group(2).strip()
-            self.terms[term] = definition
+            self._add_term(term, definition)
 
     def extract_terms_from_docs(self):
         """Extract terms from documentation files."""
         for md_file in self.docs_dir.glob("*.md"):
+            # Terms from code comments take precedence, as they are applied last
+            comment_terms: Dict[str, str] = {}
+            in_code_block = False
             with open(md_file, 'r', encoding='utf - 8') as f:
-                content = f.read()
-
-            # Look for term definitions in markdown
-            # Format: **Term:** Definition
-            matches = re.finditer(r'\*\*([A - Z][A - Za - z]+):\*\*\s * ([^\n]+)', content)
-            for match in matches:
-                term = match.group(1)
-                definition = match.group(2).strip()
-                self.terms[term] = definition
-
-            # Also look for terms in code blocks
-            code_blocks = re.finditer(r'```(\w+)?\n(.*?)```', content, re.DOTALL)
-            for block in code_blocks:
-                code = block.group(2)
-                # Look for term definitions in code comments
-                comment_matches = re.finditer(r'#\s * ([A - Z][A - Za - z]+):\s * ([^\n]+)', code)
-                for match in comment_matches:
-                    term = match.group(1)
-                    definition = match.group(2).strip()
-                    self.terms[term] = definition
+                for line in f:
+                    # Look for term definitions in markdown
+                    # Format: **Term:** Definition
+                    for match in _TERM_MD_RE.finditer(line):
+                        self._add_term(match.group(1), match.group(2).strip())
+
+                    if line.lstrip().startswith('```'):
+                        in_code_block = not in_code_block
+                    elif in_code_block:
+                        # Look for term definitions in code comments
+                        for match in _TERM_COMMENT_RE.finditer(line):
+                            comment_terms[match.group(1)] = match.group(2).strip()
+
+            for term, definition in comment_terms.items():
+                self._add_term(term, definition)
+
+    def _add_term(self, term: str, definition: str):
+        """Store a term definition."""
+        self.terms[term] = definition
 
     def generate_glossary(self) -> str:
         """Generate the complete glossary."""
@@ -77,11 +113,11 @@ class GlossaryGenerator:
         sorted_terms = sorted(self.terms.items())
 
         # Generate markdown
-        glossary = ["# Glossary\n"]
-        glossary.append("This glossary contains terms used throughout the codebase and documentation.\n")
-
-        for term, definition in sorted_terms:
-            glossary.append(f"**{term}:** {definition}\n")
+        glossary = [
+            "# Glossary\n", 
+            "This glossary contains terms used throughout the codebase and documentation.\n", 
+            *(f"**{term}:** {definition}\n" for term, definition in sorted_terms)
+        ]
 
         return '\n'.join(glossary)
 
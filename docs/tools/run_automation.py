@@ -6,12 +6,14 @@ This script runs all documentation automation tools and updates
 the documentation files with the generated content.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from glossary_generator import GlossaryGenerator
 from pathlib import Path
 import os
 
 from api_docs import APIDocGenerator
+from ast_index import ASTIndex
 from diagram_generator import DiagramGenerator
 from doc_automation import DocumentationAutomation, DocConfig
 from test_docs import TestDocGenerator
@@ -56,30 +58,40 @@ def main():
         automation = DocumentationAutomation(config)
         automation.run_all()
 
+        # Parse the code once for all AST-based generators, reusing the
+        # results of unchanged files from previous runs
+        index = ASTIndex(code_dir, cache_path = output_dir / ".ast_cache.pkl")
+
         # Generate API documentation
         logger.info("Generating API documentation...")
-        api_generator = APIDocGenerator(code_dir)
+        api_generator = APIDocGenerator(code_dir, index)
         api_docs = api_generator.generate_api_docs()
         with open(output_dir / "api_docs.md", 'w', encoding='utf - 8') as f:
             f.write(api_docs)
 
         # Generate test documentation
         logger.info("Generating test documentation...")
-        test_generator = TestDocGenerator(code_dir)
-        test_docs = test_generator.generate_test_docs()
+        test_generator = TestDocGenerator(
+            code_dir, cache_path = output_dir / ".test_docs_cache.db"
+)
         test_generator.update_test_docs(output_dir / "test_documentation.md")
 
         # Generate diagrams
         logger.info("Generating diagrams...")
-        diagram_generator = DiagramGenerator(code_dir)
+        diagram_generator = DiagramGenerator(code_dir, index)
         diagrams = diagram_generator.generate_all_diagrams()
-        for i, diagram in enumerate(diagrams):
-            with open(output_dir / f"diagram_{i}.mmd", 'w', encoding='utf - 8') as f:
-                f.write(diagram)
+        # Encode everything up front and write the files concurrently
+        items = [
+            (output_dir / f"diagram_{i}.mmd", diagram.encode('utf-8'))
+            for i, diagram in enumerate(diagrams)
+        ]
+        if items:
+            with ThreadPoolExecutor(max_workers = min(8, len(items))) as executor:
+                list(executor.map(lambda item: item[0].write_bytes(item[1]), items))
 
         # Update glossary
         logger.info("Updating glossary...")
-        glossary_generator = GlossaryGenerator(code_dir, docs_dir)
+        glossary_generator = GlossaryGenerator(code_dir, docs_dir, index)
         glossary_generator.update_glossary(output_dir / "glossary.md")
 
         logger.info("Documentation automation completed successfully!")
@@ -6,6 +6,10 @@ This module contains the main application entry point.
 
 from core.domain.events.dispatcher import EventDispatcher
 from core.domain.events.handlers import (
+    RecipeEventHandler, 
+    MealPlanEventHandler, 
+    EventLogger
+)
 from core.domain.meal_plan.models.meal import Meal
 from core.domain.meal_plan.models.meal_plan import MealPlan
 from core.domain.meal_plan.models.metadata import MealPlanMetadata
@@ -16,10 +20,6 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 
 import asyncio
-    RecipeEventHandler, 
-    MealPlanEventHandler, 
-    EventLogger
-)
 from core.domain.events import (
     RecipeCreated, 
     RecipeUpdated, 
@@ -36,6 +36,21 @@ from core.infrastructure.repositories.meal_plan_repository import InMemoryMealPl
 from core.application.recipe.service import RecipeService
 from core.application.meal_plan.meal_plan_service import MealPlanApplicationService
 
+# Events handled by each handler, with the name of the handling method
+RECIPE_EVENTS = (
+    (RecipeCreated, "handle_recipe_created"), 
+    (RecipeUpdated, "handle_recipe_updated"), 
+    (RecipeDeleted, "handle_recipe_deleted"), 
+    (RecipeScaled, "handle_recipe_scaled"), 
+)
+MEAL_PLAN_EVENTS = (
+    (MealPlanCreated, "handle_meal_plan_created"), 
+    (MealPlanUpdated, "handle_meal_plan_updated"), 
+    (MealPlanDeleted, "handle_meal_plan_deleted"), 
+    (MealAdded, "handle_meal_added"), 
+    (MealRemoved, "handle_meal_removed"), 
+)
+
 async def main():
     """Main application entry point."""
     # Create event dispatcher
@@ -47,41 +62,11 @@ async def main():
     meal_plan_event_handler = MealPlanEventHandler(event_logger)
 
     # Register event handlers
-    event_dispatcher.register(
-        RecipeCreated, 
-        recipe_event_handler.handle_recipe_created
-)
-    event_dispatcher.register(
-        RecipeUpdated, 
-        recipe_event_handler.handle_recipe_updated
-)
-    event_dispatcher.register(
-        RecipeDeleted, 
-        recipe_event_handler.handle_recipe_deleted
-)
-    event_dispatcher.register(
-        RecipeScaled, 
-        recipe_event_handler.handle_recipe_scaled
-)
-    event_dispatcher.register(
-        MealPlanCreated, 
-        meal_plan_event_handler.handle_meal_plan_created
-)
-    event_dispatcher.register(
-        MealPlanUpdated, 
-        meal_plan_event_handler.handle_meal_plan_updated
-)
-    event_dispatcher.register(
-        MealPlanDeleted, 
-        meal_plan_event_handler.handle_meal_plan_deleted
-)
-    event_dispatcher.register(
-        MealAdded, 
-        meal_plan_event_handler.handle_meal_added
+    event_dispatcher.register_many(
+        (event_type, getattr(recipe_event_handler, name)) for event_type, name in RECIPE_EVENTS
 )
-    event_dispatcher.register(
-        MealRemoved, 
-        meal_plan_event_handler.handle_meal_removed
+    event_dispatcher.register_many(
+        (event_type, getattr(meal_plan_event_handler, name)) for event_type, name in MEAL_PLAN_EVENTS
 )
 
     # Create repositories
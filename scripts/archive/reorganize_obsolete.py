@@ -3,6 +3,7 @@
 Script to reorganize the project directory structure according to the new architecture.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
 
@@ -17,6 +18,31 @@ def move_directory(src, dst):
     if os.path.exists(src):
         shutil.move(src, dst)
 
+def replace_item(src, dst):
+    """Move an item, replacing whatever exists at the destination."""
+    if os.path.exists(dst):
+        shutil.rmtree(dst) if os.path.isdir(dst) else os.remove(dst)
+    shutil.move(src, dst)
+
+def run_moves(move, jobs):
+    """Run independent moves concurrently so their I / O overlaps.
+
+    A failed move is reported without aborting the others.
+
+    Returns:
+        True if every move succeeded
+    """
+    def run(job):
+        try:
+            move(*job)
+            return True
+        except OSError as e:
+            print(f"Could not move {job[0]} to {job[1]}: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers = 8) as executor:
+        return all(list(executor.map(run, jobs)))
+
 def main():
     # Create new directory structure
     directories = [
@@ -40,8 +66,7 @@ def main():
         (".log", "var / logs"), 
     ]
 
-    for src, dst in moves:
-        move_directory(src, dst)
+    run_moves(move_directory, moves)
 
     # Move core / cli.py to commands/
     if os.path.exists("core / cli.py"):
@@ -53,14 +78,13 @@ def main():
         if not os.path.exists("core / domain / recipe"):
             create_directory("core / domain / recipe")
         # Move contents of core / recipe to core / domain / recipe
-        for item in os.listdir("core / recipe"):
-            src = os.path.join("core / recipe", item)
-            dst = os.path.join("core / domain / recipe", item)
-            if os.path.exists(dst):
-                shutil.rmtree(dst) if os.path.isdir(dst) else os.remove(dst)
-            shutil.move(src, dst)
-        # Remove old recipe directory
-        shutil.rmtree("core / recipe")
+        moved = run_moves(replace_item, [
+            (os.path.join("core / recipe", item), os.path.join("core / domain / recipe", item))
+            for item in os.listdir("core / recipe")
+        ])
+        # Remove old recipe directory, unless items were left behind
+        if moved:
+            shutil.rmtree("core / recipe")
 
 if __name__ == "__main__":
     main()
@@ -11,15 +11,234 @@ This script helps manage imports across the codebase by:
 """
 
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterator, List, Set, Tuple, Optional, Union
 import os
 import re
 import sys
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
 import ast
+import hashlib
+import shutil
+import tempfile
+import time
+
+try:
+    import libcst
+    HAS_LIBCST = True
+except ImportError:
+    HAS_LIBCST = False
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+_IDENTIFIER_RE = re.compile(r"\b[A-Za-z_]\w*\b")
+
+# Source lines with their line ends, as ``ast`` numbers them: only \r\n, \r
+# and \n end a line, unlike str.splitlines which also splits on \x0c, \x1c -
+# \x1e, \x85 and U+2028 / U+2029
+_LINE_RE = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+\Z")
+
+# Imports from these packages are never removed
+_SAFE_RE = re.compile(r"^(?:typing|__future__|collections)\.")
+
+# Directories never searched for Python files
+SKIP_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv", ".pytest_cache"})
+
+# Top - level modules sorted into the standard library group; the interpreter's
+# own list is available from Python 3.10
+_STDLIB = getattr(sys, 'stdlib_module_names', frozenset({
+    "os", "sys", "json", "pathlib", "typing", "re", "ast", "collections", 
+    "shutil", "datetime", "logging", "asyncio"
+}))
+
+# Order of the import groups within a sorted block
+_BUCKET_ORDER = {'stdlib': 0, 'third': 1, 'local': 2}
+
+# Files that needed no changes are remembered by content hash so later runs
+# can skip them; hashing this script's source invalidates the cache whenever
+# the optimization logic changes.
+CACHE_DIR = Path(tempfile.gettempdir()) / "mealplan-imports-cache"
+CACHE_TTL = 7 * 24 * 60 * 60
+TOOL_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size = 16).digest()
+
+def _cache_marker(source: bytes) -> Path:
+    """Get the cache marker path for a file's content."""
+    key = hashlib.blake2b(source + TOOL_VERSION, digest_size = 16).hexdigest()
+    return CACHE_DIR / key
+
+def _cached_dependencies(marker: Path) -> Optional[List[str]]:
+    """Get the dependencies stored in a marker, or None if it is missing or expired."""
+    try:
+        if time.time() - marker.stat().st_mtime >= CACHE_TTL:
+            return None
+        return marker.read_text(encoding='utf - 8').split()
+    except OSError:
+        return None
+
+def _mark_cached(marker: Path, dependencies: Set[str]) -> None:
+    """Record that content with this marker needs no changes."""
+    try:
+        CACHE_DIR.mkdir(parents = True, exist_ok = True)
+        marker.write_text('\n'.join(sorted(dependencies)), encoding='utf - 8')
+    except OSError:
+        pass
+
+def _iter_imports(tree: ast.Module) -> Iterator[Union[ast.Import, ast.ImportFrom]]:
+    """Yield the module - level import statements of a tree.
+
+    Only the top - level statements are visited, plus the bodies of top - level
+    ``if`` and ``try`` blocks (``if TYPE_CHECKING:``, ``try: import x``);
+    imports inside functions and classes are left alone.
+    """
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        elif isinstance(node, (ast.If, ast.Try)):
+            for sub in ast.walk(node):
+                if isinstance(sub, (ast.Import, ast.ImportFrom)):
+                    yield sub
+
+@lru_cache(maxsize = 8192)
+def _module_name(file_path: str, root_dir: str) -> str:
+    """Get the dotted module name of a file relative to the root's parent.
+
+    Cached on strings since it is needed for every import of a file.
+    """
+    relative_path = Path(file_path).relative_to(Path(root_dir).parent)
+    module_path = str(relative_path.with_suffix(''))
+    return module_path.replace(os.sep, '.')
+
+def _strongly_connected_components(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """Find the strongly connected components of a directed graph.
+
+    Iterative version of Tarjan's algorithm, so long import chains cannot
+    exceed the recursion limit. Nodes only appearing as dependencies are
+    treated as having no dependencies of their own.
+
+    Args:
+        graph: Mapping of each node to the nodes it depends on
+
+    Returns:
+        List of components, each a list of nodes
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+
+        while work:
+            node, deps = work[-1]
+            for dep in deps:
+                if dep not in index:
+                    # Descend; this node's remaining deps are resumed later
+                    index[dep] = lowlink[dep] = len(index)
+                    stack.append(dep)
+                    on_stack.add(dep)
+                    work.append((dep, iter(graph.get(dep, ()))))
+                    break
+                if dep in on_stack:
+                    lowlink[node] = min(lowlink[node], index[dep])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+def _atomic_write(file_path: Path, content: str) -> Optional[Exception]:
+    """Replace a file's content through a temporary file.
+
+    Args:
+        file_path: File to overwrite
+        content: New content
+
+    Returns:
+        The error that prevented the write, or None on success
+    """
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf - 8') as f:
+            f.write(content)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return e
+    return None
+
+# Result of processing one file: path, changes, optimized content (None when
+# unchanged), an error message (None on success) and the project modules the
+# optimized file imports
+FileResult = Tuple[Path, List[Dict], Optional[str], Optional[str], List[str]]
+
+def _process_file_worker(file_path: Path, root_dir: Path) -> FileResult:
+    """Analyze and optimize the imports of a single file.
+
+    Runs in a worker process, so it only reads the file and reports what
+    should change; writing back is left to the parent process.
+
+    Args:
+        file_path: File to process
+        root_dir: Root directory being processed
+
+    Returns:
+        FileResult for the file
+    """
+    try:
+        source = file_path.read_bytes()
+        # Every import statement contains the keyword; without it there is
+        # nothing to optimize and no need to parse
+        if b'import' not in source:
+            return file_path, [], None, None, []
+        marker = _cache_marker(source)
+        cached = _cached_dependencies(marker)
+        if cached is not None:
+            return file_path, [], None, None, cached
+        original_content = source.decode('utf - 8')
+
+        # Parse AST
+        try:
+            tree = ast.parse(original_content)
+        except SyntaxError:
+            return file_path, [], None, f"   ⚠️  Skipping {file_path} due to syntax error", []
+
+        # Analyze and fix imports
+        import_analyzer = ImportAnalyzer(file_path, root_dir)
+        optimized_content = import_analyzer.optimize_imports(original_content, tree)
+        dependencies = import_analyzer.dependencies
+
+        if optimized_content == original_content:
+            _mark_cached(marker, dependencies)
+            return file_path, [], None, None, sorted(dependencies)
+        return file_path, import_analyzer.changes, optimized_content, None, sorted(dependencies)
+
+    except Exception as e:
+        return file_path, [], None, f"   ❌ Error processing {file_path}: {e}", []
+
 class ImportManager:
     """Manages and optimizes imports across the codebase."""
 
@@ -32,109 +251,125 @@ class ImportManager:
         self.root_dir = Path(root_dir)
         self.changes_made = []
         self.circular_deps = []
+        # Module name -> project modules it imports, filled in as files are processed
+        self.dependency_graph: Dict[str, Set[str]] = defaultdict(set)
+        # (file, optimized content, changes) waiting to be written back
+        self._pending_writes: List[Tuple[Path, str, List[Dict]]] = []
 
     def process_all_files(self) -> None:
         """Process all Python files in the project."""
         print("🔄 Starting import optimization...")
 
-        python_files = list(self.root_dir.rglob("*.py"))
+        python_files = list(self._iter_python_files())
         total_files = len(python_files)
 
-        for i, file_path in enumerate(python_files, 1):
-            if self._should_skip_file(file_path):
-                continue
-
-            print(f"   Processing {file_path.relative_to(self.root_dir)} ({i}/{total_files})")
-            self._process_file(file_path)
+        # Parsing and rewriting is CPU bound, so files are analyzed in
+        # separate processes and the results applied here in order
+        with ProcessPoolExecutor(max_workers = os.cpu_count()) as executor:
+            results = executor.map(
+                _process_file_worker, python_files, repeat(self.root_dir), chunksize = 16
+)
+            for i, result in enumerate(results, 1):
+                print(f"   Processing {result[0].relative_to(self.root_dir)} ({i}/{total_files})")
+                self._apply_result(result)
 
+        self._flush_writes()
         self._detect_circular_dependencies()
         self._print_summary()
 
+    def _iter_python_files(self) -> Iterator[Path]:
+        """Yield the Python files under the root directory.
+
+        Walks the tree with ``os.scandir`` so entry types come from the
+        directory listing, and prunes skipped directories before descending
+        into them.
+        """
+        pending = [str(self.root_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks = False):
+                            if entry.name not in SKIP_DIRS:
+                                pending.append(entry.path)
+                        elif entry.name.endswith('.py'):
+                            yield Path(entry.path)
+            except OSError:
+                continue
+
     def _should_skip_file(self, file_path: Path) -> bool:
         """Check if file should be skipped."""
-        skip_patterns = ["__pycache__", ".git", ".venv", "venv", ".pytest_cache"]
-        return any(pattern in str(file_path) for pattern in skip_patterns)
+        return not SKIP_DIRS.isdisjoint(file_path.parts)
 
     def _process_file(self, file_path: Path) -> None:
         """Process a single Python file."""
-        try:
-            with open(file_path, 'r', encoding='utf - 8') as f:
-                original_content = f.read()
+        self._apply_result(_process_file_worker(file_path, self.root_dir))
+        self._flush_writes()
+
+    def _apply_result(self, result: FileResult) -> None:
+        """Record the outcome of processing a file and queue its write back."""
+        file_path, changes, optimized_content, error, dependencies = result
+        if error:
+            print(error)
+            return
+        if dependencies:
+            self.dependency_graph[self._get_module_name(file_path)].update(dependencies)
 
-            # Parse AST
-            try:
-                tree = ast.parse(original_content)
-            except SyntaxError:
-                print(f"   ⚠️  Skipping {file_path} due to syntax error")
-                return
-
-            # Analyze and fix imports
-            import_analyzer = ImportAnalyzer(file_path, self.root_dir)
-            optimized_content = import_analyzer.optimize_imports(original_content, tree)
-
-            # Write back if changes were made
-            if optimized_content != original_content:
-                with open(file_path, 'w', encoding='utf - 8') as f:
-                    f.write(optimized_content)
-
-                self.changes_made.append({
-                    'file': str(file_path), 
-                    'changes': import_analyzer.changes
-                })
-                print(f"   ✅ Updated imports in {file_path.relative_to(self.root_dir)}")
+        # Queue the write back if changes were made
+        if optimized_content is not None:
+            self._pending_writes.append((file_path, optimized_content, changes))
 
-        except Exception as e:
-            print(f"   ❌ Error processing {file_path}: {e}")
+    def _flush_writes(self) -> None:
+        """Write back all queued files in one pass.
 
-    def _detect_circular_dependencies(self) -> None:
-        """Detect potential circular import dependencies."""
-        print("\n🔍 Detecting circular dependencies...")
+        Writes are I/O bound, so they run on a thread pool; grouping them by
+        directory keeps updates to the same directory together.
+        """
+        pending = sorted(self._pending_writes, key = lambda write: write[0].parent)
+        self._pending_writes = []
+        if not pending:
+            return
 
-        dependency_graph = defaultdict(set)
+        with ThreadPoolExecutor(max_workers = min(8, len(pending))) as executor:
+            errors = list(executor.map(
+                _atomic_write, 
+                [file_path for file_path, _, _ in pending], 
+                [content for _, content, _ in pending]
+))
 
-        # Build dependency graph
-        for python_file in self.root_dir.rglob("*.py"):
-            if self._should_skip_file(python_file):
+        for (file_path, _, changes), error in zip(pending, errors):
+            if error:
+                print(f"   ❌ Error processing {file_path}: {error}")
                 continue
 
-            try:
-                with open(python_file, 'r') as f:
-                    content = f.read()
-
-                tree = ast.parse(content)
-                module_name = self._get_module_name(python_file)
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ImportFrom) and node.module:
-                        if node.module.startswith('core.'):
-                            dependency_graph[module_name].add(node.module)
-                    elif isinstance(node, ast.Import):
-                        for alias in node.names:
-                            if alias.name.startswith('core.'):
-                                dependency_graph[module_name].add(alias.name)
-            except:
-                continue
+            self.changes_made.append({
+                'file': str(file_path), 
+                'changes': changes
+            })
+            print(f"   ✅ Updated imports in {file_path.relative_to(self.root_dir)}")
 
-        # Simple cycle detection (could be improved with proper graph algorithms)
-        for module, deps in dependency_graph.items():
-            for dep in deps:
-                if dep in dependency_graph and module in dependency_graph[dep]:
-                    cycle = (module, dep)
-                    if cycle not in self.circular_deps and (dep, module) not in self.circular_deps:
-                        self.circular_deps.append(cycle)
+    def _detect_circular_dependencies(self) -> None:
+        """Detect circular import dependencies.
+
+        Uses the dependency graph gathered while processing the files; every
+        strongly connected component with more than one module is a cycle.
+        """
+        print("\n🔍 Detecting circular dependencies...")
+
+        for component in _strongly_connected_components(self.dependency_graph):
+            if len(component) > 1:
+                self.circular_deps.append(tuple(sorted(component)))
 
         if self.circular_deps:
             print("   ⚠️  Potential circular dependencies found:")
             for cycle in self.circular_deps:
-                print(f"      {cycle[0]} ↔ {cycle[1]}")
+                print(f"      {' ↔ '.join(cycle)}")
         else:
             print("   ✅ No circular dependencies detected")
 
     def _get_module_name(self, file_path: Path) -> str:
         """Get the module name from file path."""
-        relative_path = file_path.relative_to(self.root_dir.parent)
-        module_path = str(relative_path.with_suffix(''))
-        return module_path.replace(os.sep, '.')
+        return _module_name(str(file_path), str(self.root_dir))
 
     def _print_summary(self) -> None:
         """Print summary of changes made."""
@@ -171,8 +406,10 @@ class ImportAnalyzer:
         self.file_path = file_path
         self.root_dir = root_dir
         self.changes = []
+        # Project modules imported once the optimizations are applied
+        self.dependencies: Set[str] = set()
 
-    def optimize_imports(self, content: str, tree: ast.AST) -> str:
+    def optimize_imports(self, content: str, tree: ast.Module) -> str:
         """Optimize imports in the given content.
 
         Args:
@@ -183,16 +420,26 @@ class ImportAnalyzer:
             str: Optimized content
         """
         lines = content.split('\n')
+        # Offset of each line in content, plus one past the end
+        line_starts = [0, *accumulate(len(line) + 1 for line in lines)]
+        # Replacement text for the lines of whole statements, keyed by first
+        # line: start -> (end, text)
+        edits: Dict[int, Tuple[int, str]] = {}
 
         # Find import statements
-        imports = self._find_imports(tree)
+        imports = self._find_imports(tree, content)
 
         # Convert relative to absolute imports
         for imp in imports:
             if self._is_relative_import(imp):
                 new_import = self._convert_to_absolute(imp)
                 if new_import != imp['raw_line']:
-                    lines[imp['line_number'] - 1] = new_import
+                    node = imp['node']
+                    start, end = node.lineno - 1, node.end_lineno
+                    # Keep whatever shares the first and last line with the statement
+                    prefix = lines[start].encode()[:node.col_offset].decode()
+                    suffix = lines[end - 1].encode()[node.end_col_offset:].decode()
+                    edits[start] = (end, prefix + new_import + suffix)
                     self.changes.append({
                         'type': 'relative_to_absolute', 
                         'line': imp['line_number'], 
@@ -201,64 +448,155 @@ class ImportAnalyzer:
                     })
 
         # Remove unused imports (basic detection)
-        unused_imports = self._find_unused_imports(content, imports)
+        removed = set()
+        unused_imports = self._find_unused_imports(tree, imports)
         for imp in unused_imports:
             if self._is_safe_to_remove(imp):
-                lines[imp['line_number'] - 1] = f"# REMOVED: {lines[imp['line_number'] - 1]}"
+                start, end = imp['node'].lineno - 1, imp['node'].end_lineno
+                if start not in removed:
+                    removed.add(start)
+                    text = self._span_text(lines, edits, start, end)
+                    edits[start] = (end, '\n'.join(f"# REMOVED: {line}" for line in text.split('\n')))
                 self.changes.append({
                     'type': 'removed_unused', 
                     'line': imp['line_number'], 
-                    'import': imp['module']
+                    'import': imp.get('module') or ', '.join(imp['names'])
                 })
 
         # Sort imports (basic sorting)
-        import_blocks = self._find_import_blocks(lines)
-        for block in import_blocks:
-            sorted_lines = self._sort_import_block(lines[block['start']:block['end']])
-            if sorted_lines != lines[block['start']:block['end']]:
-                lines[block['start']:block['end']] = sorted_lines
+        for block in self._find_import_blocks(imports, removed):
+            statements = [self._span_text(lines, edits, unit['start'], unit['end']) for unit in block]
+            sorted_lines = self._sort_import_block(statements, [unit['bucket'] for unit in block])
+            if sorted_lines != statements:
+                start, end = block[0]['start'], block[-1]['end']
+                # The block replaces any edits of the statements inside it
+                for unit in block:
+                    edits.pop(unit['start'], None)
+                edits[start] = (end, '\n'.join(sorted_lines))
                 self.changes.append({
                     'type': 'sorted_imports', 
-                    'lines': f"{block['start']}-{block['end']}"
+                    'lines': f"{start}-{end}"
                 })
 
-        return '\n'.join(lines)
+        removed_lines = {change['line'] for change in self.changes if change['type'] == 'removed_unused'}
+        self.dependencies = self._find_dependencies(imports, removed_lines)
+
+        if not edits:
+            return content
+
+        # Stitch the untouched text between edited spans together once
+        parts = []
+        position = 0
+        for start in sorted(edits):
+            end, text = edits[start]
+            parts.append(content[position:line_starts[start]])
+            parts.append(text)
+            # Spans exclude the newline ending their last line
+            position = line_starts[end] - 1
+        parts.append(content[position:])
+        return ''.join(parts)
+
+    @staticmethod
+    def _span_text(lines: List[str], edits: Dict[int, Tuple[int, str]], start: int, end: int) -> str:
+        """Get the current text of a statement's lines, including earlier edits."""
+        if start in edits:
+            return edits[start][1]
+        return '\n'.join(lines[start:end])
+
+    def _find_imports(self, tree: ast.Module, content: str) -> List[Dict]:
+        """Find the module - level import statements in the AST.
 
-    def _find_imports(self, tree: ast.AST) -> List[Dict]:
-        """Find all import statements in the AST."""
+        Args:
+            tree: AST of the file
+            content: Source the AST was parsed from
+        """
         imports = []
+        # Split once; every import's source is sliced from these lines
+        self._source_lines = _LINE_RE.findall(content)
+
+        for node in _iter_imports(tree):
+            import_info = {
+                'node': node, 
+                'line_number': node.lineno, 
+                'type': 'from' if isinstance(node, ast.ImportFrom) else 'import'
+            }
+
+            if isinstance(node, ast.ImportFrom):
+                import_info.update({
+                    'module': node.module, 
+                    'level': node.level, 
+                    'names': [alias.name for alias in node.names]
+                })
+            else:
+                import_info.update({
+                    'names': [alias.name for alias in node.names]
+                })
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                import_info = {
-                    'node': node, 
-                    'line_number': node.lineno, 
-                    'type': 'from' if isinstance(node, ast.ImportFrom) else 'import'
-                }
-
-                if isinstance(node, ast.ImportFrom):
-                    import_info.update({
-                        'module': node.module, 
-                        'level': node.level, 
-                        'names': [alias.name for alias in node.names]
-                    })
-                else:
-                    import_info.update({
-                        'names': [alias.name for alias in node.names]
-                    })
-
-                # Get raw line from source
-                try:
-                    import_info['raw_line'] = ast.get_source_segment(
-                        open(self.file_path).read(), node
-) or ""
-                except:
-                    import_info['raw_line'] = ""
+            # Get raw line from source
+            import_info['raw_line'] = self._source_segment(node)
+            import_info['bucket'] = self._classify_import(import_info)
 
-                imports.append(import_info)
+            imports.append(import_info)
 
         return imports
 
+    def _source_segment(self, node: ast.stmt) -> str:
+        """Get the source text of a node from the pre - split source lines.
+
+        Equivalent to ``ast.get_source_segment`` without splitting the whole
+        source again for every node. Column offsets are UTF - 8 byte offsets.
+        """
+        first, last = node.lineno - 1, (node.end_lineno or node.lineno) - 1
+        if first == last:
+            line = self._source_lines[first].encode()
+            return line[node.col_offset:node.end_col_offset].decode()
+
+        segment = [self._source_lines[first].encode()[node.col_offset:].decode()]
+        segment.extend(self._source_lines[first + 1:last])
+        segment.append(self._source_lines[last].encode()[:node.end_col_offset].decode())
+        return ''.join(segment)
+
+    def _find_dependencies(self, imports: List[Dict], removed_lines: Set[int]) -> Set[str]:
+        """Find the project modules imported by the optimized file.
+
+        Args:
+            imports: Imports found in the file
+            removed_lines: Line numbers of imports that were removed
+
+        Returns:
+            Set of absolute ``core.`` module names
+        """
+        dependencies: Set[str] = set()
+        for imp in imports:
+            if imp['line_number'] in removed_lines:
+                continue
+            if imp['type'] == 'from':
+                modules = [self._absolute_module(imp)]
+            else:
+                modules = imp['names']
+            dependencies.update(
+                module for module in modules if module and module.startswith('core.')
+            )
+        return dependencies
+
+    def _classify_import(self, import_info: Dict) -> str:
+        """Get the group an import is sorted into: 'stdlib', 'third' or 'local'."""
+        if import_info['type'] == 'from':
+            module = self._absolute_module(import_info) or ''
+        else:
+            module = import_info['names'][0]
+        return self._classify_module(module)
+
+    @staticmethod
+    def _classify_module(module: str) -> str:
+        """Get the import group of an absolute module name."""
+        root = module.split('.')[0]
+        if root == 'core':
+            return 'local'
+        if root in _STDLIB:
+            return 'stdlib'
+        return 'third'
+
     def _is_relative_import(self, import_info: Dict) -> bool:
         """Check if an import is relative."""
         return (import_info['type'] == 'from' and
@@ -269,142 +607,156 @@ class ImportAnalyzer:
         if not self._is_relative_import(import_info):
             return import_info['raw_line']
 
-        # Get current module path
-        current_module = self._get_current_module_path()
-        level = import_info['level']
-        module = import_info.get('module', '')
+        absolute_module = self._absolute_module(import_info)
+        if absolute_module is None:
+            return import_info['raw_line']  # Can't resolve
+
+        if HAS_LIBCST:
+            # Only replace the module, keeping aliases, parentheses, line
+            # breaks and comments of the original statement
+            try:
+                statement = libcst.parse_statement(import_info['raw_line'])
+            except libcst.ParserSyntaxError:
+                statement = None
+            if isinstance(statement, libcst.SimpleStatementLine):
+                import_from = statement.body[0].with_changes(
+                    relative = [], 
+                    module = libcst.parse_expression(absolute_module)
+)
+                return libcst.Module(body = []).code_for_node(import_from)
+
+        # Reconstruct import statement
+        return ast.unparse(ast.ImportFrom(
+            module = absolute_module, 
+            names = import_info['node'].names, 
+            level = 0
+))
+
+    def _absolute_module(self, import_info: Dict) -> Optional[str]:
+        """Get the absolute module of a from - import, or None if it can't be resolved."""
+        level = import_info.get('level', 0)
+        module = import_info.get('module') or ''
+        if not level:
+            return module
 
         # Calculate absolute module path
-        module_parts = current_module.split('.')
+        module_parts = self._get_current_module_path().split('.')
         if level > len(module_parts):
-            return import_info['raw_line']  # Can't resolve
+            return None
 
-        base_parts = module_parts[:-level] if level > 0 else module_parts
+        base_parts = module_parts[:-level]
         if module:
-            absolute_module = '.'.join(base_parts + [module])
-        else:
-            absolute_module = '.'.join(base_parts)
-
-        # Reconstruct import statement
-        names = import_info.get('names', [])
-        if names:
-            names_str = ', '.join(names)
-            return f"from {absolute_module} import {names_str}"
-        else:
-            return f"import {absolute_module}"
+            return '.'.join(base_parts + [module])
+        return '.'.join(base_parts)
 
     def _get_current_module_path(self) -> str:
         """Get the current module path relative to project root."""
-        relative_path = self.file_path.relative_to(self.root_dir.parent)
-        module_path = str(relative_path.with_suffix(''))
-        return module_path.replace(os.sep, '.')
+        return _module_name(str(self.file_path), str(self.root_dir))
 
-    def _find_unused_imports(self, content: str, imports: List[Dict]) -> List[Dict]:
-        """Find potentially unused imports."""
+    def _find_unused_imports(self, tree: ast.AST, imports: List[Dict]) -> List[Dict]:
+        """Find potentially unused imports.
+
+        Args:
+            tree: AST of the file
+            imports: Imports found in the file
+        """
         unused = []
+        # Collect every referenced name in one walk of the already parsed tree
+        used = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                used.add(node.id)
+            elif isinstance(node, ast.Attribute):
+                used.add(node.attr)
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+                # Names listed in __all__ or used in string annotations
+                used.update(_IDENTIFIER_RE.findall(node.value))
 
         for imp in imports:
-            if imp['type'] == 'from':
-                names = imp.get('names', [])
-                for name in names:
-                    # Simple check: count occurrences
-                    if content.count(name) <= 1:  # Only in import line
-                        unused.append({
-                            **imp, 
-                            'unused_name': name
-                        })
-            else:
-                names = imp.get('names', [])
-                for name in names:
-                    # Check if module is used
-                    module_name = name.split('.')[0]
-                    if content.count(module_name) <= 1:
-                        unused.append({
-                            **imp, 
-                            'unused_name': name
-                        })
+            # Check the name each alias binds: ``import a.b`` binds ``a`` and
+            # ``from m import x as y`` binds ``y``
+            unused_names = [
+                alias.name
+                for alias in imp['node'].names
+                if alias.name != '*'
+                and (alias.asname or alias.name.split('.')[0]) not in used
+            ]
+            # The whole statement is commented out, so keep it while any name is used
+            if len(unused_names) < len(imp['node'].names):
+                continue
+            for name in unused_names:
+                unused.append({
+                    **imp, 
+                    'unused_name': name
+                })
 
         return unused
 
     def _is_safe_to_remove(self, import_info: Dict) -> bool:
         """Check if import is safe to remove."""
         # Don't remove certain critical imports
-        safe_to_remove_patterns = [
-            r'^typing\.', 
-            r'^__future__\.', 
-            r'^collections\.', 
-        ]
-
-        module = import_info.get('module', '')
+        module = import_info.get('module') or ''
         unused_name = import_info.get('unused_name', '')
+        return not (_SAFE_RE.match(module) or _SAFE_RE.match(unused_name))
 
-        for pattern in safe_to_remove_patterns:
-            if re.match(pattern, module) or re.match(pattern, unused_name):
-                return False
+    def _find_import_blocks(self, imports: List[Dict], removed: Set[int]) -> List[List[Dict]]:
+        """Find blocks of module - level import statements on consecutive lines.
 
-        return True
+        Args:
+            imports: Imports found in the file
+            removed: First lines of the imports that were removed
 
-    def _find_import_blocks(self, lines: List[str]) -> List[Dict]:
-        """Find blocks of consecutive import statements."""
+        Returns:
+            Blocks as lists of statements, each with its first line, the line
+            after its last and its import group
+        """
         blocks = []
-        in_block = False
-        block_start = None
-
-        for i, line in enumerate(lines):
-            is_import_line = (line.strip().startswith('import ') or
-                            line.strip().startswith('from '))
+        block: List[Dict] = []
 
-            if is_import_line and not in_block:
-                in_block = True
-                block_start = i
-            elif not is_import_line and in_block:
-                blocks.append({'start': block_start, 'end': i})
-                in_block = False
+        for imp in imports:
+            node = imp['node']
+            # Only module - level imports; indented ones belong to a block
+            # statement, and a later statement on the same line is moved
+            # together with the first one
+            if node.col_offset or node.lineno - 1 in removed:
+                continue
+            unit = {'start': node.lineno - 1, 'end': node.end_lineno, 'bucket': imp['bucket']}
+            if block and unit['start'] == block[-1]['end']:
+                block.append(unit)
+            else:
+                if block:
+                    blocks.append(block)
+                block = [unit]
 
-        # Handle case where file ends with imports
-        if in_block:
-            blocks.append({'start': block_start, 'end': len(lines)})
+        if block:
+            blocks.append(block)
 
         return blocks
 
-    def _sort_import_block(self, block_lines: List[str]) -> List[str]:
-        """Sort lines within an import block."""
-        # Simple sorting - could be enhanced with more sophisticated logic
-        import_lines = [line for line in block_lines if line.strip()]
-
-        # Sort by type (standard library, third party, local)
-        stdlib_imports = []
-        thirdparty_imports = []
-        local_imports = []
-
-        for line in import_lines:
-            line = line.strip()
-            if line.startswith('from core.') or line.startswith('import core.'):
-                local_imports.append(line)
-            elif any(stdlib in line for stdlib in ['os', 'sys', 'json', 'pathlib', 'typing']):
-                stdlib_imports.append(line)
-            else:
-                thirdparty_imports.append(line)
+    def _sort_import_block(self, statements: List[str], buckets: List[str]) -> List[str]:
+        """Sort the statements of an import block.
+
+        Args:
+            statements: Text of each statement, possibly spanning several lines
+            buckets: Import group of each statement
 
-        # Sort each group
-        stdlib_imports.sort()
-        thirdparty_imports.sort()
-        local_imports.sort()
+        Returns:
+            Sorted statements, with a blank line between groups
+        """
+        # Sort by type (standard library, third party, local), then by text
+        entries = sorted(
+            (_BUCKET_ORDER[bucket], statement.strip())
+            for statement, bucket in zip(statements, buckets)
+        )
 
         # Combine with blank lines between groups
         result = []
-        if stdlib_imports:
-            result.extend(stdlib_imports)
-            result.append('')
-        if thirdparty_imports:
-            result.extend(thirdparty_imports)
-            result.append('')
-        if local_imports:
-            result.extend(local_imports)
-
-        # Remove trailing empty line
-        while result and result[-1] == '':
-            result.pop()
+        previous = None
+        for order, statement in entries:
+            if previous is not None and order != previous:
+                result.append('')
+            result.append(statement)
+            previous = order
 
         return result
 
@@ -5,13 +5,19 @@ Script management utility for the meal planning project.
 This utility helps manage and run various project scripts.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 import os
 import sys
 
+import runpy
 import subprocess
 
+# Arguments forcing a script to run in a separate process
+SUBPROCESS_FLAGS = {'--isolated', '--subprocess'}
+
 class ScriptManager:
     """Manages project scripts and utilities."""
 
@@ -19,6 +25,9 @@ class ScriptManager:
         """Initialize the script manager."""
         self.scripts_dir = Path(__file__).parent
         self.project_root = self.scripts_dir.parent
+        # Files under the scripts directory relative to the project root,
+        # collected on first use
+        self._existing_paths: Optional[Set[str]] = None
 
         # Define available scripts
         self.scripts = {
@@ -69,10 +78,13 @@ class ScriptManager:
                 categories[cat] = []
             categories[cat].append((name, info))
 
+        available = self._scripts_available(
+            [info['path'] for scripts in categories.values() for _, info in scripts]
+)
         for cat, scripts in sorted(categories.items()):
             print(f"\n🔧 {cat.title()}:")
             for name, info in scripts:
-                status = "✅" if self._script_exists(info['path']) else "❌"
+                status = "✅" if available[info['path']] else "❌"
                 print(f"   {status} {name:<12} - {info['description']}")
 
     def run_script(self, script_name: str, args: List[str] = None) -> None:
@@ -91,6 +103,15 @@ class ScriptManager:
 
         print(f"🚀 Running {script_name}: {script_info['description']}")
 
+        # Python scripts run in this interpreter unless isolation is requested,
+        # saving the start - up of a second one
+        if script_path.suffix == '.py' and not SUBPROCESS_FLAGS.intersection(args or []):
+            if self._run_in_process(script_path, args or []):
+                print(f"✅ Script '{script_name}' completed successfully")
+            else:
+                print(f"❌ Script '{script_name}' failed")
+            return
+
         # Prepare command
         if script_path.suffix == '.py':
             cmd = [sys.executable, str(script_path)]
@@ -100,10 +121,12 @@ class ScriptManager:
             cmd = [str(script_path)]
 
         if args:
-            cmd.extend(args)
+            cmd.extend(arg for arg in args if arg not in SUBPROCESS_FLAGS)
 
         try:
-            result = subprocess.run(cmd, cwd = self.project_root)
+            # The manager opens no inheritable descriptors, so skip closing
+            # them in the child; this lets CPython take its vfork fast path
+            result = subprocess.run(cmd, cwd = self.project_root, close_fds = False)
             if result.returncode == 0:
                 print(f"✅ Script '{script_name}' completed successfully")
             else:
@@ -111,10 +134,77 @@ class ScriptManager:
         except Exception as e:
             print(f"❌ Error running script: {e}")
 
+    def _run_in_process(self, script_path: Path, args: List[str]) -> bool:
+        """Run a Python script in the current interpreter as if it were executed directly.
+
+        Args:
+            script_path: Script to run
+            args: Command line arguments for the script
+
+        Returns:
+            True if the script finished without error
+        """
+        saved_argv, saved_path, saved_cwd = sys.argv, sys.path[:], os.getcwd()
+        sys.argv = [str(script_path), *args]
+        sys.path.insert(0, str(script_path.parent))
+        os.chdir(self.project_root)
+        try:
+            runpy.run_path(str(script_path), run_name = "__main__")
+            return True
+        except SystemExit as e:
+            return e.code in (None, 0)
+        except Exception as e:
+            print(f"❌ Error running script: {e}")
+            return False
+        finally:
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            os.chdir(saved_cwd)
+
     def _script_exists(self, script_path: str) -> bool:
         """Check if a script file exists."""
-        full_path = self.project_root / script_path
-        return full_path.exists()
+        scripts_prefix = f"{self.scripts_dir.name}/"
+        if not script_path.startswith(scripts_prefix):
+            return (self.project_root / script_path).exists()
+
+        if self._existing_paths is None:
+            self._existing_paths = self._scan_scripts_dir()
+        return script_path in self._existing_paths
+
+    def _scripts_available(self, script_paths: List[str]) -> Dict[str, bool]:
+        """Check several script files at once.
+
+        The existence checks run concurrently, so files that still need a
+        stat of their own (outside the scripts directory) cost about one
+        round trip on slow network storage rather than one each.
+        """
+        if self._existing_paths is None:
+            self._existing_paths = self._scan_scripts_dir()
+        if not script_paths:
+            return {}
+        with ThreadPoolExecutor(max_workers = min(8, len(script_paths))) as executor:
+            return dict(zip(script_paths, executor.map(self._script_exists, script_paths)))
+
+    def _scan_scripts_dir(self) -> Set[str]:
+        """Collect all files under the scripts directory with one directory read per folder."""
+        existing = set()
+        pending = [(str(self.scripts_dir), self.scripts_dir.name)]
+        while pending:
+            directory, relative_dir = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        relative_path = f"{relative_dir}/{entry.name}"
+                        if entry.is_dir():
+                            pending.append((entry.path, relative_path))
+                        else:
+                            existing.add(relative_path)
+            except OSError:
+                continue
+        return existing
+
+    def refresh(self) -> None:
+        """Forget the cached script files so they are looked up again."""
+        self._existing_paths = None
 
     def check_health(self) -> None:
         """Check the health of all scripts."""
@@ -124,8 +214,9 @@ class ScriptManager:
         total_scripts = len(self.scripts)
         available_scripts = 0
 
+        available = self._scripts_available([info['path'] for info in self.scripts.values()])
         for name, info in self.scripts.items():
-            exists = self._script_exists(info['path'])
+            exists = available[info['path']]
             status = "✅ Available" if exists else "❌ Missing"
             print(f"{name:<12} {status}")
             if exists:
@@ -133,29 +224,50 @@ class ScriptManager:
 
         print(f"\n📊 Summary: {available_scripts}/{total_scripts} scripts available")
 
+@lru_cache(maxsize = 1)
+def _manager() -> ScriptManager:
+    """Get the shared script manager, creating it on first use."""
+    return ScriptManager()
+
+def _cmd_usage(args: List[str]) -> None:
+    """List all scripts followed by usage help."""
+    _manager().list_scripts()
+    print("\n💡 Usage:")
+    print("  python manage_scripts.py list        # List all scripts")
+    print("  python manage_scripts.py health      # Check script health")
+    print("  python manage_scripts.py run <name>  # Run a script")
+
+def _cmd_list(args: List[str]) -> None:
+    """List scripts, optionally only those of one category."""
+    _manager().list_scripts(args[0] if args else None)
+
+def _cmd_health(args: List[str]) -> None:
+    """Check the health of all scripts."""
+    _manager().check_health()
+
+def _cmd_run(args: List[str]) -> None:
+    """Run the named script with any remaining arguments."""
+    if not args:
+        _cmd_invalid(args)
+        return
+    _manager().run_script(args[0], args[1:] or None)
+
+def _cmd_invalid(args: List[str]) -> None:
+    """Report an unknown command."""
+    print("❌ Invalid command. Use 'list', 'health', or 'run <script_name>'")
+
+# Command handlers by first argument; each receives the remaining arguments
+COMMANDS = {
+    '': _cmd_usage,
+    'list': _cmd_list,
+    'health': _cmd_health,
+    'run': _cmd_run
+}
+
 def main():
     """Main entry point."""
-    if len(sys.argv) == 1:
-        manager = ScriptManager()
-        manager.list_scripts()
-        print("\n💡 Usage:")
-        print("  python manage_scripts.py list        # List all scripts")
-        print("  python manage_scripts.py health      # Check script health")
-        print("  python manage_scripts.py run <name>  # Run a script")
-    elif sys.argv[1] == "list":
-        manager = ScriptManager()
-        category = sys.argv[2] if len(sys.argv) > 2 else None
-        manager.list_scripts(category)
-    elif sys.argv[1] == "health":
-        manager = ScriptManager()
-        manager.check_health()
-    elif sys.argv[1] == "run" and len(sys.argv) > 2:
-        manager = ScriptManager()
-        script_name = sys.argv[2]
-        args = sys.argv[3:] if len(sys.argv) > 3 else None
-        manager.run_script(script_name, args)
-    else:
-        print("❌ Invalid command. Use 'list', 'health', or 'run <script_name>'")
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    COMMANDS.get(command, _cmd_invalid)(sys.argv[2:])
 
 if __name__ == "__main__":
     main()
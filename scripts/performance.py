@@ -12,11 +12,18 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 import click
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any
-from core.utils.performance import performance_monitor
+from core.utils.performance import ProcessingMetrics, performance_monitor
 from core.utils.logger import get_logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 def format_duration(seconds: float) -> str:
@@ -47,8 +54,8 @@ def display_metrics_table(metrics: Dict[str, Any]) -> None:
     click.echo("=" * 50)
 
     # Basic metrics
-    click.echo(f"{'Total Recipes Processed:':<25} {metrics['total_processed']:>15, }")
-    click.echo(f"{'Total Batches:':<25} {metrics['total_batches']:>15, }")
+    click.echo(f"{'Total Recipes Processed:':<25} {metrics['total_processed']:>15,}")
+    click.echo(f"{'Total Batches:':<25} {metrics['total_batches']:>15,}")
     click.echo(f"{'Success Rate:':<25} {metrics['success_rate']:>14.1%}")
 
     # Timing metrics
@@ -67,8 +74,8 @@ def display_metrics_table(metrics: Dict[str, Any]) -> None:
     # Processing method breakdown
     click.echo("\n🔧 Processing Methods")
     click.echo("-" * 30)
-    click.echo(f"{'LLM Extractions:':<25} {metrics['total_llm_extractions']:>15, }")
-    click.echo(f"{'Rule - based Extractions:':<25} {metrics['total_rule_based_extractions']:>15, }")
+    click.echo(f"{'LLM Extractions:':<25} {metrics['total_llm_extractions']:>15,}")
+    click.echo(f"{'Rule - based Extractions:':<25} {metrics['total_rule_based_extractions']:>15,}")
 
     total_extractions = metrics['total_llm_extractions'] + metrics['total_rule_based_extractions']
     if total_extractions > 0:
@@ -117,6 +124,65 @@ def display_batch_metrics() -> None:
             click.echo(f"Cache Hit Rate: {batch.cache_hit_rate:.1%}")
             click.echo(f"Success Rate: {batch.success_rate:.1%}")
 
+def build_export_data(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the data written by --export.
+
+    Args:
+        metrics: Metrics summary to include
+
+    Returns:
+        Dict[str, Any]: Summary and per - recipe metrics
+    """
+    # Per - recipe metrics are passed as they are and converted one entry at a
+    # time while serializing, see serialize_metric
+    return {
+        "timestamp": datetime.now().isoformat(), 
+        "summary": metrics, 
+        "detailed_metrics": performance_monitor._metrics
+    }
+
+def serialize_metric(obj: Any) -> Dict[str, Any]:
+    """Convert a processing metric to its exported form during serialization.
+
+    Args:
+        obj: Object the JSON encoder cannot serialize natively
+
+    Returns:
+        Dict[str, Any]: Exported fields of the metric
+
+    Raises:
+        TypeError: If obj is not a ProcessingMetrics
+    """
+    if isinstance(obj, ProcessingMetrics):
+        return {
+            "method": obj.method, 
+            "duration": obj.duration, 
+            "cache_hit": obj.cache_hit, 
+            "success": obj.success, 
+            "error": obj.error
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def write_export(path: str, export_data: Dict[str, Any]) -> None:
+    """Write exported metrics as JSON.
+
+    Args:
+        path: File to write
+        export_data: Data to serialize
+    """
+    if HAS_ORJSON:
+        # Serialize straight to bytes without building an intermediate str
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                export_data, 
+                default = serialize_metric, 
+                option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+))
+    else:
+        import json
+        with open(path, 'w') as f:
+            json.dump(export_data, f, indent = 2, default = serialize_metric)
+
 @click.command()
 @click.option('--detailed', is_flag = True, help='Show detailed metrics for each recipe')
 @click.option('--batch', is_flag = True, help='Show batch processing metrics')
@@ -136,8 +202,7 @@ def performance(detailed: bool, batch: bool, export: str, clear: bool):
     try:
         if clear:
             # Clear metrics
-            performance_monitor._metrics.clear()
-            performance_monitor._batch_metrics.clear()
+            performance_monitor.clear()
             click.echo("✅ Performance metrics cleared")
             return
 
@@ -148,6 +213,13 @@ def performance(detailed: bool, batch: bool, export: str, clear: bool):
             click.echo("   Run some recipe processing operations to generate metrics")
             return
 
+        # Start writing the export so it proceeds while the report is displayed
+        export_future = None
+        if export:
+            executor = ThreadPoolExecutor(max_workers = 1)
+            export_future = executor.submit(write_export, export, build_export_data(metrics))
+            executor.shutdown(wait = False)
+
         # Display main metrics
         display_metrics_table(metrics)
 
@@ -160,28 +232,8 @@ def performance(detailed: bool, batch: bool, export: str, clear: bool):
             display_batch_metrics()
 
         # Export metrics if requested
-        if export:
-            import json
-            export_data = {
-                "timestamp": datetime.now().isoformat(), 
-                "summary": metrics, 
-                "detailed_metrics": {
-                    recipe_id: [
-                        {
-                            "method": m.method, 
-                            "duration": m.duration, 
-                            "cache_hit": m.cache_hit, 
-                            "success": m.success, 
-                            "error": m.error
-                        }
-                        for m in recipe_metrics
-                    ]
-                    for recipe_id, recipe_metrics in performance_monitor._metrics.items()
-                }
-            }
-
-            with open(export, 'w') as f:
-                json.dump(export_data, f, indent = 2)
+        if export_future is not None:
+            export_future.result()
             click.echo(f"\n💾 Metrics exported to {export}")
 
         click.echo("\n" + "=" * 50)
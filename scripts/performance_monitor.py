@@ -8,16 +8,24 @@ and provides actionable optimization recommendations for the recipe processing s
 
 import asyncio
 import json
+import os
 import sys
 import time
 import psutil
 import logging
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Deque, List, Optional, Set, Tuple
+from dataclasses import dataclass
 import click
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -27,6 +35,152 @@ from core.infrastructure.llm.cache import SmartLLMCache
 
 logger = get_logger(__name__)
 
+# Shortest window, in seconds, that a CPU usage sample should average over
+MIN_CPU_SAMPLE_INTERVAL = 0.5
+
+# Resource checks as (SystemMetrics attribute, which also prefixes its
+# threshold keys, bottleneck tag, label, label within a sentence)
+RESOURCE_CHECKS = (
+    ("cpu_usage", "cpu", "CPU", "CPU"),
+    ("memory_usage", "memory", "Memory", "memory"),
+    ("disk_usage", "disk", "Disk", "disk"),
+)
+
+# Recommendations for each bottleneck tag, in the order they are listed
+TAG_RECOMMENDATIONS = (
+    ("cpu", (
+        "🔧 Reduce LLM concurrent requests to 2",
+        "🔧 Lower Phi model threading to 2",
+        "🔧 Enable aggressive caching",
+        "🔧 Consider using smaller model context window",
+    )),
+    ("memory", (
+        "🔧 Reduce cache size to 2000 entries",
+        "🔧 Lower cache TTL to 2 hours",
+        "🔧 Enable aggressive cache eviction",
+        "🔧 Restart Ollama to clear memory leaks",
+    )),
+)
+
+CACHE_RECOMMENDATIONS = (
+    "📈 Implement cache warming for common patterns",
+    "📈 Review cache key generation strategy",
+)
+
+OLLAMA_RECOMMENDATIONS = (
+    "🦙 Restart Ollama service",
+    "🦙 Check Ollama logs for errors",
+    "🦙 Verify Phi model is properly loaded",
+    "🦙 Consider Ollama memory optimization flags",
+)
+
+# Static part of the dashboard frame, filled in with str.format_map on every
+# tick; clears the screen and moves the cursor home first (stripped when
+# not a terminal)
+DASHBOARD_TEMPLATE = (
+    "\x1b[2J\x1b[H🚀 Plan Mensual Comidas - Performance Monitor\n"
+    + "=" * 60 + "\n"
+    "📅 {timestamp}\n"
+    "🏥 Health: {health}\n"
+    "\n"
+    "💻 System Resources:\n"
+    "  CPU Usage:    {cpu:>6.1f}%\n"
+    "  Memory Usage: {mem:>6.1f}% ({mem_avail:,.0f} MB available)\n"
+    "  Disk Usage:   {disk:>6.1f}%\n"
+    "{ollama}"
+    "\n"
+    "🤖 LLM Performance:\n"
+    "  Total Processed:   {total_processed:>8,}\n"
+    "  Avg Process Time:  {avg_time:>8.2f}s\n"
+    "  Success Rate:      {success_rate:>8.1%}\n"
+    "  Cache Hits:        {llm_cache_hits:>8,}\n"
+    "\n"
+    "💾 Cache Performance:\n"
+    "  Hit Rate:      {hit_rate:>8.1%}\n"
+    "  Entries:       {size:>8,}/{max_size:,}\n"
+    "  Memory Usage:  {cache_mb:>8.1f} MB\n"
+    "  Evictions:     {evictions:>8,}\n"
+    "\n"
+    "{issues}"
+    "Press Ctrl+C to stop monitoring"
+)
+
+# Save the cursor, rewrite the dashboard's timestamp line (row 3) and
+# restore the cursor
+TIMESTAMP_UPDATE = "\x1b7\x1b[3;1H\x1b[K📅 {timestamp}\x1b8"
+
+# On Linux the system stats are parsed straight from /proc, one read per
+# file, instead of through psutil's per-field reads and named tuples
+USE_PROCFS = sys.platform.startswith("linux") and os.path.exists("/proc/stat")
+
+
+if USE_PROCFS:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _read_proc_usage(pid: int) -> tuple:
+    """Read (CPU seconds, RSS bytes, start time) of a process from /proc."""
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        stat = f.read()
+    # Fields after the parenthesised command name, which may contain spaces
+    fields = stat[stat.rindex(b")") + 2:].split()
+    if fields[0] == b"Z":
+        raise ProcessLookupError(f"Process {pid} has exited")
+    cpu_time = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    with open(f"/proc/{pid}/statm", "rb") as f:
+        rss = int(f.read().split()[1]) * PAGE_SIZE
+    return cpu_time, rss, int(fields[19])
+
+
+def _read_meminfo() -> tuple:
+    """Read (total, available) memory in bytes from /proc/meminfo."""
+    with open("/proc/meminfo", "rb") as f:
+        data = f.read()
+    total = available = 0
+    for line in data.split(b"\n"):
+        if line.startswith(b"MemTotal:"):
+            total = int(line.split()[1]) * 1024
+        elif line.startswith(b"MemAvailable:"):
+            available = int(line.split()[1]) * 1024
+            break
+    return total, available
+
+
+def _read_stat_cpu() -> tuple:
+    """Read (busy, total) CPU time in clock ticks from /proc/stat."""
+    with open("/proc/stat", "rb") as f:
+        line = f.readline()
+    # user nice system idle iowait irq softirq steal; guest time is
+    # already included in user and nice
+    times = [int(value) for value in line.split()[1:9]]
+    total = sum(times)
+    return total - times[3] - times[4], total
+
+
+def _read_net_dev() -> Dict[str, int]:
+    """Read bytes sent and received over all interfaces from /proc/net/dev."""
+    with open("/proc/net/dev", "rb") as f:
+        data = f.read()
+    sent = recv = 0
+    # The first two lines are headers
+    for line in data.split(b"\n")[2:]:
+        if b":" not in line:
+            continue
+        fields = line.split(b":", 1)[1].split()
+        recv += int(fields[0])
+        sent += int(fields[8])
+    return {"bytes_sent": sent, "bytes_recv": recv}
+
+
+def _read_disk_percent(path: str = "/") -> float:
+    """Compute the used disk percentage of a mount the way psutil does."""
+    st = os.statvfs(path)
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    total = used + st.f_bavail * st.f_frsize
+    return round(used / total * 100, 1) if total else 0.0
+
+
 @dataclass
 class SystemMetrics:
     """System performance metrics."""
@@ -38,6 +192,18 @@ class SystemMetrics:
     network_io: Dict[str, int]
     ollama_process_stats: Optional[Dict[str, Any]] = None
 
+    def to_serializable(self) -> Dict[str, Any]:
+        """Return the fields as a dict that shares, rather than copies, nested values."""
+        return {
+            "timestamp": self.timestamp,
+            "cpu_usage": self.cpu_usage,
+            "memory_usage": self.memory_usage,
+            "memory_available_mb": self.memory_available_mb,
+            "disk_usage": self.disk_usage,
+            "network_io": self.network_io,
+            "ollama_process_stats": self.ollama_process_stats,
+        }
+
 @dataclass
 class PerformanceReport:
     """Comprehensive performance report."""
@@ -49,6 +215,18 @@ class PerformanceReport:
     recommendations: List[str]
     overall_health: str
 
+    def to_serializable(self) -> Dict[str, Any]:
+        """Return the fields as a dict that shares, rather than copies, nested values."""
+        return {
+            "timestamp": self.timestamp,
+            "system_metrics": self.system_metrics.to_serializable(),
+            "llm_performance": self.llm_performance,
+            "cache_performance": self.cache_performance,
+            "bottlenecks": self.bottlenecks,
+            "recommendations": self.recommendations,
+            "overall_health": self.overall_health,
+        }
+
 class PerformanceMonitor:
     """Real-time performance monitoring system."""
 
@@ -59,9 +237,31 @@ class PerformanceMonitor:
             monitoring_interval: Monitoring interval in seconds
         """
         self.monitoring_interval = monitoring_interval
-        self.metrics_history: List[SystemMetrics] = []
         self.max_history = 100  # Keep last 100 metrics
+        # Oldest metrics are dropped automatically once max_history is reached
+        self.metrics_history: Deque[SystemMetrics] = deque(maxlen=self.max_history)
         self.cache = SmartLLMCache()
+        # Ollama process handle, kept across ticks so the process table is
+        # only scanned when Ollama is first found or has restarted
+        self._ollama_proc: Optional[psutil.Process] = None
+        # With /proc available, only the PID is kept after discovery, along
+        # with its start time (to notice PID reuse) and the previous
+        # (CPU seconds, monotonic time) sample
+        self._ollama_pid: Optional[int] = None
+        self._ollama_start = 0
+        self._ollama_cpu = (0.0, 0.0)
+        # LLM metrics summary and the monotonic time it stops being reused
+        self._llm_stats: Optional[Dict[str, Any]] = None
+        self._llm_stats_expires = 0.0
+        # Key of the last full dashboard frame drawn
+        self._last_frame_hash: Optional[int] = None
+
+        # Prime CPU sampling; later non-blocking calls report usage since the previous one
+        if USE_PROCFS:
+            self._cpu_times = _read_stat_cpu()
+        else:
+            psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
         
         # Performance thresholds
         self.thresholds = {
@@ -76,152 +276,221 @@ class PerformanceMonitor:
             "cache_hit_rate_warning": 0.4
         }
 
-    def get_system_metrics(self) -> SystemMetrics:
-        """Collect current system metrics."""
-        # Basic system stats
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        # Network I/O
-        net_io = psutil.net_io_counters()
-        network_io = {
-            "bytes_sent": net_io.bytes_sent,
-            "bytes_recv": net_io.bytes_recv
-        }
-        
-        # Try to find Ollama process
-        ollama_stats = None
+    def _get_ollama_proc(self) -> Optional[psutil.Process]:
+        """Get the Ollama process, scanning the process table only when needed."""
+        proc = self._ollama_proc
+        if proc is not None and proc.is_running():
+            return proc
+
+        self._ollama_proc = None
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-                if 'ollama' in proc.info['name'].lower():
-                    ollama_stats = {
-                        "pid": proc.info['pid'],
-                        "cpu_percent": proc.info['cpu_percent'],
-                        "memory_mb": proc.info['memory_info'].rss / 1024 / 1024
-                    }
+            for proc in psutil.process_iter(['name']):
+                name = proc.info['name']
+                if name and 'ollama' in name.lower():
+                    # Prime CPU sampling for the next tick
+                    proc.cpu_percent(interval=None)
+                    self._ollama_proc = proc
                     break
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
+        return self._ollama_proc
+
+    def _get_ollama_stats(self) -> Optional[Dict[str, Any]]:
+        """Get Ollama process stats through psutil."""
+        proc = self._get_ollama_proc()
+        if proc is None:
+            return None
+        try:
+            with proc.oneshot():
+                return {
+                    "pid": proc.pid,
+                    "cpu_percent": proc.cpu_percent(interval=None),
+                    "memory_mb": proc.memory_info().rss / 1024 / 1024
+                }
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._ollama_proc = None
+            return None
+
+    def _get_ollama_stats_procfs(self) -> Optional[Dict[str, Any]]:
+        """Get Ollama process stats from /proc, rediscovering the process when it is gone."""
+        pid = self._ollama_pid
+        if pid is not None:
+            try:
+                cpu_time, rss, start = _read_proc_usage(pid)
+            except (OSError, ValueError, IndexError):
+                start = None
+            if start == self._ollama_start:
+                now = time.monotonic()
+                prev_cpu_time, prev_at = self._ollama_cpu
+                self._ollama_cpu = (cpu_time, now)
+                elapsed = now - prev_at
+                cpu_percent = round((cpu_time - prev_cpu_time) / elapsed * 100, 1) if elapsed > 0 else 0.0
+                return {"pid": pid, "cpu_percent": cpu_percent, "memory_mb": rss / 1024 / 1024}
+
+        # First tick, or Ollama exited or restarted: scan the process table
+        self._ollama_pid = None
+        self._ollama_proc = None
+        proc = self._get_ollama_proc()
+        if proc is None:
+            return None
+        try:
+            cpu_time, rss, start = _read_proc_usage(proc.pid)
+        except (OSError, ValueError, IndexError):
+            return None
+        self._ollama_pid = proc.pid
+        self._ollama_start = start
+        self._ollama_cpu = (cpu_time, time.monotonic())
+        return {"pid": proc.pid, "cpu_percent": 0.0, "memory_mb": rss / 1024 / 1024}
+
+    def get_llm_stats(self) -> Dict[str, Any]:
+        """Get the LLM metrics summary, reused for one monitoring interval.
+
+        Dashboards do not need totals fresher than a tick, so the summary is
+        only requested again once the interval has passed.
+        """
+        now = time.monotonic()
+        if self._llm_stats is None or now >= self._llm_stats_expires:
+            self._llm_stats = performance_monitor.get_metrics_summary()
+            self._llm_stats_expires = now + self.monitoring_interval
+        return self._llm_stats
+
+    def get_system_metrics(self) -> SystemMetrics:
+        """Collect current system metrics."""
+        # Basic system stats; CPU usage is the average since the previous
+        # sample, only waiting when that was too recent to be meaningful
+        # (e.g. a single report right after start-up)
+        elapsed = time.monotonic() - self._cpu_sampled_at
+        if elapsed < MIN_CPU_SAMPLE_INTERVAL:
+            time.sleep(MIN_CPU_SAMPLE_INTERVAL - elapsed)
+        if USE_PROCFS:
+            busy, total = _read_stat_cpu()
+            prev_busy, prev_total = self._cpu_times
+            self._cpu_times = (busy, total)
+            cpu_usage = (
+                round(100.0 * (busy - prev_busy) / (total - prev_total), 1)
+                if total > prev_total else 0.0
+            )
+            mem_total, mem_available = _read_meminfo()
+            memory_percent = round((mem_total - mem_available) / mem_total * 100, 1) if mem_total else 0.0
+            disk_percent = _read_disk_percent("/")
+            network_io = _read_net_dev()
+        else:
+            cpu_usage = psutil.cpu_percent(interval=None)
+            memory = psutil.virtual_memory()
+            memory_percent, mem_available = memory.percent, memory.available
+            disk_percent = psutil.disk_usage('/').percent
+            net_io = psutil.net_io_counters()
+            network_io = {
+                "bytes_sent": net_io.bytes_sent,
+                "bytes_recv": net_io.bytes_recv
+            }
+        self._cpu_sampled_at = time.monotonic()
+        
+        # Try to find Ollama process
+        if USE_PROCFS:
+            ollama_stats = self._get_ollama_stats_procfs()
+        else:
+            ollama_stats = self._get_ollama_stats()
 
         return SystemMetrics(
             timestamp=time.time(),
             cpu_usage=cpu_usage,
-            memory_usage=memory.percent,
-            memory_available_mb=memory.available / 1024 / 1024,
-            disk_usage=disk.percent,
+            memory_usage=memory_percent,
+            memory_available_mb=mem_available / 1024 / 1024,
+            disk_usage=disk_percent,
             network_io=network_io,
             ollama_process_stats=ollama_stats
         )
 
-    def analyze_bottlenecks(self, metrics: SystemMetrics) -> List[str]:
-        """Analyze system metrics to identify bottlenecks."""
+    def analyze_bottlenecks(self, metrics: SystemMetrics) -> Tuple[List[str], Set[str]]:
+        """Analyze system metrics to identify bottlenecks.
+
+        Returns:
+            The bottleneck messages and the set of tags describing them
+            ("cpu", "memory", "disk", "ollama", "critical", "warning")
+        """
         bottlenecks = []
-        
-        if metrics.cpu_usage > self.thresholds["cpu_usage_critical"]:
-            bottlenecks.append(f"🚨 CRITICAL: CPU usage at {metrics.cpu_usage:.1f}%")
-        elif metrics.cpu_usage > self.thresholds["cpu_usage_warning"]:
-            bottlenecks.append(f"⚠️ WARNING: High CPU usage at {metrics.cpu_usage:.1f}%")
-            
-        if metrics.memory_usage > self.thresholds["memory_usage_critical"]:
-            bottlenecks.append(f"🚨 CRITICAL: Memory usage at {metrics.memory_usage:.1f}%")
-        elif metrics.memory_usage > self.thresholds["memory_usage_warning"]:
-            bottlenecks.append(f"⚠️ WARNING: High memory usage at {metrics.memory_usage:.1f}%")
-            
-        if metrics.disk_usage > self.thresholds["disk_usage_critical"]:
-            bottlenecks.append(f"🚨 CRITICAL: Disk usage at {metrics.disk_usage:.1f}%")
-        elif metrics.disk_usage > self.thresholds["disk_usage_warning"]:
-            bottlenecks.append(f"⚠️ WARNING: High disk usage at {metrics.disk_usage:.1f}%")
+        tags: Set[str] = set()
+
+        for attr, tag, label, inline_label in RESOURCE_CHECKS:
+            value = getattr(metrics, attr)
+            if value > self.thresholds[f"{attr}_critical"]:
+                bottlenecks.append(f"🚨 CRITICAL: {label} usage at {value:.1f}%")
+                tags.update((tag, "critical"))
+            elif value > self.thresholds[f"{attr}_warning"]:
+                bottlenecks.append(f"⚠️ WARNING: High {inline_label} usage at {value:.1f}%")
+                tags.update((tag, "warning"))
 
         if metrics.ollama_process_stats:
             ollama_memory = metrics.ollama_process_stats.get("memory_mb", 0)
             if ollama_memory > 2000:  # 2GB
                 bottlenecks.append(f"🚨 Ollama using {ollama_memory:.0f}MB memory")
+                tags.add("ollama")
         else:
             bottlenecks.append("⚠️ Ollama process not found - check if it's running")
+            tags.add("ollama")
 
-        return bottlenecks
+        return bottlenecks, tags
 
     def generate_recommendations(
         self, 
-        bottlenecks: List[str], 
+        tags: Set[str], 
         cache_stats: Dict[str, Any]
     ) -> List[str]:
         """Generate performance optimization recommendations."""
-        recommendations = []
-        
-        # CPU optimization
-        if any("CPU" in b for b in bottlenecks):
-            recommendations.extend([
-                "🔧 Reduce LLM concurrent requests to 2",
-                "🔧 Lower Phi model threading to 2",
-                "🔧 Enable aggressive caching",
-                "🔧 Consider using smaller model context window"
-            ])
-        
-        # Memory optimization
-        if any("Memory" in b for b in bottlenecks):
-            recommendations.extend([
-                "🔧 Reduce cache size to 2000 entries",
-                "🔧 Lower cache TTL to 2 hours",
-                "🔧 Enable aggressive cache eviction",
-                "🔧 Restart Ollama to clear memory leaks"
-            ])
-        
+        recommendations: List[str] = []
+
+        # CPU and memory optimization
+        for tag, tag_recommendations in TAG_RECOMMENDATIONS:
+            if tag in tags:
+                recommendations.extend(tag_recommendations)
+
         # Cache optimization
         cache_hit_rate = cache_stats.get("hit_rate", 0)
         if cache_hit_rate < self.thresholds["cache_hit_rate_warning"]:
-            recommendations.extend([
-                f"📈 Cache hit rate low ({cache_hit_rate:.1%}) - extend TTL",
-                "📈 Implement cache warming for common patterns",
-                "📈 Review cache key generation strategy"
-            ])
-        
+            recommendations.append(f"📈 Cache hit rate low ({cache_hit_rate:.1%}) - extend TTL")
+            recommendations.extend(CACHE_RECOMMENDATIONS)
+
         # Ollama optimization
-        if any("Ollama" in b for b in bottlenecks):
-            recommendations.extend([
-                "🦙 Restart Ollama service",
-                "🦙 Check Ollama logs for errors",
-                "🦙 Verify Phi model is properly loaded",
-                "🦙 Consider Ollama memory optimization flags"
-            ])
-        
+        if "ollama" in tags:
+            recommendations.extend(OLLAMA_RECOMMENDATIONS)
+
         # No issues found
-        if not bottlenecks:
+        if not tags:
             recommendations.append("✅ System performance is optimal")
-        
+
         return recommendations
 
-    def get_overall_health(self, bottlenecks: List[str]) -> str:
+    def get_overall_health(self, tags: Set[str]) -> str:
         """Determine overall system health."""
-        if any("CRITICAL" in b for b in bottlenecks):
+        if "critical" in tags:
             return "🚨 CRITICAL"
-        elif any("WARNING" in b for b in bottlenecks):
+        elif "warning" in tags:
             return "⚠️ WARNING"
-        elif bottlenecks:
+        elif tags:
             return "📊 MONITORING"
         else:
             return "✅ HEALTHY"
 
     async def generate_report(self) -> PerformanceReport:
         """Generate comprehensive performance report."""
-        # Collect metrics
-        system_metrics = self.get_system_metrics()
-        
-        # Get LLM performance stats
-        llm_stats = performance_monitor.get_metrics_summary()
-        
-        # Get cache performance
-        cache_stats = self.cache.get_stats()
+        # Collect system metrics, LLM performance stats and cache performance
+        # on worker threads; the psutil calls and the cache scan are
+        # synchronous and would otherwise block the event loop
+        system_metrics, llm_stats, cache_stats = await asyncio.gather(
+            asyncio.to_thread(self.get_system_metrics),
+            asyncio.to_thread(self.get_llm_stats),
+            asyncio.to_thread(self.cache.get_stats)
+        )
         
         # Analyze bottlenecks
-        bottlenecks = self.analyze_bottlenecks(system_metrics)
+        bottlenecks, tags = self.analyze_bottlenecks(system_metrics)
         
         # Generate recommendations
-        recommendations = self.generate_recommendations(bottlenecks, cache_stats)
+        recommendations = self.generate_recommendations(tags, cache_stats)
         
         # Determine overall health
-        health = self.get_overall_health(bottlenecks)
+        health = self.get_overall_health(tags)
         
         return PerformanceReport(
             timestamp=datetime.now().isoformat(),
@@ -234,63 +503,70 @@ class PerformanceMonitor:
         )
 
     def print_dashboard(self, report: PerformanceReport):
-        """Print performance dashboard to console."""
-        click.clear()
-        
-        # Header
-        click.echo("🚀 Plan Mensual Comidas - Performance Monitor")
-        click.echo("=" * 60)
-        click.echo(f"📅 {report.timestamp}")
-        click.echo(f"🏥 Health: {report.overall_health}")
-        click.echo()
-        
-        # System Metrics
+        """Print performance dashboard to console.
+
+        The frame is filled into DASHBOARD_TEMPLATE and written with a single
+        echo, so the terminal is cleared and redrawn in one write. On a
+        terminal, when the key figures have not changed since the last frame,
+        only the timestamp line is rewritten.
+        """
         metrics = report.system_metrics
-        click.echo("💻 System Resources:")
-        click.echo(f"  CPU Usage:    {metrics.cpu_usage:>6.1f}%")
-        click.echo(f"  Memory Usage: {metrics.memory_usage:>6.1f}% ({metrics.memory_available_mb:,.0f} MB available)")
-        click.echo(f"  Disk Usage:   {metrics.disk_usage:>6.1f}%")
-        
-        if metrics.ollama_process_stats:
-            ollama = metrics.ollama_process_stats
-            click.echo(f"  Ollama:       {ollama['memory_mb']:>6.0f} MB (PID: {ollama['pid']})")
-        click.echo()
-        
-        # LLM Performance
         llm = report.llm_performance
-        click.echo("🤖 LLM Performance:")
-        click.echo(f"  Total Processed:   {llm.get('total_processed', 0):>8,}")
-        click.echo(f"  Avg Process Time:  {llm.get('average_processing_time', 0):>8.2f}s")
-        click.echo(f"  Success Rate:      {llm.get('success_rate', 0):>8.1%}")
-        click.echo(f"  Cache Hits:        {llm.get('total_cache_hits', 0):>8,}")
-        click.echo()
-        
-        # Cache Performance
         cache = report.cache_performance
-        click.echo("💾 Cache Performance:")
-        click.echo(f"  Hit Rate:      {cache.get('hit_rate', 0):>8.1%}")
-        click.echo(f"  Entries:       {cache.get('size', 0):>8,}/{cache.get('max_size', 0):,}")
-        click.echo(f"  Memory Usage:  {cache.get('memory_usage_mb', 0):>8.1f} MB")
-        click.echo(f"  Evictions:     {cache.get('evictions', 0):>8,}")
-        click.echo()
-        
-        # Bottlenecks
+
+        frame_hash = hash((
+            round(metrics.cpu_usage),
+            round(metrics.memory_usage),
+            round(metrics.disk_usage),
+            report.overall_health,
+            len(report.bottlenecks),
+            llm.get('total_processed', 0),
+            cache.get('size', 0),
+        ))
+        if frame_hash == self._last_frame_hash and sys.stdout.isatty():
+            click.echo(TIMESTAMP_UPDATE.format(timestamp=report.timestamp), nl=False)
+            return
+        self._last_frame_hash = frame_hash
+
+        ollama = ""
+        if metrics.ollama_process_stats:
+            stats = metrics.ollama_process_stats
+            ollama = f"  Ollama:       {stats['memory_mb']:>6.0f} MB (PID: {stats['pid']})\n"
+
+        # Bottlenecks and recommendations vary in length
+        issues = []
         if report.bottlenecks:
-            click.echo("🚨 Issues Detected:")
+            issues.append("🚨 Issues Detected:")
             for bottleneck in report.bottlenecks:
-                click.echo(f"  {bottleneck}")
-            click.echo()
-        
-        # Recommendations
+                issues.append(f"  {bottleneck}")
+            issues.append("")
         if report.recommendations:
-            click.echo("💡 Recommendations:")
+            issues.append("💡 Recommendations:")
             for rec in report.recommendations[:5]:  # Show top 5
-                click.echo(f"  {rec}")
+                issues.append(f"  {rec}")
             if len(report.recommendations) > 5:
-                click.echo(f"  ... and {len(report.recommendations) - 5} more")
-            click.echo()
-        
-        click.echo("Press Ctrl+C to stop monitoring")
+                issues.append(f"  ... and {len(report.recommendations) - 5} more")
+            issues.append("")
+
+        click.echo(DASHBOARD_TEMPLATE.format_map({
+            "timestamp": report.timestamp,
+            "health": report.overall_health,
+            "cpu": metrics.cpu_usage,
+            "mem": metrics.memory_usage,
+            "mem_avail": metrics.memory_available_mb,
+            "disk": metrics.disk_usage,
+            "ollama": ollama,
+            "total_processed": llm.get('total_processed', 0),
+            "avg_time": llm.get('average_processing_time', 0),
+            "success_rate": llm.get('success_rate', 0),
+            "llm_cache_hits": llm.get('total_cache_hits', 0),
+            "hit_rate": cache.get('hit_rate', 0),
+            "size": cache.get('size', 0),
+            "max_size": cache.get('max_size', 0),
+            "cache_mb": cache.get('memory_usage_mb', 0),
+            "evictions": cache.get('evictions', 0),
+            "issues": "".join(line + "\n" for line in issues),
+        }))
 
     async def run_continuous_monitoring(self):
         """Run continuous performance monitoring."""
@@ -305,8 +581,6 @@ class PerformanceMonitor:
                 
                 # Store metrics for trending
                 self.metrics_history.append(report.system_metrics)
-                if len(self.metrics_history) > self.max_history:
-                    self.metrics_history.pop(0)
                 
                 await asyncio.sleep(self.monitoring_interval)
                 
@@ -318,10 +592,14 @@ class PerformanceMonitor:
 
     def export_report(self, report: PerformanceReport, filepath: str):
         """Export performance report to file."""
-        report_dict = asdict(report)
-        
-        with open(filepath, 'w') as f:
-            json.dump(report_dict, f, indent=2, default=str)
+        report_dict = report.to_serializable()
+
+        if HAS_ORJSON:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(report_dict, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(report_dict, f, indent=2, default=str)
         
         click.echo(f"📄 Report exported to: {filepath}")
 
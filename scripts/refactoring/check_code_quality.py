@@ -11,17 +11,57 @@ This script performs various code quality checks including:
 - Performance bottleneck detection
 """
 
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import ast
+import io
+import os
 import re
 import sys
+import token
+import tokenize
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+try:
+    import orjson
 
-@dataclass
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from content_cache import ContentCache
+from file_manifest import FileManifest
+from source_files import find_python_files
+
+# Instances drop their __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Directories never analyzed
+SKIP_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv", "migrations"})
+
+# Fewest files worth starting worker processes for
+PARALLEL_MIN_FILES = 64
+
+# Progress lines written to stdout at a time
+PROGRESS_BATCH = 128
+
+# Longest line allowed, Black's default
+MAX_LINE_LENGTH = 88
+
+# Naming conventions and technical debt markers
+_CLASS_NAME_RE = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
+_FUNC_NAME_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+# (the lookahead lets the scanner skip positions that cannot start a marker)
+_TODO_RE = re.compile(r"(?=[TtFfXxHh])(TODO|FIXME|XXX|HACK)", re.IGNORECASE)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CodeIssue:
     """Represents a code quality issue."""
 
@@ -40,318 +80,552 @@ class QualityReport:
     total_files: int = 0
     issues: List[CodeIssue] = field(default_factory=list)
     metrics: Dict[str, float] = field(default_factory=dict)
+    # Issues indexed as they are added, so lookups don't scan the list
+    _by_severity: Dict[str, List[CodeIssue]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False
+    )
+    _by_type: Dict[str, List[CodeIssue]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False
+    )
 
     def add_issue(self, issue: CodeIssue) -> None:
         """Add an issue to the report."""
         self.issues.append(issue)
+        self._by_severity[issue.severity].append(issue)
+        self._by_type[issue.issue_type].append(issue)
+
+    def add_issues(self, issues: List[CodeIssue]) -> None:
+        """Add several issues to the report."""
+        for issue in issues:
+            self.add_issue(issue)
 
     def get_issues_by_severity(self, severity: str) -> List[CodeIssue]:
         """Get issues by severity level."""
-        return [issue for issue in self.issues if issue.severity == severity]
+        return self._by_severity.get(severity, [])
 
     def get_issues_by_type(self, issue_type: str) -> List[CodeIssue]:
         """Get issues by type."""
-        return [issue for issue in self.issues if issue.issue_type == issue_type]
+        return self._by_type.get(issue_type, [])
+
+
+class _FusedChecker(ast.NodeVisitor):
+    """Runs the per - node checks of a file in a single traversal.
+
+    Documentation, type hint, naming and size checks run when a class or
+    function is visited, and its complexity once its body has been. Imports
+    are collected for the unused import check, which needs the whole file.
+    """
+
+    def __init__(self, file_path: str, report: QualityReport):
+        self.file_path = file_path
+        self.report = report
+        # (imported name, name bound in the module, line number)
+        self.imports: List[Tuple[str, str, int]] = []
+        # Cyclomatic complexity of each function being visited, innermost
+        # last; branches count towards every enclosing function
+        self._complexity: List[int] = []
+        # Handlers by node type, looked up directly instead of building a
+        # "visit_" method name for every node
+        self._handlers: Dict[type, Callable[[Any], None]] = {
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.If: self.visit_If,
+            ast.For: self.visit_For,
+            ast.While: self.visit_While,
+            ast.With: self.visit_With,
+            ast.ExceptHandler: self.visit_ExceptHandler,
+            ast.BoolOp: self.visit_BoolOp,
+        }
 
+    def visit(self, node: ast.AST) -> None:
+        handler = self._handlers.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Children are dispatched inline, saving a visit() call per node
+        handlers = self._handlers
+        for child in ast.iter_child_nodes(node):
+            handler = handlers.get(type(child))
+            if handler is None:
+                self.generic_visit(child)
+            else:
+                handler(child)
+
+    def _add(
+        self,
+        line_number: int,
+        issue_type: str,
+        severity: str,
+        message: str,
+        suggestion: Optional[str] = None,
+    ) -> None:
+        self.report.add_issue(
+            CodeIssue(
+                file_path=self.file_path,
+                line_number=line_number,
+                issue_type=issue_type,
+                severity=severity,
+                message=message,
+                suggestion=suggestion,
+            )
+        )
 
-class CodeQualityChecker:
-    """Comprehensive code quality checker."""
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            bound_name = alias.asname or alias.name.split(".")[0]
+            self.imports.append((alias.name, bound_name, node.lineno))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            for alias in node.names:
+                if alias.name != "*":
+                    self.imports.append(
+                        (
+                            f"{node.module}.{alias.name}",
+                            alias.asname or alias.name,
+                            node.lineno,
+                        )
+                    )
 
-    def __init__(self, root_dir: str):
-        """Initialize the checker.
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        # Documentation, skipping private classes
+        if not ast.get_docstring(node) and not node.name.startswith("_"):
+            self._add(
+                node.lineno,
+                "documentation",
+                "warning",
+                f"Missing docstring for class '{node.name}'",
+                "Add comprehensive docstring following project standards",
+            )
 
-        Args:
-            root_dir: Root directory to analyze
-        """
-        self.root_dir = Path(root_dir)
-        self.report = QualityReport()
+        # Naming
+        if not _CLASS_NAME_RE.match(node.name):
+            self._add(
+                node.lineno,
+                "naming",
+                "warning",
+                f"Class '{node.name}' doesn't follow PascalCase convention",
+                "Use PascalCase for class names (e.g., MyClass)",
+            )
 
-    def check_all(self) -> QualityReport:
-        """Run all quality checks."""
-        print("🔍 Starting comprehensive code quality analysis...")
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        # Documentation and type hints, skipping private and special methods
+        if not node.name.startswith("_"):
+            if not ast.get_docstring(node):
+                self._add(
+                    node.lineno,
+                    "documentation",
+                    "warning",
+                    f"Missing docstring for function '{node.name}'",
+                    "Add comprehensive docstring following project standards",
+                )
 
-        python_files = list(self.root_dir.rglob("*.py"))
-        self.report.total_files = len(python_files)
+            # Check return type annotation
+            if not node.returns:
+                self._add(
+                    node.lineno,
+                    "type_hints",
+                    "info",
+                    f"Missing return type annotation for function '{node.name}'",
+                    "Add return type annotation for better IDE support",
+                )
 
-        for file_path in python_files:
-            if self._should_skip_file(file_path):
-                continue
+            # Check parameter type annotations
+            for arg in node.args.args:
+                if not arg.annotation and arg.arg != "self":
+                    self._add(
+                        node.lineno,
+                        "type_hints",
+                        "info",
+                        f"Missing type annotation for parameter '{arg.arg}' in '{node.name}'",
+                        "Add type annotation for parameter",
+                    )
 
-            print(f"   Analyzing {file_path.relative_to(self.root_dir)}")
-            self._check_file(file_path)
+        # Naming
+        if not node.name.startswith("__") and not _FUNC_NAME_RE.match(node.name):
+            self._add(
+                node.lineno,
+                "naming",
+                "warning",
+                f"Function '{node.name}' doesn't follow snake_case convention",
+                "Use snake_case for function names (e.g., my_function)",
+            )
 
-        # Run project - wide checks
-        self._check_architecture_compliance()
-        self._analyze_test_coverage()
-        self._calculate_metrics()
+        # Large functions
+        line_count = node.end_lineno - node.lineno
+        if line_count > 50:
+            self._add(
+                node.lineno,
+                "code_smell",
+                "warning",
+                f"Large function '{node.name}' (~{line_count} lines)",
+                "Consider breaking into smaller, focused functions",
+            )
 
-        return self.report
+        # Complexity, counted while the function body is visited
+        self._complexity.append(1)  # Base complexity
+        self.generic_visit(node)
+        complexity = self._complexity.pop()
+        # The branches of a nested function also count for the enclosing one
+        if self._complexity:
+            self._complexity[-1] += complexity - 1
+        if complexity > 10:
+            severity = "warning" if complexity <= 15 else "error"
+            self._add(
+                node.lineno,
+                "complexity",
+                severity,
+                f"High cyclomatic complexity ({complexity}) in function '{node.name}'",
+                "Break down into smaller, more focused functions",
+            )
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """Check if file should be skipped."""
-        skip_patterns = [
-            "__pycache__",
-            ".git",
-            ".venv",
-            "venv",
-            "migrations",
-        ]
+    def _add_complexity(self, amount: int) -> None:
+        # Only the innermost function is counted here; its total is passed on
+        # to the enclosing function once its body has been visited
+        if self._complexity:
+            self._complexity[-1] += amount
+
+    def _visit_branch(self, node: ast.AST) -> None:
+        self._add_complexity(1)
+        self.generic_visit(node)
+
+    visit_If = _visit_branch
+    visit_For = _visit_branch
+    visit_While = _visit_branch
+    visit_With = _visit_branch
+    visit_ExceptHandler = _visit_branch
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self._add_complexity(len(node.values) - 1)
+        self.generic_visit(node)
+
+
+def check_file(file_path: str, cache: Optional[ContentCache] = None) -> List[CodeIssue]:
+    """Analyze a single Python file.
+
+    Kept free of checker state so that files can be analyzed in worker
+    processes.
+
+    Args:
+        file_path: File to analyze
+        cache: Cache of the issues found in file contents analyzed before
+
+    Returns:
+        The issues found in the file
+    """
+    return _check_file(file_path, cache)[1]
+
+
+def _check_file(
+    file_path: str, cache: Optional[ContentCache] = None
+) -> Tuple[Optional[str], List[CodeIssue]]:
+    """Analyze a single Python file, also returning its content hash.
+
+    The hash is None when the file could not be read.
+    """
+    report = QualityReport()
+    key = None
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+
+        # Contents analyzed before get their issues from the cache,
+        # skipping the parse and all checks
+        key = ContentCache.key(raw)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return key, _hydrate_issues(file_path, cached)
+
+        _analyze_content(report, file_path, raw, key)
+
+        if cache is not None:
+            cache.put(key, _issue_fields(report.issues))
+
+    except Exception as e:
+        report.add_issue(
+            CodeIssue(
+                file_path=file_path,
+                line_number=0,
+                issue_type="analysis",
+                severity="error",
+                message=f"Failed to analyze file: {str(e)}",
+            )
+        )
 
-        return any(pattern in str(file_path) for pattern in skip_patterns)
+    return key, report.issues
 
-    def _check_file(self, file_path: Path) -> None:
-        """Analyze a single Python file."""
-        try:
-            with open(file_path, "r", encoding="utf - 8") as f:
-                content = f.read()
 
-            # Parse AST
-            try:
-                tree = ast.parse(content)
-            except SyntaxError as e:
-                self.report.add_issue(
+def _issue_fields(issues: List[CodeIssue]) -> List[tuple]:
+    """Get the fields of a file's issues other than the file path, for storage."""
+    return [
+        (
+            issue.line_number,
+            issue.issue_type,
+            issue.severity,
+            issue.message,
+            issue.suggestion,
+        )
+        for issue in issues
+    ]
+
+
+def _hydrate_issues(file_path: str, stored: List[tuple]) -> List[CodeIssue]:
+    """Rebuild a file's issues from their stored fields."""
+    return [CodeIssue(file_path, *fields) for fields in stored]
+
+
+@lru_cache(maxsize=128)
+def _parse_cached(content_hash: str, content: bytes) -> ast.AST:
+    """Parse file content, reusing the tree of content parsed before.
+
+    Files with the same content (empty ``__init__.py`` files, paths reached
+    twice) are parsed once per process, and the bound keeps the memory held
+    by trees in check.
+    """
+    # compile() directly, skipping ast.parse's wrapper; the file name only
+    # appears in error messages, which don't use it
+    return compile(content, "<unknown>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+def _analyze_content(
+    report: QualityReport, file_path: str, raw: bytes, content_hash: str
+) -> None:
+    """Parse a file's content and run the per-file checks on it."""
+    try:
+        # The parser reads the bytes directly, honouring any encoding
+        # declaration; the text checks get a single decode
+        tree = _parse_cached(content_hash, raw)
+        content = _decode(raw)
+    except SyntaxError as e:
+        report.add_issue(
+            CodeIssue(
+                file_path=file_path,
+                line_number=getattr(e, "lineno", 0),
+                issue_type="syntax",
+                severity="error",
+                message=f"Syntax error: {e.msg}",
+                suggestion="Fix syntax error",
+            )
+        )
+        return
+
+    # Run the node checks in one traversal, then the text checks
+    visitor = _FusedChecker(file_path, report)
+    visitor.visit(tree)
+    _check_imports(report, file_path, visitor.imports, raw)
+    _check_line_length(report, file_path, content)
+    _check_todo_comments(report, file_path, content)
+
+
+def _decode(raw: bytes) -> str:
+    """Decode file content, translating newlines as text mode reading would."""
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _check_imports(
+    report: QualityReport,
+    file_path: str,
+    imports: List[Tuple[str, str, int]],
+    raw: bytes,
+) -> None:
+    """Check import - related issues."""
+    if not imports:
+        return
+
+    # Count every name in the code once; comments and strings are single
+    # tokens, so names mentioned only there are not counted
+    try:
+        name_counts = Counter(
+            tok.string
+            for tok in tokenize.tokenize(io.BytesIO(raw).readline)
+            if tok.type == token.NAME
+        )
+    except (tokenize.TokenError, SyntaxError):
+        return
+
+    # Check for potentially unused imports
+    for import_name, bound_name, line_no in imports:
+        module_name = import_name.split(".")[0]
+        # Simple heuristic: if the bound name only appears once (in the
+        # import), it might be unused
+        if name_counts[bound_name] <= 1:
+            # Skip common imports that might be used implicitly
+            if module_name not in ["typing", "abc", "__future__"]:
+                report.add_issue(
                     CodeIssue(
-                        file_path=str(file_path),
-                        line_number=getattr(e, "lineno", 0),
-                        issue_type="syntax",
-                        severity="error",
-                        message=f"Syntax error: {e.msg}",
-                        suggestion="Fix syntax error",
+                        file_path=file_path,
+                        line_number=line_no,
+                        issue_type="imports",
+                        severity="info",
+                        message=f"Potentially unused import: {import_name}",
+                        suggestion="Remove if truly unused",
                     )
                 )
-                return
-
-            # Run various checks
-            self._check_imports(file_path, tree, content)
-            self._check_complexity(file_path, tree)
-            self._check_documentation(file_path, tree)
-            self._check_type_hints(file_path, tree)
-            self._check_naming_conventions(file_path, tree)
-            self._check_line_length(file_path, content)
-            self._check_code_smells(file_path, tree, content)
-
-        except Exception as e:
-            self.report.add_issue(
+
+
+def _check_line_length(report: QualityReport, file_path: str, content: str) -> None:
+    """Check line length compliance."""
+    lines = content.split("\n")
+    for i, line in enumerate(lines, 1):
+        length = len(line)
+        if length > MAX_LINE_LENGTH:
+            report.add_issue(
                 CodeIssue(
-                    file_path=str(file_path),
-                    line_number=0,
-                    issue_type="analysis",
-                    severity="error",
-                    message=f"Failed to analyze file: {str(e)}",
+                    file_path=file_path,
+                    line_number=i,
+                    issue_type="formatting",
+                    severity="info",
+                    message=f"Line exceeds {MAX_LINE_LENGTH} characters ({length})",
+                    suggestion="Use parentheses, backslashes, or Black formatter to break lines",
                 )
             )
 
-    def _check_imports(self, file_path: Path, tree: ast.AST, content: str) -> None:
-        """Check import - related issues."""
-        imports = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append((alias.name, node.lineno))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append((node.module, node.lineno))
-
-        # Check for potentially unused imports
-        for import_name, line_no in imports:
-            module_name = import_name.split(".")[0]
-            # Simple heuristic: if module only appears once (in import), it
-            # might be unused
-            if content.count(module_name) <= 2:  # Import line + potential use
-                # Skip common imports that might be used implicitly
-                if module_name not in ["typing", "abc", "__future__"]:
-                    self.report.add_issue(
-                        CodeIssue(
-                            file_path=str(file_path),
-                            line_number=line_no,
-                            issue_type="imports",
-                            severity="info",
-                            message=f"Potentially unused import: {import_name}",
-                            suggestion="Remove if truly unused",
-                        )
-                    )
 
-    def _check_complexity(self, file_path: Path, tree: ast.AST) -> None:
-        """Check code complexity."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                complexity = self._calculate_cyclomatic_complexity(node)
-                if complexity > 10:
-                    severity = "warning" if complexity <= 15 else "error"
-                    self.report.add_issue(
-                        CodeIssue(
-                            file_path=str(file_path),
-                            line_number=node.lineno,
-                            issue_type="complexity",
-                            severity=severity,
-                            message=f"High cyclomatic complexity ({complexity}) in function '{
-                                node.name}'",
-                            suggestion="Break down into smaller, more focused functions",
-                        )
-                    )
+def _check_todo_comments(report: QualityReport, file_path: str, content: str) -> None:
+    """Check for TODO / FIXME comments."""
+    # Scan the whole content at once; line numbers are only worked out for
+    # the markers found, counting newlines from the previous one
+    line_number = 1
+    position = 0
+    reported_line = 0
+    for match in _TODO_RE.finditer(content):
+        start = match.start()
+        line_number += content.count("\n", position, start)
+        position = start
+        # Only the first marker on a line is reported
+        if line_number != reported_line:
+            reported_line = line_number
+            keyword = match.group(1)
+            report.add_issue(
+                CodeIssue(
+                    file_path=file_path,
+                    line_number=line_number,
+                    issue_type="maintenance",
+                    severity="info",
+                    message=f"{keyword} comment found",
+                    suggestion="Track and address technical debt",
+                )
+            )
 
-    def _calculate_cyclomatic_complexity(self, node: ast.FunctionDef) -> int:
-        """Calculate cyclomatic complexity of a function."""
-        complexity = 1  # Base complexity
-
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.For, ast.While, ast.With)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-
-        return complexity
-
-    def _check_documentation(self, file_path: Path, tree: ast.AST) -> None:
-        """Check documentation coverage."""
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
-                if not ast.get_docstring(node):
-                    # Skip private and special methods
-                    if not node.name.startswith("_"):
-                        node_type = (
-                            "class" if isinstance(node, ast.ClassDef) else "function"
-                        )
-                        self.report.add_issue(
-                            CodeIssue(
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                issue_type="documentation",
-                                severity="warning",
-                                message=f"Missing docstring for {node_type} '{
-                                    node.name}'",
-                                suggestion="Add comprehensive docstring following project standards",
-                            )
-                        )
 
-    def _check_type_hints(self, file_path: Path, tree: ast.AST) -> None:
-        """Check type hint coverage."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Skip private functions and special methods
-                if node.name.startswith("_"):
-                    continue
+class CodeQualityChecker:
+    """Comprehensive code quality checker."""
 
-                # Check return type annotation
-                if not node.returns:
-                    self.report.add_issue(
-                        CodeIssue(
-                            file_path=str(file_path),
-                            line_number=node.lineno,
-                            issue_type="type_hints",
-                            severity="info",
-                            message=f"Missing return type annotation for function '{
-                                node.name}'",
-                            suggestion="Add return type annotation for better IDE support",
-                        )
-                    )
+    def __init__(
+        self,
+        root_dir: str,
+        use_cache: bool = True,
+        jobs: Optional[int] = None,
+        quiet: bool = False,
+    ):
+        """Initialize the checker.
 
-                # Check parameter type annotations
-                for arg in node.args.args:
-                    if not arg.annotation and arg.arg != "self":
-                        self.report.add_issue(
-                            CodeIssue(
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                issue_type="type_hints",
-                                severity="info",
-                                message=f"Missing type annotation for parameter '{
-                                    arg.arg}' in '{
-                                    node.name}'",
-                                suggestion="Add type annotation for parameter",
-                            )
-                        )
+        Args:
+            root_dir: Root directory to analyze
+            use_cache: Reuse the issues found in file contents analyzed before
+            jobs: Number of worker processes; defaults to the CPU count
+            quiet: Don't list the files as they are analyzed
+        """
+        self.root_dir = Path(root_dir)
+        self.report = QualityReport()
+        self.cache = ContentCache("quality", __file__) if use_cache else None
+        self.manifest = (
+            FileManifest("quality-manifest.json", __file__) if use_cache else None
+        )
+        self.jobs = jobs or os.cpu_count() or 1
+        self.quiet = quiet
 
-    def _check_naming_conventions(self, file_path: Path, tree: ast.AST) -> None:
-        """Check naming convention compliance."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                if not re.match(r"^[A - Z][a - zA - Z0 - 9]*$", node.name):
-                    self.report.add_issue(
-                        CodeIssue(
-                            file_path=str(file_path),
-                            line_number=node.lineno,
-                            issue_type="naming",
-                            severity="warning",
-                            message=f"Class '{
-                                node.name}' doesn't follow PascalCase convention",
-                            suggestion="Use PascalCase for class names (e.g., MyClass)",
-                        )
-                    )
+    def check_all(self) -> QualityReport:
+        """Run all quality checks."""
+        print("🔍 Starting comprehensive code quality analysis...")
 
-            elif isinstance(node, ast.FunctionDef):
-                if not node.name.startswith("__") and not re.match(
-                    r"^[a - z][a - z0 - 9_]*$", node.name
-                ):
-                    self.report.add_issue(
-                        CodeIssue(
-                            file_path=str(file_path),
-                            line_number=node.lineno,
-                            issue_type="naming",
-                            severity="warning",
-                            message=f"Function '{
-                                node.name}' doesn't follow snake_case convention",
-                            suggestion="Use snake_case for function names (e.g., my_function)",
-                        )
-                    )
+        files = find_python_files(self.root_dir, SKIP_DIRS)
+        self.report.total_files = len(files)
 
-    def _check_line_length(self, file_path: Path, content: str) -> None:
-        """Check line length compliance."""
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            if len(line) > 88:  # Black's default
-                self.report.add_issue(
-                    CodeIssue(
-                        file_path=str(file_path),
-                        line_number=i,
-                        issue_type="formatting",
-                        severity="info",
-                        message=f"Line exceeds 88 characters ({
-                            len(line)})",
-                        suggestion="Use parentheses, backslashes, or Black formatter to break lines",
-                    )
-                )
+        # Files unchanged since the last run keep the issues found then
+        known, stats = self._lookup_manifest(files)
+        pending = [f for f in files if f not in known]
 
-    def _check_code_smells(self, file_path: Path, tree: ast.AST, content: str) -> None:
-        """Check for common code smells."""
-        # Check for large functions
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Estimate line count
-                if hasattr(node, "end_lineno"):
-                    line_count = node.end_lineno - node.lineno
-                    if line_count > 50:
-                        self.report.add_issue(
-                            CodeIssue(
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                issue_type="code_smell",
-                                severity="warning",
-                                message=f"Large function '{
-                                    node.name}' (~{line_count} lines)",
-                                suggestion="Consider breaking into smaller, focused functions",
-                            )
-                        )
+        # Files are independent, so larger trees are analyzed in worker
+        # processes; results arrive in file order either way
+        executor = None
+        if self.jobs > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            executor = ProcessPoolExecutor(max_workers=self.jobs)
+            results = executor.map(
+                _check_file, pending, repeat(self.cache), chunksize=16
+            )
+        else:
+            results = map(_check_file, pending, repeat(self.cache))
 
-        # Check for TODO / FIXME comments
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            if re.search(r"(TODO|FIXME|XXX|HACK)", line, re.IGNORECASE):
-                match = re.search(r"(TODO|FIXME|XXX|HACK)", line, re.IGNORECASE)
-                keyword = match.group(1) if match else "TODO"
-                self.report.add_issue(
-                    CodeIssue(
-                        file_path=str(file_path),
-                        line_number=i,
-                        issue_type="maintenance",
-                        severity="info",
-                        message=f"{keyword} comment found",
-                        suggestion="Track and address technical debt",
+        # Progress lines are written in batches rather than one by one
+        progress: List[str] = []
+        key: Optional[str]
+        try:
+            for file_path in files:
+                if not self.quiet:
+                    progress.append(
+                        f"   Analyzing {os.path.relpath(file_path, self.root_dir)}"
                     )
-                )
+                    if len(progress) >= PROGRESS_BATCH:
+                        _write_lines(progress)
+                if file_path in known:
+                    key, issues = known[file_path]
+                else:
+                    key, issues = next(results)
+                self.report.add_issues(issues)
+                if self.manifest is not None and key is not None:
+                    st = stats.get(file_path)
+                    if st is not None:
+                        self.manifest.record(file_path, st, key, _issue_fields(issues))
+        finally:
+            _write_lines(progress)
+            if executor is not None:
+                executor.shutdown()
+
+        if self.manifest is not None:
+            self.manifest.save()
+
+        # Run project - wide checks
+        self._check_architecture_compliance()
+        self._analyze_test_coverage()
+        self._calculate_metrics()
+
+        return self.report
+
+    def _lookup_manifest(
+        self, files: List[str]
+    ) -> Tuple[Dict[str, Tuple[str, List[CodeIssue]]], Dict[str, os.stat_result]]:
+        """Find the files unchanged since the last run.
+
+        Returns:
+            The content hash and issues of each unchanged file, and the
+            ``stat`` of every file
+        """
+        known: Dict[str, Tuple[str, List[CodeIssue]]] = {}
+        stats: Dict[str, os.stat_result] = {}
+        if self.manifest is None:
+            return known, stats
+
+        for file_path in files:
+            st, entry = self.manifest.find_unchanged(file_path)
+            if st is None:
+                continue
+            stats[file_path] = st
+            if entry is None:
+                continue
+            known[file_path] = (entry[2], _hydrate_issues(file_path, entry[3]))
+        return known, stats
 
     def _check_architecture_compliance(self) -> None:
         """Check architectural compliance."""
@@ -447,6 +721,13 @@ class CodeQualityChecker:
         )
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout with a single call, then clear them."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
 def print_report(report: QualityReport) -> None:
     """Print a formatted quality report."""
     print("\n" + "=" * 70)
@@ -460,12 +741,7 @@ def print_report(report: QualityReport) -> None:
     print(f"   🚨 Total issues: {metrics.get('total_issues', 0)}")
     print(f"   📊 Quality score: {metrics.get('quality_score', 0):.1f}/100")
     print(f"   📉 Issues per file: {metrics.get('issues_per_file', 0):.1f}")
-    print(
-        f"   🧪 Test coverage ratio: {
-            metrics.get(
-                'test_coverage_ratio',
-                0):.1%}"
-    )
+    print(f"   🧪 Test coverage ratio: {metrics.get('test_coverage_ratio', 0):.1%}")
 
     # Issues by severity
     errors = report.get_issues_by_severity("error")
@@ -519,6 +795,55 @@ def print_report(report: QualityReport) -> None:
         print(f"   🧪 Improve test coverage")
 
 
+def serialize_issue(obj: Any) -> Dict[str, Any]:
+    """Convert an issue to its exported form during serialization.
+
+    Args:
+        obj: Object the JSON encoder cannot serialize natively
+
+    Returns:
+        Exported fields of the issue
+
+    Raises:
+        TypeError: If obj is not a CodeIssue
+    """
+    if isinstance(obj, CodeIssue):
+        return {
+            "file": obj.file_path,
+            "line": obj.line_number,
+            "type": obj.issue_type,
+            "severity": obj.severity,
+            "message": obj.message,
+            "suggestion": obj.suggestion,
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_export(path: str, export_data: Dict[str, Any]) -> None:
+    """Write an exported report as JSON.
+
+    Args:
+        path: File to write
+        export_data: Data to serialize; issues are converted as they are written
+    """
+    if HAS_ORJSON:
+        # Serialize straight to bytes; dataclasses are passed to the default
+        # hook so the exported keys stay the same
+        with open(path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    export_data,
+                    default=serialize_issue,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS,
+                )
+            )
+    else:
+        import json
+
+        with open(path, "w") as f:
+            json.dump(export_data, f, indent=2, default=serialize_issue)
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -526,6 +851,21 @@ def main():
     parser = argparse.ArgumentParser(description="Code quality checker")
     parser.add_argument("--root", default="core", help="Root directory to analyze")
     parser.add_argument("--export", help="Export results to JSON file")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyze every file instead of reusing cached results",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of worker processes (default: CPU count, 1 to disable)",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Don't list the files as they are analyzed",
+    )
     parser.add_argument(
         "--severity",
         choices=["error", "warning", "info"],
@@ -538,38 +878,31 @@ def main():
         print(f"❌ Error: Directory '{args.root}' does not exist")
         sys.exit(1)
 
-    checker = CodeQualityChecker(args.root)
+    checker = CodeQualityChecker(
+        args.root, use_cache=not args.no_cache, jobs=args.jobs, quiet=args.quiet
+    )
     report = checker.check_all()
 
     if args.severity:
-        filtered_issues = report.get_issues_by_severity(args.severity)
-        report.issues = filtered_issues
+        filtered_report = QualityReport(
+            total_files=report.total_files, metrics=report.metrics
+        )
+        filtered_report.add_issues(report.get_issues_by_severity(args.severity))
+        report = filtered_report
 
     print_report(report)
 
     if args.export:
-        import json
         from datetime import datetime
 
         export_data = {
             "analysis_timestamp": datetime.now().isoformat(),
             "root_directory": str(Path(args.root).resolve()),
             "metrics": report.metrics,
-            "issues": [
-                {
-                    "file": issue.file_path,
-                    "line": issue.line_number,
-                    "type": issue.issue_type,
-                    "severity": issue.severity,
-                    "message": issue.message,
-                    "suggestion": issue.suggestion,
-                }
-                for issue in report.issues
-            ],
+            "issues": report.issues,
         }
 
-        with open(args.export, "w") as f:
-            json.dump(export_data, f, indent=2)
+        write_export(args.export, export_data)
         print(f"\n💾 Report exported to {args.export}")
 
     # Exit with error code if critical issues found
@@ -10,7 +10,11 @@ This formatter applies only basic, safe whitespace fixes:
 
 import argparse
 import ast
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Tuple, Optional
 from dataclasses import dataclass, field
@@ -18,8 +22,28 @@ from dataclasses import dataclass, field
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from content_cache import ContentCache
+from file_manifest import FileManifest
+from source_files import find_python_files
 
-@dataclass
+# Instances drop their __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Directories never formatted
+SKIP_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv"})
+
+# Fewest files worth starting worker processes for
+PARALLEL_MIN_FILES = 64
+
+# Whitespace at the end of a line, as str.rstrip() would remove it
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+(?=\n|\Z)")
+
+# A byte that may be trailing whitespace, right before a line break; any
+# non-ASCII byte counts, since it may be part of a Unicode space
+_DIRTY_LINE_END_RE = re.compile(rb"[ \t\x0b\x0c\x1c-\x1f\x80-\xff][\r\n]")
+
+
+@dataclass(**_SLOTS)
 class FixResult:
     """Result of a code fix operation."""
 
@@ -27,103 +51,208 @@ class FixResult:
     fixes_applied: List[str] = field(default_factory=list)
     success: bool = True
     error_message: Optional[str] = None
+    # Hash of the file content once clean; None while fixes are pending
+    content_hash: Optional[str] = None
 
 
-class FixedCodeFormatter:
-    """Improved code formatter that properly handles multi-line imports."""
+def format_file(
+    file_path: str, check_only: bool, cache: Optional[ContentCache] = None
+) -> FixResult:
+    """Format a single Python file safely.
 
-    def __init__(self, root_dir: str = "core"):
-        """Initialize the formatter."""
-        self.root_dir = Path(root_dir)
-        self.total_files = 0
-        self.files_modified = 0
-        self.total_fixes = 0
+    Kept free of formatter state, and reports through the returned result
+    rather than printing, so that files can be formatted in worker processes.
 
-    def format_all_files(self, check_only: bool = False) -> None:
-        """Format all Python files in the project."""
-        print("🔧 Starting SAFE code formatting...")
-        if check_only:
-            print("   Running in CHECK-ONLY mode")
+    Args:
+        file_path: File to format
+        check_only: Only report the fixes that would be applied
+        cache: Syntax check outcome ("" or the error) by content hash
+
+    Returns:
+        FixResult: Fixes applied, or why the file was skipped
+    """
+    result = FixResult(file_path=file_path)
+
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read()
 
-        python_files = list(self.root_dir.rglob("*.py"))
-        self.total_files = len(python_files)
+        key = ContentCache.key(raw)
 
-        for i, file_path in enumerate(python_files, 1):
-            if self._should_skip_file(file_path):
-                continue
+        # Files already clean are left untouched, so they are neither decoded
+        # nor syntax checked
+        if _is_clean(raw):
+            result.content_hash = key
+            return result
 
-            print(
-                f"   Processing {file_path.relative_to(self.root_dir)} ({i}/{len(python_files)})"
+        # Check syntax first, unless this content was checked before
+        syntax_error = None
+        if cache is not None:
+            syntax_error = cache.get(key)
+        if syntax_error is None:
+            try:
+                compile(raw, file_path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+                syntax_error = ""
+            except SyntaxError as e:
+                syntax_error = f"Syntax error: {e}"
+            if cache is not None:
+                cache.put(key, syntax_error)
+        if syntax_error:
+            result.success = False
+            result.error_message = syntax_error
+            return result
+
+        # Decode once, translating newlines as text mode reading would
+        original_content = raw.decode("utf-8")
+        if "\r" in original_content:
+            original_content = original_content.replace("\r\n", "\n").replace(
+                "\r", "\n"
             )
+        content = original_content
 
-            result = self._format_file(file_path, check_only)
-            if result.fixes_applied:
-                self.files_modified += 1
-                self.total_fixes += len(result.fixes_applied)
+        # Only apply very safe fixes
+        content, fixes = _fix_safe_whitespace(content)
+        result.fixes_applied.extend(fixes)
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """Check if file should be skipped."""
-        skip_patterns = ["__pycache__", ".git", ".venv", "venv"]
-        return any(pattern in str(file_path) for pattern in skip_patterns)
+        if not fixes:
+            result.content_hash = key
+        elif not check_only:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            result.content_hash = ContentCache.key(content.encode("utf-8"))
 
-    def _format_file(self, file_path: Path, check_only: bool) -> FixResult:
-        """Format a single Python file safely."""
-        result = FixResult(file_path=str(file_path))
+    except Exception as e:
+        result.success = False
+        result.error_message = str(e)
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                original_content = f.read()
+    return result
 
-            # Check syntax first
-            try:
-                ast.parse(original_content)
-            except SyntaxError as e:
-                result.success = False
-                result.error_message = f"Syntax error: {e}"
-                print(f"      ❌ Skipping file with syntax error")
-                return result
 
-            content = original_content
+def _is_clean(raw: bytes) -> bool:
+    """Check from the raw bytes whether a file needs no whitespace fixes.
 
-            # Only apply very safe fixes
-            content, fixes = self._fix_safe_whitespace(content)
-            result.fixes_applied.extend(fixes)
+    Never true for a file that needs fixes; may be false for one that does not.
+    """
+    if raw and not raw.endswith((b"\n", b"\r")):
+        return False
+    return _DIRTY_LINE_END_RE.search(raw) is None
 
-            if content != original_content and not check_only:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                print(f"      ✅ Applied {len(result.fixes_applied)} safe fixes")
-            elif content != original_content:
-                print(f"      🔍 Would apply {len(result.fixes_applied)} safe fixes")
 
-        except Exception as e:
-            result.success = False
-            result.error_message = str(e)
-            print(f"      ❌ Error: {e}")
+def _fix_safe_whitespace(content: str) -> Tuple[str, List[str]]:
+    """Apply only very safe whitespace fixes."""
+    fixes = []
 
-        return result
+    # Remove trailing whitespace
+    cleaned = _TRAILING_WS_RE.sub("", content)
+    if cleaned != content:
+        fixes.append("Removed trailing whitespace")
+    content = cleaned
 
-    def _fix_safe_whitespace(self, content: str) -> Tuple[str, List[str]]:
-        """Apply only very safe whitespace fixes."""
-        fixes = []
+    # Ensure file ends with newline
+    if content and not content.endswith("\n"):
+        content += "\n"
+        fixes.append("Added newline at end")
 
-        # Remove trailing whitespace
-        lines = content.split("\n")
-        cleaned_lines = []
-        for line in lines:
-            cleaned = line.rstrip()
-            if cleaned != line:
-                fixes.append("Removed trailing whitespace")
-            cleaned_lines.append(cleaned)
+    return content, fixes
 
-        content = "\n".join(cleaned_lines)
 
-        # Ensure file ends with newline
-        if content and not content.endswith("\n"):
-            content += "\n"
-            fixes.append("Added newline at end")
+class FixedCodeFormatter:
+    """Improved code formatter that properly handles multi-line imports."""
+
+    def __init__(
+        self, root_dir: str = "core", use_cache: bool = True, jobs: Optional[int] = None
+    ):
+        """Initialize the formatter."""
+        self.root_dir = Path(root_dir)
+        # Syntax check outcome ("" or the error) by content hash
+        self.cache = ContentCache("format", __file__) if use_cache else None
+        # Files left clean by the last run
+        self.manifest = (
+            FileManifest("format-manifest.json", __file__) if use_cache else None
+        )
+        self.jobs = jobs or os.cpu_count() or 1
+        self.total_files = 0
+        self.files_modified = 0
+        self.total_fixes = 0
+
+    def format_all_files(self, check_only: bool = False) -> None:
+        """Format all Python files in the project."""
+        print("🔧 Starting SAFE code formatting...")
+        if check_only:
+            print("   Running in CHECK-ONLY mode")
+
+        paths = find_python_files(self.root_dir, SKIP_DIRS)
+        self.total_files = len(paths)
+
+        # Files left clean by the last run and unchanged since are skipped
+        # without being parsed
+        clean = {}
+        if self.manifest is not None:
+            for file_path in paths:
+                st, entry = self.manifest.find_unchanged(file_path)
+                if entry is not None:
+                    clean[file_path] = entry[2]
+        pending = [p for p in paths if p not in clean]
+
+        # Larger trees are formatted in worker processes; results arrive in
+        # file order either way
+        executor = None
+        if self.jobs > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            executor = ProcessPoolExecutor(max_workers=self.jobs)
+            results = executor.map(
+                format_file,
+                pending,
+                repeat(check_only),
+                repeat(self.cache),
+                chunksize=16,
+            )
+        else:
+            results = map(format_file, pending, repeat(check_only), repeat(self.cache))
 
-        return content, fixes
+        try:
+            for i, file_path in enumerate(paths, 1):
+                if file_path in clean:
+                    result = FixResult(
+                        file_path=file_path, content_hash=clean[file_path]
+                    )
+                else:
+                    result = next(results)
+                print(
+                    f"   Processing {os.path.relpath(file_path, self.root_dir)} ({i}/{len(paths)})"
+                )
+                self._print_result(result, check_only)
+                if result.fixes_applied:
+                    self.files_modified += 1
+                    self.total_fixes += len(result.fixes_applied)
+                self._record_clean(result)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.manifest is not None:
+            self.manifest.save()
+
+    def _record_clean(self, result: FixResult) -> None:
+        """Remember a file that was left clean, for the next run."""
+        if self.manifest is None or result.content_hash is None:
+            return
+        try:
+            st = os.stat(result.file_path)
+        except OSError:
+            return
+        self.manifest.record(result.file_path, st, result.content_hash, None)
+
+    def _print_result(self, result: FixResult, check_only: bool) -> None:
+        """Print the outcome of formatting a file."""
+        if not result.success:
+            if (result.error_message or "").startswith("Syntax error"):
+                print(f"      ❌ Skipping file with syntax error")
+            else:
+                print(f"      ❌ Error: {result.error_message}")
+        elif result.fixes_applied and not check_only:
+            print(f"      ✅ Applied {len(result.fixes_applied)} safe fixes")
+        elif result.fixes_applied:
+            print(f"      🔍 Would apply {len(result.fixes_applied)} safe fixes")
 
 
 def main():
@@ -131,20 +260,25 @@ def main():
     parser = argparse.ArgumentParser(description="Safe code formatter")
     parser.add_argument("--root", default="core", help="Root directory")
     parser.add_argument("--check-only", action="store_true", help="Check only")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-check the syntax of every file"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of worker processes (default: CPU count, 1 to disable)",
+    )
 
     args = parser.parse_args()
 
-    formatter = FixedCodeFormatter(args.root)
+    formatter = FixedCodeFormatter(
+        args.root, use_cache=not args.no_cache, jobs=args.jobs
+    )
     formatter.format_all_files(args.check_only)
 
+    print(f"\n✅ Safe formatting complete! Processed {formatter.total_files} files")
     print(
-        f"\n✅ Safe formatting complete! Processed {
-            formatter.total_files} files"
-    )
-    print(
-        f"   Modified {
-            formatter.files_modified} files with {
-            formatter.total_fixes} fixes"
+        f"   Modified {formatter.files_modified} files with {formatter.total_fixes} fixes"
     )
 
 
@@ -0,0 +1,91 @@
+"""
+Content-addressed result cache for the refactoring tools.
+
+Results computed from a file's content (the issues found by the quality
+checker, whether the formatter's syntax check passed) are stored on disk
+under the SHA-256 of that content, so warm runs skip parsing files that have
+been seen before. Entries live in ``.cache/ast/<namespace>/{sha[:2]}/{sha[2:]}.pkl``
+and the whole namespace is dropped when the Python version or the tool
+changes, since both affect what the parser and the checks produce.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_ROOT = Path(__file__).parent.parent.parent / ".cache" / "ast"
+
+
+def tool_version(tool_file: str) -> str:
+    """Get the version of a tool's cached results.
+
+    Args:
+        tool_file: Source file of the tool
+
+    Returns:
+        The Python version and a hash of the tool's source
+    """
+    tool_hash = hashlib.sha256(Path(tool_file).read_bytes()).hexdigest()[:16]
+    return f"py{sys.version_info.major}.{sys.version_info.minor}-{tool_hash}"
+
+
+class ContentCache:
+    """Pickled per-content results stored on disk."""
+
+    def __init__(self, namespace: str, tool_file: str):
+        """Initialize the cache.
+
+        Args:
+            namespace: Subdirectory of the cache root used by the tool
+            tool_file: Source file of the tool; its hash is part of the cache version
+        """
+        self.cache_dir = CACHE_ROOT / namespace
+        self.version = tool_version(tool_file)
+        self._check_version()
+
+    def _check_version(self) -> None:
+        """Drop all entries written by another Python version or tool version."""
+        version_file = self.cache_dir / "version"
+        try:
+            if version_file.read_text(encoding="utf-8") == self.version:
+                return
+        except OSError:
+            pass
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            version_file.write_text(self.version, encoding="utf-8")
+        except OSError:
+            pass
+
+    @staticmethod
+    def key(content: bytes) -> str:
+        """Get the cache key of some file content."""
+        return hashlib.sha256(content).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key[2:]}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the result stored for a key, or None when there is none."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store the result for a key; failures to write are ignored."""
+        path = self._path(key)
+        try:
+            os.makedirs(path.parent, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
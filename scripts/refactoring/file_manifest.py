@@ -0,0 +1,102 @@
+"""
+Per-path manifest of the files seen by the last run of a refactoring tool.
+
+Each entry records a file's modification time, size and content hash along
+with whatever the tool wants to remember about it, so the next run can tell
+from a single ``stat`` that a file has not changed. The manifest is a JSON
+file under ``.cache/`` and is discarded when the Python version or the tool
+changes.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from content_cache import CACHE_ROOT, ContentCache, tool_version
+
+
+class FileManifest:
+    """Results of the last run, keyed by file path."""
+
+    def __init__(self, name: str, tool_file: str):
+        """Load the manifest.
+
+        Args:
+            name: File name of the manifest under ``.cache/``
+            tool_file: Source file of the tool; its hash is part of the manifest version
+        """
+        self.path = CACHE_ROOT.parent / name
+        self.version = tool_version(tool_file)
+        self.entries: Dict[str, list] = {}
+        self._seen: Dict[str, list] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.version:
+                self.entries = data["files"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def lookup(self, path: str, st: os.stat_result) -> Optional[list]:
+        """Get the entry of a file whose modification time and size are unchanged.
+
+        Args:
+            path: File path
+            st: Current ``stat`` of the file
+
+        Returns:
+            ``[mtime_ns, size, sha256, data]``, or None when the file changed
+            or was not seen before
+        """
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry
+        return None
+
+    def find_unchanged(
+        self, path: str
+    ) -> Tuple[Optional[os.stat_result], Optional[list]]:
+        """Check whether a file is unchanged since the last run.
+
+        A file whose modification time and size match its entry is
+        unchanged; one where they differ is read and compared by content
+        hash, so files that were only touched still count as unchanged.
+
+        Args:
+            path: File path
+
+        Returns:
+            The current ``stat`` of the file (None when it cannot be read)
+            and its entry, or None for the entry when the file changed
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, None
+        entry = self.lookup(path, st)
+        if entry is None:
+            entry = self.entries.get(path)
+            if entry is None:
+                return st, None
+            try:
+                with open(path, "rb") as f:
+                    if ContentCache.key(f.read()) != entry[2]:
+                        return st, None
+            except OSError:
+                return st, None
+        return st, entry
+
+    def record(self, path: str, st: os.stat_result, sha256: str, data: Any) -> None:
+        """Record a file seen in this run."""
+        self._seen[path] = [st.st_mtime_ns, st.st_size, sha256, data]
+
+    def save(self) -> None:
+        """Write the files seen in this run; failures to write are ignored."""
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            os.makedirs(self.path.parent, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "files": self._seen}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
@@ -0,0 +1,44 @@
+"""
+Python source file discovery for the refactoring tools.
+"""
+
+import os
+from typing import AbstractSet, List, Union
+
+
+def find_python_files(
+    root: Union[str, os.PathLike], skip_dirs: AbstractSet[str]
+) -> List[str]:
+    """Find the Python files under a directory.
+
+    The tree is walked with ``os.scandir``, whose entries already know
+    whether they are directories, so no file needs a ``stat`` of its own.
+    Directories named in ``skip_dirs`` are pruned without being read, and
+    symlinked directories are not followed.
+
+    Args:
+        root: Directory to search
+        skip_dirs: Names of directories to leave out
+
+    Returns:
+        Paths of the files, sorted
+    """
+    files = []
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Paths under the current directory are kept without a
+                    # leading "./", as pathlib would give them
+                    path = entry.name if directory == os.curdir else entry.path
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            pending.append(path)
+                    elif entry.name.endswith(".py"):
+                        files.append(path)
+        except OSError:
+            continue
+    files.sort()
+    return files
@@ -6,67 +6,212 @@ from test files and test results.
 """
 
 import pytest
-import json
+from contextlib import closing, redirect_stdout
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import logging
-import subprocess
-import sys
+import os
+import sqlite3
+
+try:
+    import xdist
+    HAS_XDIST = True
+except ImportError:
+    HAS_XDIST = False
 
 logger = logging.getLogger(__name__)
 
+class _ResultCollector:
+    """Pytest plugin collecting test outcomes as they are reported."""
+
+    def __init__(self):
+        self.tests: List[Dict[str, Any]] = []
+        self.counts: Dict[str, int] = {}
+        self.collected: List[str] = []
+        self.total = 0
+
+    def pytest_collection_finish(self, session):
+        self.collected = [item.nodeid for item in session.items]
+
+    def pytest_runtest_logreport(self, report):
+        # Outcomes come from the call phase, except for tests skipped or
+        # broken before they could run
+        if report.when == "call":
+            outcome = report.outcome
+        elif report.when == "setup" and not report.passed:
+            outcome = "error" if report.failed else report.outcome
+        else:
+            return
+
+        test = {"nodeid": report.nodeid, "outcome": outcome}
+        if report.longrepr:
+            test["call"] = {"longrepr": str(report.longrepr)}
+        self.tests.append(test)
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.total = session.testscollected
+
+    def results(self) -> Dict[str, Any]:
+        """Get the collected results in the form the documentation uses."""
+        return {
+            'total': self.total, 
+            'passed': self.counts.get('passed', 0), 
+            'failed': self.counts.get('failed', 0), 
+            'skipped': self.counts.get('skipped', 0), 
+            'errors': self.counts.get('error', 0), 
+            'tests': self.tests
+        }
+
+    def collected_results(self) -> Dict[str, Any]:
+        """Get the collected tests, for a session that did not run them."""
+        return {
+            'total': len(self.collected), 
+            'collect_only': True, 
+            'tests': [{'nodeid': nodeid} for nodeid in self.collected]
+        }
+
 class TestDocGenerator:
     """Generates test documentation."""
 
-    def __init__(self, code_dir: Path):
+    def __init__(self, code_dir: Path, cache_path: Optional[Path] = None):
         self.code_dir = code_dir
+        # SQLite database remembering the test files found by earlier runs
+        self.cache_path = cache_path
         self.test_files = []
         self.test_results = {}
 
     def discover_tests(self):
         """Discover test files in the codebase."""
-        for py_file in self.code_dir.rglob("test_*.py"):
-            self.test_files.append(py_file)
+        cached = self._load_discovered(self.cache_path) if self.cache_path else None
+        if cached is not None:
+            self.test_files.extend(cached)
+        else:
+            directories, test_files = self._walk_tests()
+            self.test_files.extend(test_files)
+            if self.cache_path:
+                self._save_discovered(self.cache_path, directories, test_files)
         logger.info(f"Found {len(self.test_files)} test files")
 
-    def run_tests(self):
-        """Run tests and collect results."""
-        # Run pytest with minimal output and JSON report
-        cmd = [
-            sys.executable, "-m", "pytest", 
-            "--json - report", 
-            "--json - report - file = none", 
-            "--quiet"
-        ]
+    def _walk_tests(self) -> Tuple[Dict[str, int], List[Path]]:
+        """Find the test files, noting the modification time of every directory."""
+        directories: Dict[str, int] = {}
+        test_files: List[Path] = []
+        for root, _, names in os.walk(self.code_dir):
+            directories[root] = os.stat(root).st_mtime_ns
+            for name in names:
+                if name.startswith("test_") and name.endswith(".py"):
+                    test_files.append(Path(root) / name)
+        return directories, test_files
+
+    @staticmethod
+    def _connect(cache_path: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(cache_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS directories("
+            "root TEXT, path TEXT, mtime_ns INTEGER, PRIMARY KEY(root, path))"
+)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS discovered("
+            "root TEXT, path TEXT, PRIMARY KEY(root, path))"
+)
+        return conn
 
+    def _load_discovered(self, cache_path: Path) -> Optional[List[Path]]:
+        """Get the test files found by the last run, if no directory changed since.
+
+        Adding, removing or renaming a file changes the modification time of
+        its directory, so one stat per directory replaces the walk.
+        """
+        root = str(self.code_dir.resolve())
+        try:
+            with closing(self._connect(cache_path)) as conn:
+                directories = conn.execute(
+                    "SELECT path, mtime_ns FROM directories WHERE root = ?", (root, )
+                ).fetchall()
+                if not directories:
+                    return None
+                for path, mtime_ns in directories:
+                    if os.stat(self.code_dir / path).st_mtime_ns != mtime_ns:
+                        return None
+                rows = conn.execute(
+                    "SELECT path FROM discovered WHERE root = ?", (root, )
+                ).fetchall()
+        except (OSError, sqlite3.Error):
+            return None
+        return [self.code_dir / path for (path, ) in rows]
+
+    def _save_discovered(
+        self, 
+        cache_path: Path, 
+        directories: Dict[str, int], 
+        test_files: List[Path]
+):
+        """Remember the test files found, with the directories they were found in."""
+        root = str(self.code_dir.resolve())
         try:
-            result = subprocess.run(cmd, capture_output = True, text = True)
-            if result.returncode == 0:
+            with closing(self._connect(cache_path)) as conn, conn:
+                conn.execute("DELETE FROM directories WHERE root = ?", (root, ))
+                conn.execute("DELETE FROM discovered WHERE root = ?", (root, ))
+                conn.executemany(
+                    "INSERT INTO directories VALUES (?, ?, ?)", 
+                    [
+                        (root, os.path.relpath(path, self.code_dir), mtime_ns)
+                        for path, mtime_ns in directories.items()
+                    ]
+)
+                conn.executemany(
+                    "INSERT INTO discovered VALUES (?, ?)", 
+                    [(root, str(path.relative_to(self.code_dir))) for path in test_files]
+)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache discovered tests: {e}")
+
+    def run_tests(self, collect_only: bool = False):
+        """Run tests and collect results.
+
+        Args:
+            collect_only: Only collect the tests, without running them
+        """
+        # Run pytest in this process, collecting the outcomes through a
+        # plugin instead of parsing a report out of its output
+        collector = _ResultCollector()
+        args = ["-q", "-p", "no:cacheprovider"]
+        if collect_only:
+            args.append("--collect-only")
+        elif HAS_XDIST and (os.cpu_count() or 1) > 1:
+            # Run in worker processes, keeping each file's tests together so
+            # module fixtures are built once
+            args += ["-n", "auto", "--dist=loadfile"]
+
+        try:
+            # The terminal output is not used, so it is discarded as it is
+            # written rather than held in memory
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                exit_code = pytest.main(args, plugins = [collector])
+            if collect_only:
+                self.test_results = collector.collected_results()
+                logger.info(f"Collected {self.test_results['total']} tests")
+                return
+
+            if exit_code == pytest.ExitCode.OK:
                 logger.info("All tests passed")
             else:
                 logger.warning("Some tests failed")
 
-            # Parse test results from output
-            self._parse_test_results(result.stdout)
+            self.test_results = collector.results()
         except Exception as e:
             logger.error(f"Error running tests: {e}")
 
-    def _parse_test_results(self, output: str):
-        """Parse test results from pytest output."""
-        try:
-            # Extract JSON report from output
-            json_start = output.find('{')
-            json_end = output.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = output[json_start:json_end]
-                self.test_results = json.loads(json_str)
-        except Exception as e:
-            logger.error(f"Error parsing test results: {e}")
+    def generate_test_docs(self, run: bool = True) -> str:
+        """Generate test documentation.
 
-    def generate_test_docs(self) -> str:
-        """Generate test documentation."""
+        Args:
+            run: Run the tests and report their results; when False the tests
+                are only collected, which is much faster
+        """
         self.discover_tests()
-        self.run_tests()
+        self.run_tests(collect_only = not run)
 
         docs = []
         docs.append("# Test Documentation\n")
@@ -78,7 +223,10 @@ class TestDocGenerator:
 
         # Add test results section
         docs.append("\n## Test Results\n")
-        if self.test_results:
+        if self.test_results.get('collect_only'):
+            docs.append(f"- Total Tests: {self.test_results.get('total', 0)}\n")
+            docs.append("Tests were collected but not run.\n")
+        elif self.test_results:
             total = self.test_results.get('total', 0)
             passed = self.test_results.get('passed', 0)
             failed = self.test_results.get('failed', 0)
@@ -102,14 +250,19 @@ class TestDocGenerator:
         docs.append("\n## Test Coverage\n")
         docs.append("Run the following command to generate test coverage report:\n")
         docs.append("```bash\n")
-        docs.append("pytest --cov = src tests/\n")
+        docs.append("pytest --cov=core tests/\n")
         docs.append("```\n")
 
         return '\n'.join(docs)
 
-    def update_test_docs(self, output_file: Path):
-        """Update the test documentation file."""
-        content = self.generate_test_docs()
+    def update_test_docs(self, output_file: Path, run_tests: bool = True):
+        """Update the test documentation file.
+
+        Args:
+            output_file: File to write the documentation to
+            run_tests: Run the tests; when False only the collected tests are listed
+        """
+        content = self.generate_test_docs(run = run_tests)
         with open(output_file, 'w', encoding='utf - 8') as f:
             f.write(content)
 
@@ -11,27 +11,22 @@ from core.domain.recipe.models.ingredient import Ingredient
 from core.domain.recipe.models.metadata import RecipeMetadata
 from core.domain.recipe.models.recipe import Recipe
 from core.infrastructure.notion.sync import NotionSync
-import os
 
 from unittest.mock import patch, MagicMock, AsyncMock
 
 @pytest.fixture(autouse = True)
 
-def setup_env():
-    """Set up test environment variables."""
-    os.environ["NOTION_TOKEN"] = "test_token"
-    os.environ["NOTION_RECETAS_DB"] = "test_recipes_db"
-    os.environ["NOTION_INGREDIENTES_DB"] = "test_ingredients_db"
-    os.environ["NOTION_ALACENA_DB"] = "test_pantry_db"
-    yield
-    # Cleanup
-    for var in ["NOTION_TOKEN", "NOTION_RECETAS_DB", "NOTION_INGREDIENTES_DB", "NOTION_ALACENA_DB"]:
-        os.environ.pop(var, None)
+def setup_env(monkeypatch):
+    """Set up test environment variables, restored by monkeypatch after each test."""
+    monkeypatch.setenv("NOTION_TOKEN", "test_token")
+    monkeypatch.setenv("NOTION_RECETAS_DB", "test_recipes_db")
+    monkeypatch.setenv("NOTION_INGREDIENTES_DB", "test_ingredients_db")
+    monkeypatch.setenv("NOTION_ALACENA_DB", "test_pantry_db")
 
-@pytest.fixture
+@pytest.fixture(scope = "module")
 
 def test_recipe():
-    """Create a test recipe."""
+    """Create a test recipe, shared by the tests of this module, which only read it."""
     return Recipe(
         title="Test Recipe",
         metadata = RecipeMetadata(
@@ -59,7 +54,33 @@ def test_recipe():
         ]
 )
 
-def test_validate_env_vars():
+@pytest.fixture(scope = "session")
+
+def _notion_sync_template():
+    """Create the NotionSync mock once, as building it from the spec is costly."""
+    return AsyncMock(spec = NotionSync)
+
+@pytest.fixture(scope = "session")
+
+def _processor_template():
+    """Create the RecipeProcessor mock once, as building it from the spec is costly."""
+    return AsyncMock(spec = RecipeProcessor)
+
+@pytest.fixture
+
+def mock_notion_sync(_notion_sync_template):
+    """Get the NotionSync mock with the calls and setup of earlier tests cleared."""
+    _notion_sync_template.reset_mock(return_value = True, side_effect = True)
+    return _notion_sync_template
+
+@pytest.fixture
+
+def mock_processor(_processor_template):
+    """Get the RecipeProcessor mock with the calls and setup of earlier tests cleared."""
+    _processor_template.reset_mock(return_value = True, side_effect = True)
+    return _processor_template
+
+def test_validate_env_vars(monkeypatch):
     """Test environment variable validation."""
     # Test with all variables set
     result = validate_env_vars()
@@ -68,21 +89,19 @@ def test_validate_env_vars():
     assert result["Alacena"] == "test_pantry_db"
 
     # Test with missing variables
-    os.environ.pop("NOTION_TOKEN")
+    monkeypatch.delenv("NOTION_TOKEN")
     with pytest.raises(Exception) as exc_info:
         validate_env_vars()
     assert "Missing required environment variables" in str(exc_info.value)
 
 @pytest.mark.asyncio
-async def test_process_single_recipe(test_recipe):
+async def test_process_single_recipe(test_recipe, mock_notion_sync, mock_processor, tmp_path):
     """Test processing a single recipe."""
     # Mock dependencies
-    mock_notion_sync = AsyncMock(spec = NotionSync)
-    mock_processor = AsyncMock(spec = RecipeProcessor)
     mock_progress_bar = MagicMock()
 
     # Mock recipe processing (async method)
-    mock_processor.process_recipe = AsyncMock(return_value=test_recipe)
+    mock_processor.process_recipe.return_value = test_recipe
 
     # Mock Notion sync operations
     mock_notion_sync.sync_pantry_item.return_value = "test_pantry_id"
@@ -90,67 +109,53 @@ async def test_process_single_recipe(test_recipe):
     mock_notion_sync.sync_recipe.return_value = "test_recipe_id"
 
     # Create test file
-    test_file = Path("test_recipe.txt")
+    test_file = tmp_path / "test_recipe.txt"
     test_file.write_text("Test recipe content")
 
-    try:
-        # Process recipe
-        result = await process_single_recipe(
-            test_file, 
-            mock_notion_sync, 
-            mock_processor, 
-            mock_progress_bar
+    # Process recipe
+    result = await process_single_recipe(
+        test_file, 
+        mock_notion_sync, 
+        mock_processor, 
+        mock_progress_bar
 )
 
-        # Verify result
-        assert result is True
-
-        # Verify calls
-        mock_processor.process_recipe.assert_called_once()
-        assert mock_notion_sync.sync_pantry_item.call_count == 2  # One for each ingredient
-        assert mock_notion_sync.sync_ingredient.call_count == 2
-        mock_notion_sync.sync_recipe.assert_called_once()
-        assert mock_notion_sync.update_ingredient_with_recipe.call_count == 2
+    # Verify result
+    assert result is True
 
-    finally:
-        # Cleanup
-        if test_file.exists():
-            test_file.unlink()
+    # Verify calls
+    mock_processor.process_recipe.assert_called_once()
+    assert mock_notion_sync.sync_pantry_item.call_count == 2  # One for each ingredient
+    assert mock_notion_sync.sync_ingredient.call_count == 2
+    mock_notion_sync.sync_recipe.assert_called_once()
+    assert mock_notion_sync.update_ingredient_with_recipe.call_count == 2
 
 @pytest.mark.asyncio
-async def test_process_single_recipe_error(test_recipe):
+async def test_process_single_recipe_error(test_recipe, mock_notion_sync, mock_processor, tmp_path):
     """Test error handling in recipe processing."""
     # Mock dependencies
-    mock_notion_sync = AsyncMock(spec = NotionSync)
-    mock_processor = AsyncMock(spec = RecipeProcessor)
     mock_progress_bar = MagicMock()
 
     # Mock error
     mock_processor.process_recipe.side_effect = Exception("Test error")
 
     # Create test file
-    test_file = Path("test_recipe.txt")
+    test_file = tmp_path / "test_recipe.txt"
     test_file.write_text("Test recipe content")
 
-    try:
-        # Process recipe
-        result = await process_single_recipe(
-            test_file, 
-            mock_notion_sync, 
-            mock_processor, 
-            mock_progress_bar
+    # Process recipe
+    result = await process_single_recipe(
+        test_file, 
+        mock_notion_sync, 
+        mock_processor, 
+        mock_progress_bar
 )
 
-        # Verify result
-        assert result is False
-
-        # Verify error handling
-        mock_progress_bar.update.assert_called_with(1, "ERROR: test_recipe.txt failed: Test error")
+    # Verify result
+    assert result is False
 
-    finally:
-        # Cleanup
-        if test_file.exists():
-            test_file.unlink()
+    # Verify error handling
+    mock_progress_bar.update.assert_called_with(1, "ERROR: test_recipe.txt failed: Test error")
 
 def test_cli_commands():
     """Test CLI commands."""
@@ -5,9 +5,12 @@ This module tests the complete recipe processing pipeline using actual
 recipe files from the fixtures directory, validating end-to-end functionality.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from core.application.recipe.extractors.text import TextExtractor
 from core.application.recipe.processor import RecipeProcessor
@@ -17,14 +20,53 @@ from core.domain.recipe.extractors.sections import SectionExtractor
 from core.domain.recipe.models.recipe import Recipe
 
 
+def _text_of(extracted_texts: Dict[Path, Union[str, Exception]], file_path: Path) -> str:
+    """Get the extracted text of a file, re-raising the error its extraction hit."""
+    content = extracted_texts[file_path]
+    if isinstance(content, Exception):
+        raise content
+    return content
+
+
+def _extract_text(file_path: Path) -> Union[str, Exception]:
+    """Extract the text of a file, or get the error its extraction hit."""
+    try:
+        return TextExtractor().extract(str(file_path))
+    except Exception as e:
+        return e
+
+
+@pytest.fixture(scope="module")
+def real_recipe_files() -> List[Path]:
+    """Get all real recipe files from fixtures."""
+    fixture_dir = Path("tests/fixtures/recipes/sin_procesar")
+    if not fixture_dir.exists():
+        pytest.skip(f"Fixture directory {fixture_dir} not found")
+
+    files = list(fixture_dir.glob("*.txt"))
+    if not files:
+        pytest.skip(f"No recipe files found in {fixture_dir}")
+
+    return files
+
+
+@pytest.fixture(scope="module")
+def extracted_texts(real_recipe_files) -> Dict[Path, Union[str, Exception]]:
+    """Extract the text of every real recipe file once for all the tests.
+
+    Files whose extraction fails map to the error, so each test still
+    reports the failure for that file. With ``RECIPE_TESTS_PARALLEL=1`` the
+    files are extracted in a process pool across the CPU cores.
+    """
+    if os.environ.get("RECIPE_TESTS_PARALLEL") == "1" and len(real_recipe_files) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return dict(zip(real_recipe_files, executor.map(_extract_text, real_recipe_files)))
+    return {file_path: _extract_text(file_path) for file_path in real_recipe_files}
+
+
 class TestRealFileProcessing:
     """Test recipe processing with real files."""
 
-    @pytest.fixture
-    def text_extractor(self):
-        """Create a text extractor instance."""
-        return TextExtractor()
-
     @pytest.fixture
     def ingredient_extractor(self):
         """Create an ingredient extractor instance."""
@@ -40,26 +82,13 @@ class TestRealFileProcessing:
         """Create a section extractor instance."""
         return SectionExtractor()
 
-    @pytest.fixture
-    def real_recipe_files(self) -> List[Path]:
-        """Get all real recipe files from fixtures."""
-        fixture_dir = Path("tests/fixtures/recipes/sin_procesar")
-        if not fixture_dir.exists():
-            pytest.skip(f"Fixture directory {fixture_dir} not found")
-        
-        files = list(fixture_dir.glob("*.txt"))
-        if not files:
-            pytest.skip(f"No recipe files found in {fixture_dir}")
-        
-        return files
-
-    def test_text_extraction_from_real_files(self, text_extractor, real_recipe_files):
+    def test_text_extraction_from_real_files(self, extracted_texts, real_recipe_files):
         """Test text extraction from real recipe files."""
         successful_extractions = 0
         
         for file_path in real_recipe_files:
             try:
-                content = text_extractor.extract(str(file_path))
+                content = _text_of(extracted_texts, file_path)
                 
                 # Verify we extracted something
                 assert isinstance(content, str), f"Content should be string for {file_path.name}"
@@ -90,14 +119,14 @@ class TestRealFileProcessing:
         assert successful_extractions > 0, f"Should extract content from at least some files, got {successful_extractions}/{len(real_recipe_files)}"
         print(f"Successfully extracted content from {successful_extractions}/{len(real_recipe_files)} files")
 
-    def test_ingredient_extraction_from_real_files(self, text_extractor, ingredient_extractor, real_recipe_files):
+    def test_ingredient_extraction_from_real_files(self, extracted_texts, ingredient_extractor, real_recipe_files):
         """Test ingredient extraction from real recipe files."""
         successful_extractions = 0
         
         for file_path in real_recipe_files[:5]:  # Test first 5 files to keep it manageable
             try:
-                # Extract text first
-                content = text_extractor.extract(str(file_path))
+                # Get the extracted text first
+                content = _text_of(extracted_texts, file_path)
                 if not content.strip():
                     continue
                 
@@ -121,14 +150,14 @@ class TestRealFileProcessing:
         
         print(f"Successfully extracted ingredients from {successful_extractions}/{min(5, len(real_recipe_files))} files")
 
-    def test_metadata_extraction_from_real_files(self, text_extractor, metadata_extractor, real_recipe_files):
+    def test_metadata_extraction_from_real_files(self, extracted_texts, metadata_extractor, real_recipe_files):
         """Test metadata extraction from real recipe files."""
         successful_extractions = 0
         
         for file_path in real_recipe_files[:5]:  # Test first 5 files
             try:
-                # Extract text first
-                content = text_extractor.extract(str(file_path))
+                # Get the extracted text first
+                content = _text_of(extracted_texts, file_path)
                 if not content.strip():
                     continue
                 
@@ -152,14 +181,14 @@ class TestRealFileProcessing:
         
         print(f"Successfully extracted metadata from {successful_extractions}/{min(5, len(real_recipe_files))} files")
 
-    def test_section_extraction_from_real_files(self, text_extractor, section_extractor, real_recipe_files):
+    def test_section_extraction_from_real_files(self, extracted_texts, section_extractor, real_recipe_files):
         """Test section extraction from real recipe files."""
         successful_extractions = 0
         
         for file_path in real_recipe_files[:5]:  # Test first 5 files
             try:
-                # Extract text first
-                content = text_extractor.extract(str(file_path))
+                # Get the extracted text first
+                content = _text_of(extracted_texts, file_path)
                 if not content.strip():
                     continue
                 
@@ -186,7 +215,7 @@ class TestRealFileProcessing:
         print(f"Successfully extracted sections from {successful_extractions}/{min(5, len(real_recipe_files))} files")
 
     @pytest.mark.slow
-    def test_complete_pipeline_with_real_files(self, real_recipe_files):
+    def test_complete_pipeline_with_real_files(self, extracted_texts, real_recipe_files):
         """Test the complete processing pipeline with real files."""
         if len(real_recipe_files) == 0:
             pytest.skip("No real recipe files available")
@@ -196,8 +225,7 @@ class TestRealFileProcessing:
         
         try:
             # Step 1: Extract text
-            text_extractor = TextExtractor()
-            content = text_extractor.extract(str(test_file))
+            content = _text_of(extracted_texts, test_file)
             
             assert content.strip(), f"Should extract text content from {test_file.name}"
             print(f"✓ Step 1: Extracted {len(content)} characters from {test_file.name}")
@@ -230,13 +258,13 @@ class TestRealFileProcessing:
         except Exception as e:
             pytest.fail(f"Complete pipeline test failed for {test_file.name}: {e}")
 
-    def test_file_formats_and_encodings(self, text_extractor, real_recipe_files):
+    def test_file_formats_and_encodings(self, extracted_texts, real_recipe_files):
         """Test that we handle different file formats and encodings properly."""
         encoding_results = {}
         
         for file_path in real_recipe_files:
             try:
-                content = text_extractor.extract(str(file_path))
+                content = _text_of(extracted_texts, file_path)
                 
                 # Check for different types of content
                 if content:
@@ -12,6 +12,7 @@ from core.domain.recipe.models.recipe import Recipe
 from core.application.recipe.processor import RecipeProcessor
 from core.infrastructure.llm.client import LLMClient, InvalidResponseError
 from core.infrastructure.notion.client import NotionClient
+from core.infrastructure.notion.errors import NotionAPIError
 from core.infrastructure.notion.models import NotionRecipe, NotionIngredient, NotionPantryItem
 from core.infrastructure.notion.sync import NotionSync
 from core.utils.logger import get_logger, log_test_result
@@ -74,9 +75,15 @@ async def notion_sync():
 )
 
 @pytest.fixture
-def cleanup_notion():
-    """Create a list to track Notion pages for cleanup."""
-    return []
+def cleanup_notion(notion_sync):
+    """Create a list to track Notion pages, archived together after the test."""
+    pages = []
+    yield pages
+    page_ids = [page["id"] for page in pages if page and "id" in page]
+    try:
+        notion_sync.delete_recipes(page_ids)
+    except NotionAPIError as e:
+        logger.warning(f"Notion cleanup incomplete: {e}")
 
 # Sample recipes that can be reused
 SAMPLE_RECIPES = [
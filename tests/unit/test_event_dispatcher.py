@@ -0,0 +1,26 @@
+from core.domain.events import RecipeCreated, RecipeDeleted
+from core.domain.events.dispatcher import EventDispatcher
+
+def test_register_many_registers_each_pair():
+    dispatcher = EventDispatcher()
+
+    async def on_created(event):
+        pass
+
+    async def on_deleted(event):
+        pass
+
+    dispatcher.register_many([(RecipeCreated, on_created), (RecipeDeleted, on_deleted)])
+
+    assert dispatcher._handlers == {RecipeCreated: [on_created], RecipeDeleted: [on_deleted]}
+
+def test_register_many_skips_duplicate_handlers():
+    dispatcher = EventDispatcher()
+
+    async def handler(event):
+        pass
+
+    dispatcher.register(RecipeCreated, handler)
+    dispatcher.register_many([(RecipeCreated, handler), (RecipeCreated, handler)])
+
+    assert dispatcher._handlers[RecipeCreated] == [handler]
@@ -0,0 +1,135 @@
+"""
+Tests for the Notion sync.
+"""
+
+from core.infrastructure.notion.client import NotionClient
+from core.infrastructure.notion.errors import NotionAPIError
+from core.infrastructure.notion.models import NotionConfig
+from core.infrastructure.notion.sync import NotionSync
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import threading
+
+def _recipes(count):
+    """Create stand-ins with the recipe attributes sync_recipe reads."""
+    return [
+        SimpleNamespace(
+            name = f"Recipe {i}", servings = 2, prep_time = 10, cook_time = 20, 
+            calories = 300, protein = 10, carbs = 30, fat = 5
+)
+        for i in range(count)
+    ]
+
+@pytest.fixture
+
+def notion_client(monkeypatch):
+    """Create a fresh Notion client around a mocked SDK client."""
+    monkeypatch.setattr(NotionClient, "_instance", None)
+    client = NotionClient(NotionConfig(api_key = "test_token", rate_limit = 1000))
+    client.client = MagicMock()
+    client.client.pages.create.return_value = {"id": "page"}
+    return client
+
+@pytest.fixture
+
+def sync():
+    """Create a Notion sync with a mocked client."""
+    return NotionSync(MagicMock(), "recipes_db", "ingredients_db", "pantry_db")
+
+def test_delete_recipes_archives_every_page(sync):
+    """Test that every page is archived."""
+    sync.delete_recipes(["page1", "page2", "page3"])
+
+    archived = {call.kwargs["page_id"] for call in sync.client.client.pages.update.call_args_list}
+    assert archived == {"page1", "page2", "page3"}
+    for call in sync.client.client.pages.update.call_args_list:
+        assert call.kwargs["archived"] is True
+
+def test_delete_recipes_continues_after_failure(sync):
+    """Test that a failed deletion does not stop the others and is reported."""
+    def update(page_id, archived):
+        if page_id == "page2":
+            raise RuntimeError("API error")
+
+    sync.client.client.pages.update.side_effect = update
+
+    with pytest.raises(NotionAPIError) as exc_info:
+        sync.delete_recipes(["page1", "page2", "page3"])
+
+    assert "page2" in str(exc_info.value)
+    assert "page1" not in str(exc_info.value)
+    assert sync.client.client.pages.update.call_count == 3
+
+def test_delete_recipes_without_pages(sync):
+    """Test that no request is made when there is nothing to delete."""
+    sync.delete_recipes([])
+
+    sync.client.client.pages.update.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_sync_all_recipes_async_keeps_order_and_errors(sync, monkeypatch):
+    """Test that results follow the recipe order and failures are reported per recipe."""
+    async def sync_recipe(recipe):
+        if recipe == "bad":
+            raise NotionAPIError("Failed to sync recipe")
+        return f"page_{recipe}"
+
+    monkeypatch.setattr(sync, "sync_recipe", sync_recipe)
+
+    results = await sync.sync_all_recipes_async(["a", "bad", "c"])
+
+    assert [result["page_id"] for result in results] == ["page_a", None, "page_c"]
+    assert [result["success"] for result in results] == [True, False, True]
+    assert results[1]["error"] == "Failed to sync recipe"
+
+def test_sync_all_recipes_awaits_syncs(sync, monkeypatch):
+    """Test that the synchronous wrapper returns the synced pages."""
+    async def sync_recipe(recipe):
+        return f"page_{recipe}"
+
+    monkeypatch.setattr(sync, "sync_recipe", sync_recipe)
+
+    results = sync.sync_all_recipes(["a", "b"])
+
+    assert [result["page_id"] for result in results] == ["page_a", "page_b"]
+
+@pytest.mark.asyncio
+async def test_sync_all_recipes_async_overlaps_requests(notion_client):
+    """Test that the blocking Notion requests of different recipes overlap."""
+    max_concurrency = 3
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+    # Each request waits until a full batch is in flight, so requests that
+    # ran one at a time would time out instead of passing by luck
+    batch = threading.Barrier(max_concurrency, timeout = 5)
+
+    def create(**kwargs):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        try:
+            batch.wait()
+        finally:
+            with lock:
+                in_flight[0] -= 1
+        return {"id": "page"}
+
+    notion_client.client.pages.create.side_effect = create
+    sync = NotionSync(notion_client, "recipes_db", "ingredients_db", "pantry_db")
+
+    results = await sync.sync_all_recipes_async(_recipes(6), max_concurrency = max_concurrency)
+
+    assert all(result["success"] for result in results), results
+    assert notion_client.client.pages.create.call_count == 6
+    assert 1 < max_in_flight[0] <= max_concurrency
+
+def test_sync_all_recipes_twice_on_same_client(notion_client):
+    """Test that each call, running its own event loop, can use the shared client."""
+    sync = NotionSync(notion_client, "recipes_db", "ingredients_db", "pantry_db")
+
+    for _ in range(2):
+        results = sync.sync_all_recipes(_recipes(4))
+        assert all(result["success"] for result in results), results
@@ -0,0 +1,100 @@
+from core.utils.performance import BatchMetrics, PerformanceMonitor, ProcessingMetrics
+
+import json
+import pytest
+
+@pytest.fixture
+def monitor(tmp_path):
+    perf = PerformanceMonitor()
+    perf._metrics_file = tmp_path / "performance_metrics.jsonl"
+    return perf
+
+def test_batch_metrics_allocates_buffers_on_first_record():
+    batch = BatchMetrics(
+        start_time=0.0,
+        end_time=0.0,
+        total_recipes=3,
+        successful_recipes=0,
+        failed_recipes=0,
+        cache_hits=0,
+        llm_extractions=0,
+        rule_based_extractions=0,
+    )
+    assert batch.durations is None
+    assert batch.average_duration == 0.0
+
+    batch.record(ProcessingMetrics(0.0, 1.0, False, 'llm', True))
+    assert len(batch.durations) == 3
+    assert batch.recorded == 1
+
+def test_batch_metrics_records_beyond_total():
+    batch = BatchMetrics(0.0, 0.0, 1, 0, 0, 0, 0, 0)
+    batch.record(ProcessingMetrics(0.0, 1.0, True, 'llm', True))
+    batch.record(ProcessingMetrics(0.0, 3.0, False, 'rule - based', True))
+    assert batch.recorded == 2
+    assert batch.average_duration == pytest.approx(2.0)
+    assert list(batch.cache_hit_flags) == [1, 0]
+    assert list(batch.method_codes) == [0, 1]
+
+def test_end_processing_updates_current_batch(monitor):
+    batch = monitor.start_batch(2)
+    monitor.start_processing("a", "llm").cache_hit = True
+    monitor.end_processing("a", success=True)
+    monitor.start_processing("b", "rule - based")
+    monitor.end_processing("b", success=False, error="boom")
+
+    assert batch.recorded == 2
+    assert batch.successful_recipes == 1
+    assert batch.failed_recipes == 1
+    assert batch.cache_hits == 1
+    assert batch.llm_extractions == 1
+    assert batch.rule_based_extractions == 1
+
+def test_end_batch_debounces_saves(monitor):
+    monitor._save_interval = 3600
+    monitor.start_batch(0)
+    monitor.end_batch("first")
+    monitor._save_executor.shutdown(wait=True)
+    assert monitor._metrics_file.exists()
+
+    monitor._metrics_file.unlink()
+    monitor.start_batch(0)
+    monitor.end_batch("second")
+    assert not monitor._metrics_file.exists()
+
+    monitor.flush()
+    assert monitor._metrics_file.exists()
+
+def test_saved_metrics_are_appended_as_deltas(monitor):
+    monitor._save_interval = 0
+    monitor.start_batch(1)
+    monitor.start_processing("a", "llm")
+    monitor.end_processing("a")
+    monitor.end_batch("first")
+    monitor.start_batch(0)
+    monitor.end_batch("second")
+    monitor._save_executor.shutdown(wait=True)
+
+    lines = monitor._metrics_file.read_text().splitlines()
+    assert len(lines) == 2
+    second = json.loads(lines[1])["delta"]
+    assert second["batches"] == 1
+    assert set(second) <= {"batches", "batch_time"}
+
+    summary = monitor.load_all()
+    assert summary["total_processed"] == 1
+    assert summary["total_batches"] == 2
+    assert summary["success_rate"] == 1.0
+
+def test_metrics_summary_is_cached_until_new_data(monitor):
+    first = monitor.get_metrics_summary()
+    assert monitor.get_metrics_summary() is first
+
+    monitor.start_processing("a", "llm")
+    monitor.end_processing("a")
+    second = monitor.get_metrics_summary()
+    assert second is not first
+    assert second["total_processed"] == 1
+
+    monitor.clear()
+    assert monitor.get_metrics_summary()["total_processed"] == 0
@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the recipe unit tests.
+"""
+
+from core.domain.recipe.extractors.sections import SectionExtractor
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pytest
+
+@pytest.fixture(scope = "session")
+def recipe_text() -> Callable[[str], str]:
+    """Read recipe fixture files, each once per test session."""
+    cache: Dict[str, str] = {}
+
+    def _load(path: str) -> str:
+        if path not in cache:
+            cache[path] = Path(path).read_text(encoding="utf-8")
+        return cache[path]
+
+    return _load
+
+@pytest.fixture(scope = "session")
+def recipe_sections(recipe_text) -> Callable[[str], Dict[str, List[str]]]:
+    """Extract the sections of recipe fixture files, each once per test session.
+
+    For tests that only use the sections as input; the extracted sections
+    are shared, so they must not be modified.
+    """
+    cache: Dict[str, Dict[str, List[str]]] = {}
+
+    def _extract(path: str) -> Dict[str, List[str]]:
+        if path not in cache:
+            cache[path] = SectionExtractor().extract(recipe_text(path))
+        return cache[path]
+
+    return _extract
@@ -1,6 +1,4 @@
 from core.domain.recipe.extractors.ingredients import IngredientExtractor
-from core.domain.recipe.extractors.sections import SectionExtractor
-from pathlib import Path
 
 import pytest
 RECIPE_FILES = [
@@ -21,9 +19,8 @@ RECIPE_FILES = [
 ]
 
 @pytest.mark.parametrize("txt_path", RECIPE_FILES)
-def test_ingredient_extractor(txt_path):
-    content = Path(txt_path).read_text(encoding="utf-8")
-    sections = SectionExtractor().extract(content)
+def test_ingredient_extractor(txt_path, recipe_sections):
+    sections = recipe_sections(txt_path)
     ingredients_text = "\n".join(sections["ingredients"])
     ingredients = IngredientExtractor().extract(ingredients_text)
     assert isinstance(ingredients, list)
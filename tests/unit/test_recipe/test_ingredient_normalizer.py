@@ -1,8 +1,6 @@
 from core.domain.recipe.extractors.ingredients import IngredientExtractor
-from core.domain.recipe.extractors.sections import SectionExtractor
 from core.domain.recipe.models.ingredient import Ingredient
 from core.domain.recipe.normalizers.ingredients import IngredientNormalizer
-from pathlib import Path
 
 import pytest
 RECIPE_FILES = [
@@ -23,9 +21,8 @@ RECIPE_FILES = [
 ]
 
 @pytest.mark.parametrize("txt_path", RECIPE_FILES)
-def test_ingredient_normalizer(txt_path):
-    content = Path(txt_path).read_text(encoding="utf-8")
-    sections = SectionExtractor().extract(content)
+def test_ingredient_normalizer(txt_path, recipe_sections):
+    sections = recipe_sections(txt_path)
     ingredients_text = "\n".join(sections["ingredients"])
     ingredient_dicts = IngredientExtractor().extract(ingredients_text)
     normalized = IngredientNormalizer().normalize(ingredient_dicts)
@@ -1,5 +1,4 @@
 from core.domain.recipe.extractors.metadata import MetadataExtractor
-from pathlib import Path
 
 import pytest
 RECIPE_FILES = [
@@ -20,8 +19,8 @@ RECIPE_FILES = [
 ]
 
 @pytest.mark.parametrize("txt_path", RECIPE_FILES)
-def test_metadata_extractor(txt_path):
-    content = Path(txt_path).read_text(encoding="utf-8")
+def test_metadata_extractor(txt_path, recipe_text):
+    content = recipe_text(txt_path)
     metadata = MetadataExtractor().extract(content)
     assert isinstance(metadata, dict)
     expected_fields = {
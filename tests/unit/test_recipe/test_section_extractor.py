@@ -1,5 +1,4 @@
 from core.domain.recipe.extractors.sections import SectionExtractor
-from pathlib import Path
 import re
 
 import pytest
@@ -21,8 +20,8 @@ RECIPE_FILES = [
 ]
 
 @pytest.mark.parametrize("txt_path", RECIPE_FILES)
-def test_section_extractor_sections(txt_path):
-    content = Path(txt_path).read_text(encoding="utf-8")
+def test_section_extractor_sections(txt_path, recipe_text):
+    content = recipe_text(txt_path)
     sections = SectionExtractor().extract(content)
     assert isinstance(sections, dict)
     assert set(sections.keys()) == {"ingredients", "instructions", "notes"}
@@ -0,0 +1,33 @@
+"""
+Tests for the import optimization script.
+"""
+
+from pathlib import Path
+import ast
+import sys
+
+import pytest
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts" / "development"))
+
+from update_imports import ImportAnalyzer
+
+@pytest.mark.parametrize("separator", [" ", "\x0c", "\x85", "\x1c"])
+
+def test_relative_imports_after_non_newline_line_break(separator):
+    """Test that characters str.splitlines breaks on do not shift import lines."""
+    content = (
+        f'x = "a{separator}b"\n'
+        "from .mod import thing\n"
+        "from . import other\n"
+        "print(x, thing, other)\n"
+)
+    analyzer = ImportAnalyzer(Path("/project/core/pkg/module.py"), Path("/project/core"))
+
+    result = analyzer.optimize_imports(content, ast.parse(content))
+
+    assert result == (
+        f'x = "a{separator}b"\n'
+        "from core.pkg import other\n"
+        "from core.pkg.mod import thing\n"
+        "print(x, thing, other)\n"
+)